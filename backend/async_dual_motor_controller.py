@@ -0,0 +1,288 @@
+"""
+asyncio 기반 듀얼 모터 컨트롤러
+- 명령 생성/우선순위 큐/적응형 폴링/완료 Future 로직은 DualMotorController와 공용
+- 시리얼 I/O만 이벤트 루프에서 처리:
+  - 송신: 전송 태스크 하나 (asyncio.Event로 깨움, 버스 간격 대기는 asyncio.sleep)
+  - 수신: pyserial-asyncio 트랜스포트의 data_received 콜백에서 바로 프레임 파싱
+- 송수신 스레드가 없으므로 상태 값 접근에 스레드 전환/GIL 경합이 없고,
+  블로킹 I/O로 스레드가 멈추는 상황을 감시하던 check_thread_health/force_recovery가 필요 없음
+- move_*/set_force*/stop_*/get_motor2_status/connect/disconnect는 코루틴
+  (wait=True이면 목표 위치 도달까지 기다린 뒤 결과 dict 반환)
+"""
+
+import asyncio
+import time
+
+try:
+    import serial_asyncio
+    serial_asyncio_available = True
+except ImportError:
+    serial_asyncio = None
+    serial_asyncio_available = False
+
+from dual_motor_controller import DualMotorController, MotionFuture
+from motor_command_queue import LANE_MOTION
+from motor_frame_parser import MotorFrameParser, decode_status
+from motor_mode_generators import generate_status_read_command
+
+
+class _MotorBusProtocol(asyncio.Protocol):
+    """시리얼 트랜스포트 수신 콜백 - 완성된 프레임을 컨트롤러로 전달"""
+
+    def __init__(self, controller):
+        self.controller = controller
+        self.parser = MotorFrameParser()
+
+    def data_received(self, data):
+        self.controller.reader_last_activity = time.time()
+        for frame in self.parser.feed(data):
+            self.controller._on_frame(frame)
+
+    def connection_lost(self, exc):
+        self.controller._on_connection_lost(exc)
+
+
+class AsyncDualMotorController(DualMotorController):
+    def __init__(self):
+        super().__init__()
+        self.loop = None
+        self.transport = None
+        self.sender_task = None
+        self._wakeup = None  # asyncio.Event (connect 시 이벤트 루프에서 생성)
+        self._calibration_frames = None  # 버스 간격 보정 중에는 수신 프레임을 이 큐로 전달
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    async def connect(self, port, baudrate, parity, databits, stopbits):
+        if self.is_connected():
+            return "이미 연결되어 있습니다."
+        if not serial_asyncio_available:
+            return "❌ 포트 연결 실패: pyserial-asyncio 모듈을 찾을 수 없습니다"
+
+        try:
+            # 플랫폼에 맞는 포트 이름 가져오기
+            port = self.get_platform_port(port)
+
+            self.loop = asyncio.get_running_loop()
+            self._wakeup = asyncio.Event()
+            self.transport, _ = await serial_asyncio.create_serial_connection(
+                self.loop, lambda: _MotorBusProtocol(self), port,
+                **self._serial_options(baudrate, parity, databits, stopbits)
+            )
+            self.serial = self.transport.serial
+            self.running = True
+            self.transactions.reset()
+            await self._calibrate_sweep_gap_async()
+            self._init_status_commands()
+
+            self.sender_task = self.loop.create_task(self._send_loop())
+            return "✅ 포트 연결 및 듀얼 모터 전송 태스크 시작 성공"
+        except Exception as e:
+            self.close()
+            return f"❌ 포트 연결 실패: {str(e)}"
+
+    async def disconnect(self):
+        if not self.is_connected():
+            return "포트가 이미 닫혀 있습니다."
+        self.close()
+        if self.sender_task:
+            await asyncio.gather(self.sender_task, return_exceptions=True)
+            self.sender_task = None
+        return "🔌 포트 연결 해제 완료"
+
+    def close(self):
+        """즉시 연결 종료 (시그널 핸들러 등 이벤트 루프 밖에서도 호출 가능)"""
+        self.running = False
+        # 명령어 큐 초기화
+        self.clear_queue()
+        self._wake_sender()
+        if self.transport:
+            self.transport.close()
+            self.transport = None
+
+    def _on_frame(self, frame):
+        if self._calibration_frames is not None:
+            self._calibration_frames.put_nowait(bytes(frame))
+        else:
+            self.parse_response(frame)
+
+    def _on_connection_lost(self, exc):
+        if self.running:
+            print(f"[ASYNC_MOTOR] 시리얼 연결 끊김: {exc}")
+        self.running = False
+        self._wake_sender()
+
+    def _wake_sender(self):
+        """전송 태스크를 즉시 깨움 (다른 스레드에서 호출되면 이벤트 루프로 넘겨서 처리)"""
+        if self._wakeup is None:
+            return
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is self.loop:
+            self._wakeup.set()
+        elif self.loop and not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def _write_frame_async(self, data, gap=None):
+        """버스 최소 간격을 asyncio.sleep으로 지킨 뒤 트랜스포트로 전송"""
+        wait = self._frame_delay(gap)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        self.transport.write(data)
+        self.last_write_time = time.perf_counter()
+        return len(data)
+
+    async def _send_loop(self):
+        """DualMotorController.send_loop와 같은 단계를 이벤트 루프 위에서 수행"""
+        print("[TASK] send_loop 시작")
+        while self.running:
+            try:
+                self.sender_last_activity = time.time()
+
+                queued_cmd = self._next_command()
+                if queued_cmd is not None:
+                    bytes_written = await self._write_frame_async(self._command_bytes(queued_cmd))
+                    if self._command_sent(queued_cmd, bytes_written):
+                        await asyncio.sleep(self.command_settle_time)  # 드라이버 처리 시간 보장 (5ms)
+
+                self._check_command_timeout()
+                self._expire_motion_waiters()
+
+                for motor_id, status_cmd in self._due_status_reads():
+                    bytes_written = await self._write_frame_async(status_cmd, gap=self.pipeline_gap)
+                    self._status_read_sent(motor_id, status_cmd, bytes_written)
+
+                wait = self._next_wake_delay()
+                if wait > 0:
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), wait)
+                    except asyncio.TimeoutError:
+                        pass
+                self._wakeup.clear()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[CMD_QUEUE Error] {str(e)}")
+                await asyncio.sleep(0.1)
+        print("[TASK] send_loop 종료")
+
+    async def _calibrate_sweep_gap_async(self, sweeps=3, timeout=0.05):
+        """_calibrate_sweep_gap의 asyncio 버전 (전송 태스크 시작 전, 수신 프레임은 보정 큐로 받음)"""
+        status_cmds = (generate_status_read_command(0x01), generate_status_read_command(0x02))
+        self.sweep_calibrated = False
+        self.pipeline_gap = self.inter_frame_gap
+        self._calibration_frames = asyncio.Queue()
+        try:
+            for gap in self.sweep_gap_candidates:
+                periods = []
+                any_response = False
+                for _ in range(sweeps):
+                    start = time.perf_counter()
+                    self.transport.write(status_cmds[0])
+                    if gap:
+                        await asyncio.sleep(gap)
+                    self.transport.write(status_cmds[1])
+
+                    received = set()
+                    deadline = start + timeout
+                    while len(received) < 2:
+                        remaining = deadline - time.perf_counter()
+                        if remaining <= 0:
+                            break
+                        try:
+                            frame = await asyncio.wait_for(self._calibration_frames.get(), remaining)
+                        except asyncio.TimeoutError:
+                            break
+                        if decode_status(frame) is not None and frame[3] in (0x01, 0x02):
+                            received.add(frame[3])
+                            self.status_frame_size = len(frame)
+                    any_response = any_response or bool(received)
+                    if len(received) < 2:
+                        break
+                    periods.append(time.perf_counter() - start)
+
+                if len(periods) == sweeps:
+                    return self._apply_sweep_calibration(gap, periods)
+                if not any_response:
+                    break
+                await asyncio.sleep(timeout)  # 늦게 도착하는 응답을 버리고 다음 간격 시도
+                while not self._calibration_frames.empty():
+                    self._calibration_frames.get_nowait()
+            print(f"[SWEEP] 버스 간격 보정 실패 - 기본 간격 {self.inter_frame_gap * 1000:.0f}ms 사용")
+            return None
+        finally:
+            self._calibration_frames = None
+
+    def check_thread_health(self):
+        """송수신 스레드 대신 전송 태스크가 살아 있는지 확인"""
+        if self.running and self.sender_task and self.sender_task.done():
+            return True, ["sender_task(종료됨)"]
+        return False, []
+
+    def force_recovery(self):
+        """전송 태스크가 종료된 경우에만 다시 시작 (블로킹 I/O가 없어 stuck 복구는 필요 없음)"""
+        is_stuck, _ = self.check_thread_health()
+        if is_stuck:
+            self.sender_task = self.loop.create_task(self._send_loop())
+        return True
+
+    async def _motion(self, method, *args, return_future=False, wait=False, **kwargs):
+        """동기 큐잉 메서드 호출 - wait=True이면 이동 완료 Future를 기다려 결과 dict 반환"""
+        result = method(self, *args, return_future=return_future or wait, **kwargs)
+        if wait and isinstance(result, MotionFuture):
+            return await asyncio.wrap_future(result)
+        return result
+
+    # Motor 1 (기존 모터) 제어 코루틴
+    async def move_to_position(self, pos: int, mode="position", return_future=False, priority=LANE_MOTION, wait=False):
+        return await self.move_to_position_motor1(pos, mode, return_future, priority, wait)
+
+    async def move_to_position_motor1(self, pos: int, mode="position", return_future=False, priority=LANE_MOTION, wait=False):
+        return await self._motion(DualMotorController.move_to_position_motor1, pos, mode,
+                                  return_future=return_future, wait=wait, priority=priority)
+
+    async def move_with_speed(self, speed: int, position: int, return_future=False, priority=LANE_MOTION, wait=False):
+        return await self.move_with_speed_motor1(speed, position, return_future, priority, wait)
+
+    async def move_with_speed_motor1(self, speed: int, position: int, return_future=False, priority=LANE_MOTION, wait=False):
+        return await self._motion(DualMotorController.move_with_speed_motor1, speed, position,
+                                  return_future=return_future, wait=wait, priority=priority)
+
+    async def set_force(self, force: float):
+        return await self.set_force_motor1(force)
+
+    async def set_force_motor1(self, force: float):
+        return DualMotorController.set_force_motor1(self, force)
+
+    async def move_with_speed_force(self, force: float, speed: int, position: int, return_future=False, priority=LANE_MOTION, wait=False):
+        return await self.move_with_speed_force_motor1(force, speed, position, return_future, priority, wait)
+
+    async def move_with_speed_force_motor1(self, force: float, speed: int, position: int, return_future=False, priority=LANE_MOTION, wait=False):
+        return await self._motion(DualMotorController.move_with_speed_force_motor1, force, speed, position,
+                                  return_future=return_future, wait=wait, priority=priority)
+
+    # Motor 2 제어 코루틴
+    async def move_to_position_motor2(self, pos: int, mode="servo", return_future=False, priority=LANE_MOTION, wait=False):
+        return await self._motion(DualMotorController.move_to_position_motor2, pos, mode,
+                                  return_future=return_future, wait=wait, priority=priority)
+
+    async def move_with_speed_motor2(self, speed: int, position: int, deceleration_enabled=False, deceleration_position=0, deceleration_speed=0, return_future=False, priority=LANE_MOTION, wait=False):
+        return await self._motion(DualMotorController.move_with_speed_motor2, speed, position,
+                                  deceleration_enabled, deceleration_position, deceleration_speed,
+                                  return_future=return_future, wait=wait, priority=priority)
+
+    async def move_with_speed_force_motor2(self, force: float, speed: int, position: int, return_future=False, priority=LANE_MOTION, wait=False):
+        return await self._motion(DualMotorController.move_with_speed_force_motor2, force, speed, position,
+                                  return_future=return_future, wait=wait, priority=priority)
+
+    async def stop_motor(self, motor_id):
+        return DualMotorController.stop_motor(self, motor_id)
+
+    async def stop_all(self):
+        return " / ".join(DualMotorController.stop_motor(self, motor_id) for motor_id in (1, 2))
+
+    async def get_motor2_status(self):
+        return DualMotorController.get_motor2_status(self)
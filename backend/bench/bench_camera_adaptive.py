@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+시청자별 스트림 옵션(quality/scale/fps/kbps) 확인 (가짜 카메라 - bench/fake_camera.py, 960x720@30 MJPEG)
+- 옵션별 전송 FPS, 실제 비트레이트, 프레임 크기, CPU (기본 = pass-through 원본)
+- scale=0.5/0.25는 JPEG 축소 디코딩으로 만든 프레임인지 (전체 디코딩 없음)
+- 느린 클라이언트: 시청자 루프에서 프레임마다 쓰기 지연을 흉내 → 밀린 프레임 대신 최신 프레임으로 건너뛰는지, 품질이 내려가는지
+- 라우트 확인: /video/1?scale=0.5&fps=10, 잘못된 쿼리 400
+
+사용법: python bench/bench_camera_adaptive.py [--seconds 3]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.dirname(__file__))
+
+import cv2
+import numpy as np
+
+import camera_server
+from fake_camera import FakeVideoCapture
+
+camera_server.cv2.VideoCapture = FakeVideoCapture
+
+CASES = [
+    ("기본 (pass-through)", {}),
+    ("quality=60", {"quality": 60}),
+    ("scale=0.5", {"scale": 0.5}),
+    ("scale=0.25, fps=10", {"scale": 0.25, "max_fps": 10}),
+    ("fps=5", {"max_fps": 5}),
+    ("kbps=4000", {"kbps": 4000}),
+    ("kbps=1000, scale=0.5", {"kbps": 1000, "scale": 0.5}),
+]
+
+
+def watch(camera, options, seconds, write_delay=0.0):
+    """시청자 1명이 seconds 동안 스트림을 읽음 (write_delay: 프레임마다 소켓 쓰기 지연 흉내)"""
+    stream = camera_server.generate_frames(camera, "카메라 1", options)
+    sizes = []
+    frames = camera.frames
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+    try:
+        for chunk in stream:
+            sizes.append(len(chunk))
+            if write_delay:
+                time.sleep(write_delay)
+            if time.perf_counter() - start >= seconds:
+                break
+    finally:
+        stream.close()
+    elapsed = time.perf_counter() - start
+    cpu = (time.process_time() - cpu_start) / elapsed * 100
+    return {
+        "fps": len(sizes) / elapsed,
+        "kbps": sum(sizes) * 8 / elapsed / 1000,
+        "size_kb": np.mean(sizes) / 1024 if sizes else 0.0,
+        "skipped": camera.frames - frames - len(sizes),
+        "cpu": cpu,
+        "chunk": chunk if sizes else None,
+    }
+
+
+def frame_shape(chunk):
+    jpeg = chunk[chunk.index(b'\xff\xd8'):-2]
+    return cv2.imdecode(np.frombuffer(jpeg, np.uint8), cv2.IMREAD_COLOR).shape[:2]
+
+
+def check_routes(camera):
+    camera_server.camera_pool.cameras[1] = camera
+    with camera_server.app.test_client() as client:
+        response = client.get('/video/1?scale=0.5&fps=10', buffered=False)
+        chunk = next(iter(response.response))
+        response.close()
+        assert response.status_code == 200 and frame_shape(chunk) == (360, 480), response.status_code
+        for query in ('quality=5', 'scale=0', 'scale=2', 'fps=0', 'kbps=-1'):
+            response = client.get(f'/video/1?{query}')
+            assert response.status_code == 400, (query, response.status_code)
+    camera_server.camera_pool.cameras.clear()
+    print("[확인] /video/1?scale=0.5&fps=10 → 480x360, 범위 밖 quality/scale/fps/kbps → 400")
+
+
+def check_slow_client(camera, seconds):
+    """느린 클라이언트 (쓰기 1장당 120ms ≈ 8fps 회선): 밀린 프레임 대신 최신 프레임, 품질 하락"""
+    adapters = []
+    original = camera_server.StreamAdapter
+
+    class RecordingAdapter(original):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            adapters.append(self)
+
+    camera_server.StreamAdapter = RecordingAdapter
+    try:
+        result = watch(camera, camera_server.StreamOptions(), seconds, write_delay=0.12)
+    finally:
+        camera_server.StreamAdapter = original
+    adapter = adapters[0]
+    assert adapter.congestion_events > 0 and adapter.quality is not None and adapter.quality < 80, vars(adapter)
+    print(f"[확인] 느린 클라이언트 (쓰기 120ms/장): 전송 {result['fps']:.1f}fps, 건너뛴 프레임 {result['skipped']}장 "
+          f"(밀린 프레임 대신 최신 프레임), 소켓 밀림 {adapter.congestion_events}회 → 품질 {adapter.quality}, "
+          f"{result['size_kb']:.0f}KB/장")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    camera = camera_server.CameraBroadcaster(0, "카메라 1")
+    assert camera.start() and camera.passthrough_active
+
+    rows = []
+    for label, values in CASES:
+        options = camera_server.StreamOptions(**values)
+        decodes = camera.decodes
+        result = watch(camera, options, args.seconds)
+        result["decodes"] = camera.decodes - decodes
+        result["shape"] = frame_shape(result["chunk"])
+        rows.append((label, options, result))
+
+    for label, options, result in rows:
+        if options.max_fps:
+            assert result["fps"] <= options.max_fps * 1.1 + 1 / args.seconds, (label, result["fps"])  # 첫 프레임은 0초에 전송
+        if options.kbps:
+            assert result["kbps"] <= options.kbps * 1.15, (label, result["kbps"])
+        if options.scale < 1:
+            assert result["shape"] == (round(720 * options.scale), round(960 * options.scale)), (label, result["shape"])
+
+    check_slow_client(camera, args.seconds)
+    check_routes(camera)
+    camera.stop()
+
+    print(f"가짜 카메라 960x720@{FakeVideoCapture.fps:.0f} MJPEG, 시청자 1명, {args.seconds:.0f}초씩")
+    print(f"{'옵션':<22}{'FPS':>6}{'kbps':>8}{'KB/장':>7}{'크기':>10}{'CPU %':>8}{'디코딩':>7}")
+    for label, options, result in rows:
+        shape = f"{result['shape'][1]}x{result['shape'][0]}"
+        print(f"{label:<22}{result['fps']:>6.1f}{result['kbps']:>8.0f}{result['size_kb']:>7.1f}"
+              f"{shape:>10}{result['cpu']:>8.1f}{result['decodes']:>7}")
+
+
+if __name__ == "__main__":
+    main()
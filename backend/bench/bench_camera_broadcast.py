@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+카메라 스트림 시청자 수별 FPS/CPU 비교 (가짜 카메라 - bench/fake_camera.py, 30fps MJPEG)
+- legacy: 시청자마다 generate_frames가 같은 cap에서 grab/retrieve/imencode (기존 camera_server 방식)
+- shared: CameraBroadcaster 캡처 스레드 1개 + 시청자는 공유 슬롯에서 읽음 (현재 camera_server 방식)
+- CPU는 프로세스 CPU 시간 / 경과 시간 (100% = 코어 1개)
+
+사용법: python bench/bench_camera_broadcast.py [--seconds 3] [--viewers 0,1,2,4]
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.dirname(__file__))
+
+import cv2
+
+import camera_server
+from fake_camera import FakeVideoCapture
+
+camera_server.cv2.VideoCapture = FakeVideoCapture
+
+
+def legacy_generate_frames(cap, stop_event):
+    """기존 generate_frames의 캡처/인코딩 부분 (시청자마다 하나씩 실행)"""
+    while not stop_event.is_set():
+        if not cap.grab():
+            continue
+        success, frame = cap.retrieve()
+        if not success:
+            continue
+        ret, buffer = cv2.imencode('.jpg', frame)
+        if not ret:
+            continue
+        yield (b'--frame\r\n'
+               b'Content-Type: image/jpeg\r\n\r\n' + buffer.tobytes() + b'\r\n')
+
+
+def run_viewers(count, make_stream, seconds):
+    """시청자 count명이 seconds 동안 스트림을 읽음 → (시청자별 평균 FPS, CPU %)"""
+    stop_event = threading.Event()
+    frames = [0] * count
+
+    def viewer(index):
+        stream = make_stream(stop_event)
+        try:
+            for _ in stream:
+                frames[index] += 1
+                if stop_event.is_set():
+                    break
+        finally:
+            stream.close()
+
+    threads = [threading.Thread(target=viewer, args=(index,)) for index in range(count)]
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop_event.set()
+    elapsed = time.perf_counter() - start
+    cpu = (time.process_time() - cpu_start) / elapsed * 100
+    for thread in threads:
+        thread.join()
+    return (sum(frames) / count / elapsed if count else 0.0), cpu
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--viewers", default="0,1,2,4")
+    args = parser.parse_args()
+    viewer_counts = [int(value) for value in args.viewers.split(",")]
+
+    rows = []
+    cap = FakeVideoCapture(0)
+    for count in viewer_counts:
+        fps, cpu = run_viewers(count, lambda stop_event: legacy_generate_frames(cap, stop_event), args.seconds)
+        rows.append(("legacy", count, fps, cpu, None))
+
+    camera = camera_server.CameraBroadcaster(0, "카메라 1", camera_server.CameraSettings(passthrough=False))  # 공유 캡처 효과만 비교 (디코딩/인코딩 포함)
+    assert camera.start()
+    for count in viewer_counts:
+        encodes = camera.encodes
+        frames = camera.frames
+        fps, cpu = run_viewers(count, lambda stop_event: camera_server.generate_frames(camera, "카메라 1"), args.seconds)
+        rows.append(("shared", count, fps, cpu, (camera.encodes - encodes, camera.frames - frames)))
+
+    # /capture도 같은 슬롯의 프레임 사용 (카메라 grab 없음)
+    camera_server.camera_pool.cameras[1] = camera
+    encodes = camera.encodes
+    with camera_server.app.test_client() as client:
+        response = client.get('/capture')
+        assert response.status_code == 200 and response.data[:2] == b'\xff\xd8', response.status_code
+    capture_encodes = camera.encodes - encodes
+    stats = camera.get_stats()
+    camera_server.camera_pool.cameras.clear()
+    camera.stop()
+
+    print(f"가짜 카메라 {FakeVideoCapture.fps:.0f}fps, {args.seconds:.0f}초씩")
+    print(f"{'방식':<8}{'시청자':>6}{'시청자당 FPS':>14}{'CPU %':>9}   인코딩/캡처 프레임")
+    for label, count, fps, cpu, encode_info in rows:
+        encode_text = f"{encode_info[0]}/{encode_info[1]}" if encode_info else "-"
+        print(f"{label:<8}{count:>6}{fps:>14.1f}{cpu:>9.1f}   {encode_text}")
+    print(f"/capture: 슬롯의 최신 프레임 JPEG 반환 (인코딩 {capture_encodes}회, 카메라 직접 읽기 없음), 통계 {stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+/capture_burst 확인 (가짜 카메라 - bench/fake_camera.py, 960x720@30 MJPEG, 스트림 시청자 1명 동시 시청)
+- n=10 연속 프레임: 순번이 빠짐없이 이어지고 단조 시계 시각이 증가하는지, 소요 시간
+- interval=100ms: 고른 프레임 간격
+- after=<seq>: 링 버퍼에 남은 지난 프레임을 대기 없이 반환 (트리거 이전 프레임)
+- format=zip: manifest.json 순번/시각
+- 잘못된 쿼리(after 음수 포함) 400, 프레임을 하나도 못 고르면 multipart/zip 모두 500
+- 버스트를 반복하는 동안 스트림 FPS와 최대 프레임 간격 (버스트가 실시간 스트림을 멈추지 않는지)
+  디코딩 모드(hq 인코딩)에서도 측정 - 프레임별 잠금이라 버스트 인코딩이 스트림 인코딩을 막지 않음
+
+사용법: python bench/bench_camera_burst.py [--seconds 3]
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import threading
+import time
+import zipfile
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.dirname(__file__))
+
+import camera_server
+from fake_camera import FakeVideoCapture
+
+camera_server.cv2.VideoCapture = FakeVideoCapture
+
+FRAME_INTERVAL_MS = 1000 / FakeVideoCapture.fps
+
+
+def parse_multipart(data):
+    """multipart 본문 → [(헤더 dict, JPEG)]"""
+    parts = []
+    for chunk in data.split(b'--frame\r\n')[1:]:
+        head, _, body = chunk.partition(b'\r\n\r\n')
+        headers = dict(line.split(': ', 1) for line in head.decode().split('\r\n'))
+        length = int(headers['Content-Length'])
+        assert body[:2] == b'\xff\xd8' and body[length:length + 2] == b'\r\n'
+        parts.append((headers, body[:length]))
+    return parts
+
+
+def watch_stream(camera, stop_event, gaps):
+    """스트림 시청자 - 받은 프레임 사이 간격(ms)을 gaps에 기록"""
+    stream = camera_server.generate_frames(camera, "카메라 1")
+    last = None
+    try:
+        for _ in stream:
+            now = time.perf_counter()
+            if last is not None:
+                gaps.append((now - last) * 1000)
+            last = now
+            if stop_event.is_set():
+                break
+    finally:
+        stream.close()
+
+
+def stream_during(camera, seconds, action=None):
+    """seconds 동안 스트림 FPS/최대 프레임 간격 측정 (action이 있으면 그동안 반복 실행) → (FPS, 최대 간격 ms, action 횟수)"""
+    stop_event = threading.Event()
+    gaps = []
+    thread = threading.Thread(target=watch_stream, args=(camera, stop_event, gaps))
+    thread.start()
+    time.sleep(0.2)
+    gaps.clear()
+    runs = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        if action:
+            action()
+            runs += 1
+        else:
+            time.sleep(0.05)
+    elapsed = time.perf_counter() - start
+    frames = len(gaps)
+    stop_event.set()
+    thread.join()
+    return frames / elapsed, max(gaps), runs
+
+
+def check_burst(client):
+    start = time.perf_counter()
+    response = client.get('/capture_burst?n=10')
+    data = response.data  # multipart는 본문을 읽는 동안 프레임을 고름
+    elapsed = (time.perf_counter() - start) * 1000
+    assert response.status_code == 200 and response.mimetype == 'multipart/mixed', response.status_code
+    parts = parse_multipart(data)
+    seqs = [int(headers['X-Frame-Seq']) for headers, _ in parts]
+    times = [float(headers['X-Frame-Monotonic']) for headers, _ in parts]
+    assert len(parts) == 10 and seqs == list(range(seqs[0], seqs[0] + 10)), seqs
+    assert all(later > earlier for earlier, later in zip(times, times[1:])), times
+    gaps = [(later - earlier) * 1000 for earlier, later in zip(times, times[1:])]
+    print(f"[확인] n=10: 순번 {seqs[0]}..{seqs[-1]} 연속, 단조 시각 증가 (간격 {min(gaps):.1f}~{max(gaps):.1f}ms), "
+          f"소요 {elapsed:.0f}ms (카메라 {FRAME_INTERVAL_MS * 9:.0f}ms분)")
+
+    response = client.get('/capture_burst?n=5&interval=100')
+    times = [float(headers['X-Frame-Monotonic']) for headers, _ in parse_multipart(response.data)]
+    gaps = [(later - earlier) * 1000 for earlier, later in zip(times, times[1:])]
+    assert len(times) == 5 and min(gaps) >= 100 - FRAME_INTERVAL_MS / 2, gaps
+    print(f"[확인] n=5&interval=100: 프레임 간격 {', '.join(f'{gap:.0f}' for gap in gaps)}ms")
+
+    seq = int(client.get('/capture').headers['X-Frame-Seq'])
+    time.sleep(0.3)
+    start = time.perf_counter()
+    parts = parse_multipart(client.get(f'/capture_burst?n=5&after={seq - 3}&mode=latest').data)
+    elapsed = (time.perf_counter() - start) * 1000
+    seqs = [int(headers['X-Frame-Seq']) for headers, _ in parts]
+    assert seqs == list(range(seq - 2, seq + 3)), (seq, seqs)
+    print(f"[확인] after={seq - 3}: 링 버퍼의 지난 프레임 {seqs} 반환 ({elapsed:.1f}ms, 대기 없음)")
+
+    response = client.get('/capture_burst?n=4&format=zip')
+    assert response.status_code == 200 and response.headers['X-Burst-Count'] == '4'
+    with zipfile.ZipFile(io.BytesIO(response.data)) as archive:
+        manifest = json.loads(archive.read('manifest.json'))
+        assert all(archive.read(frame['file'])[:2] == b'\xff\xd8' for frame in manifest['frames'])
+    seqs = [frame['seq'] for frame in manifest['frames']]
+    assert seqs == list(range(seqs[0], seqs[0] + 4)), seqs
+    print(f"[확인] format=zip: {len(response.data) / 1024:.0f}KB, manifest 순번 {seqs}")
+
+    for query in ('n=0', 'n=1000', 'interval=-1', 'after=-1', 'format=tar', 'mode=raw'):
+        assert client.get(f'/capture_burst?{query}').status_code == 400, query
+    assert client.get('/capture_burst/9').status_code == 404
+    # 링에 없는 순번 (대기 타임아웃) → 프레임 0장 - multipart도 zip과 같은 오류
+    seq = int(client.get('/capture').headers['X-Frame-Seq'])
+    for output in ('multipart', 'zip'):
+        response = client.get(f'/capture_burst?after={seq + 1000}&format={output}')
+        assert response.status_code == 500 and 'error' in response.get_json(), (output, response.status_code)
+    print("[확인] 잘못된 n/interval/after/format/mode → 400, 없는 카메라 → 404, 프레임 0장 → 500 (multipart/zip)")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    rows = []
+    for passthrough in (True, False):
+        camera = camera_server.CameraBroadcaster(0, "카메라 1", camera_server.CameraSettings(passthrough=passthrough))
+        assert camera.start()
+        camera_server.camera_pool.cameras[1] = camera
+        with camera_server.app.test_client() as client:
+            if passthrough:
+                check_burst(client)
+            mode = "pass-through" if passthrough else "디코딩 (hq 인코딩)"
+            rows.append((mode, "스트림만") + stream_during(camera, args.seconds))
+            rows.append((mode, "버스트 n=10 반복") + stream_during(
+                camera, args.seconds, lambda: client.get('/capture_burst?n=10').data))
+        camera_server.camera_pool.cameras.clear()
+        camera.stop()
+
+    print(f"가짜 카메라 960x720@{FakeVideoCapture.fps:.0f} MJPEG, 스트림 시청자 1명, {args.seconds:.0f}초씩")
+    print(f"{'모드':<20}{'조건':<18}{'스트림 FPS':>10}{'최대 간격 ms':>13}{'버스트':>7}")
+    for mode, label, fps, max_gap, runs in rows:
+        print(f"{mode:<20}{label:<18}{fps:>10.1f}{max_gap:>13.1f}{runs:>7}")
+        assert fps > FakeVideoCapture.fps * 0.9, (mode, label, fps)
+
+
+if __name__ == "__main__":
+    main()
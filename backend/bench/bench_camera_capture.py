@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+/capture 지연/인코딩 횟수 비교 (가짜 카메라 - bench/fake_camera.py, 960x720@30 MJPEG, 스트림 시청자 1명 동시 시청)
+- legacy: 스트림과 같은 cap에서 cap.read() + imencode(품질 90) (기존 camera_server 방식 - 다음 프레임까지 대기)
+- hq: /capture (캡처 스레드의 최신 프레임을 capture_quality로 인코딩, 같은 프레임은 한 번만)
+- latest: /capture?mode=latest (pass-through MJPEG 또는 스트림이 인코딩해 둔 JPEG 그대로)
+- 확인: X-Frame-Seq/X-Frame-Timestamp/X-Frame-Age-Ms 헤더, after=<seq> 연속 캡처는 매번 새 프레임,
+  /capture를 연속 호출해도 스트림 FPS 유지, 디코딩 모드의 latest는 스트림 인코딩 결과 재사용
+
+사용법: python bench/bench_camera_capture.py [--requests 100]
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.dirname(__file__))
+
+import cv2
+import numpy as np
+
+import camera_server
+from fake_camera import FakeVideoCapture
+
+camera_server.cv2.VideoCapture = FakeVideoCapture
+
+
+def latency_stats(samples):
+    values = np.array(samples) * 1000
+    return values.mean(), np.percentile(values, 95)
+
+
+def start_viewer(camera):
+    """스트림 시청자 1명 (백그라운드) → (stop_event, 받은 프레임 수 목록, thread)"""
+    stop_event = threading.Event()
+    frames = [0]
+
+    def viewer():
+        stream = camera_server.generate_frames(camera, "카메라 1")
+        try:
+            for _ in stream:
+                frames[0] += 1
+                if stop_event.is_set():
+                    break
+        finally:
+            stream.close()
+
+    thread = threading.Thread(target=viewer)
+    thread.start()
+    return stop_event, frames, thread
+
+
+def measure_legacy(requests):
+    """기존 방식: 스트림 스레드와 같은 cap에서 read() → imencode"""
+    cap = FakeVideoCapture(0)
+    stop_event = threading.Event()
+
+    def legacy_stream():
+        while not stop_event.is_set():
+            if cap.grab():
+                cap.retrieve()
+
+    thread = threading.Thread(target=legacy_stream)
+    thread.start()
+    samples = []
+    for _ in range(requests):
+        request_start = time.perf_counter()
+        ret, frame = cap.read()
+        cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 90])
+        samples.append(time.perf_counter() - request_start)
+    stop_event.set()
+    thread.join()
+    return latency_stats(samples)
+
+
+def measure_route(client, camera, path, requests):
+    """path를 연속 요청 → (평균 ms, p95 ms, 인코딩 횟수, 디코딩 횟수, 마지막 응답)"""
+    encodes, decodes = camera.encodes, camera.decodes
+    samples = []
+    for _ in range(requests):
+        request_start = time.perf_counter()
+        response = client.get(path)
+        samples.append(time.perf_counter() - request_start)
+        assert response.status_code == 200 and response.data[:2] == b'\xff\xd8', (path, response.status_code)
+    return latency_stats(samples) + (camera.encodes - encodes, camera.decodes - decodes, response)
+
+
+def check_headers_and_after(client):
+    response = client.get('/capture')
+    seq = int(response.headers['X-Frame-Seq'])
+    timestamp = float(response.headers['X-Frame-Timestamp'])
+    assert abs(time.time() - timestamp) < 1 and float(response.headers['X-Frame-Age-Ms']) < 100, response.headers
+    seqs = []
+    start = time.perf_counter()
+    for _ in range(10):
+        response = client.get(f'/capture?mode=latest&after={seq}')
+        seq = int(response.headers['X-Frame-Seq'])
+        seqs.append(seq)
+    elapsed = time.perf_counter() - start
+    assert all(later > earlier for earlier, later in zip(seqs, seqs[1:])), seqs
+    assert client.get('/capture?mode=raw').status_code == 400
+    assert client.get('/capture?quality=200').status_code == 400
+    print(f"[확인] 헤더 X-Frame-Seq/Timestamp/Age-Ms, after=<seq> 연속 캡처 10장 → 순번 {seqs[0]}..{seqs[-1]} "
+          f"(매번 새 프레임, {10 / elapsed:.1f}장/초), 잘못된 mode/quality → 400")
+
+
+def check_decode_mode_latest(requests):
+    """디코딩 모드: 스트림 시청자가 인코딩해 둔 JPEG를 latest로 재사용 (추가 인코딩 없음)"""
+    camera = camera_server.CameraBroadcaster(0, "카메라 1", camera_server.CameraSettings(passthrough=False))
+    assert camera.start()
+    camera_server.camera_pool.cameras[1] = camera
+    stop_event, frames, thread = start_viewer(camera)
+    time.sleep(0.3)
+    with camera_server.app.test_client() as client:
+        frames_before = camera.frames
+        mean, p95, encodes, decodes, response = measure_route(client, camera, '/capture?mode=latest', requests)
+        published = camera.frames - frames_before
+        age_ms = float(response.headers['X-Frame-Age-Ms'])
+    stop_event.set()
+    thread.join()
+    camera_server.camera_pool.cameras.clear()
+    camera.stop()
+    # 인코딩은 스트림 시청자 몫(프레임당 1회)뿐 - /capture가 추가로 인코딩하지 않음
+    assert encodes <= published, (encodes, published)
+    print(f"[확인] 디코딩 모드 latest: 평균 {mean:.2f}ms, /capture {requests}회 동안 인코딩 {encodes}회 = 스트림 몫 "
+          f"(게시 프레임 {published}장, /capture 추가 인코딩 없음, 프레임 나이 {age_ms:.0f}ms)")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=100)
+    args = parser.parse_args()
+
+    legacy = measure_legacy(args.requests)
+
+    camera = camera_server.CameraBroadcaster(0, "카메라 1")
+    assert camera.start() and camera.passthrough_active
+    camera_server.camera_pool.cameras[1] = camera
+    stop_event, frames, thread = start_viewer(camera)
+    time.sleep(0.3)
+    rows = []
+    with camera_server.app.test_client() as client:
+        stream_start, time_start = frames[0], time.perf_counter()
+        for label, path in (("hq", '/capture'), ("latest", '/capture?mode=latest')):
+            rows.append((label,) + measure_route(client, camera, path, args.requests)[:4])
+        while time.perf_counter() - time_start < 1.0:  # 스트림 FPS는 최소 1초 동안 측정
+            client.get('/capture')
+        stream_fps = (frames[0] - stream_start) / (time.perf_counter() - time_start)
+        check_headers_and_after(client)
+    stop_event.set()
+    thread.join()
+    camera_server.camera_pool.cameras.clear()
+    camera.stop()
+    check_decode_mode_latest(args.requests)
+
+    print(f"가짜 카메라 960x720@{FakeVideoCapture.fps:.0f} MJPEG, 스트림 시청자 1명 동시, /capture {args.requests}회 연속")
+    print(f"{'방식':<8}{'평균 ms':>9}{'p95 ms':>9}   인코딩/디코딩")
+    print(f"{'legacy':<8}{legacy[0]:>9.2f}{legacy[1]:>9.2f}   {args.requests}/{args.requests}")
+    for label, mean, p95, encodes, decodes in rows:
+        print(f"{label:<8}{mean:>9.2f}{p95:>9.2f}   {encodes}/{decodes}")
+    print(f"/capture 연속 호출 중 스트림 {stream_fps:.1f}fps")
+    assert stream_fps > FakeVideoCapture.fps * 0.9, stream_fps
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+MJPEG 스트림 전송 간격/최신 프레임 우선 확인 (가짜 카메라 - bench/fake_camera.py, 960x720@30 MJPEG)
+- 목표 FPS: fps=5/10/15/20/30 요청 시 실제 전송 FPS (마감 시각 기준이라 30fps 카메라에서 20fps도 맞춤)
+- 느린 클라이언트: 프레임마다 쓰기 지연(30/60/150ms)을 흉내 → 보낸 프레임의 나이(캡처 → 전송)가 쌓이지 않는지,
+  dropped(쓰기 중 지나간 프레임)/skipped/late 카운터
+- 카운터 합: sent + dropped + skipped = 스트림이 지켜본 카메라 프레임 수
+- /stats의 clients에 시청자별 카운터 표시
+
+사용법: python bench/bench_camera_pacing.py [--seconds 3]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.dirname(__file__))
+
+import camera_server
+from fake_camera import FakeVideoCapture
+
+camera_server.cv2.VideoCapture = FakeVideoCapture
+
+TARGET_FPS = [5, 10, 15, 20, 30]
+WRITE_DELAYS = [0.03, 0.06, 0.15]
+
+
+def watch(camera, options, seconds, write_delay=0.0):
+    """시청자 1명이 seconds 동안 스트림을 읽음 → 스트림 종료 직전의 시청자 통계"""
+    stream = camera_server.generate_frames(camera, "카메라 1", options, "bench")
+    first_seq = None
+    stats = None
+    start = time.perf_counter()
+    try:
+        for _ in stream:
+            client = camera._clients[-1]
+            if first_seq is None:
+                first_seq = client.last_seq
+            if write_delay:
+                time.sleep(write_delay)
+            if time.perf_counter() - start >= seconds:
+                stats = client.get_stats()
+                stats["seen"] = client.last_seq - first_seq  # 지금 보내는 중인 프레임은 아직 sent에 없음
+                break
+    finally:
+        stream.close()
+    assert camera.viewers == 0
+    return stats
+
+
+def check_stats_route(camera):
+    camera_server.camera_pool.cameras[1] = camera
+    with camera_server.app.test_client() as client:
+        response = client.get('/video/1?fps=10', buffered=False)
+        chunks = iter(response.response)
+        for _ in range(3):
+            next(chunks)
+        clients = client.get('/stats').get_json()["1"]["clients"]
+        response.close()
+        assert len(clients) == 1 and clients[0]["sent"] >= 2 and clients[0]["options"]["max_fps"] == 10, clients
+        assert client.get('/stats').get_json()["1"]["clients"] == []
+    camera_server.camera_pool.cameras.clear()
+    print(f"[확인] /stats clients: {clients[0]}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    camera = camera_server.CameraBroadcaster(0, "카메라 1")
+    assert camera.start()
+
+    print(f"가짜 카메라 960x720@{FakeVideoCapture.fps:.0f} MJPEG (pass-through), 시청자 1명, {args.seconds:.0f}초씩")
+    print(f"{'조건':<16}{'전송 FPS':>9}{'나이 ms':>9}{'sent':>6}{'dropped':>9}{'skipped':>9}{'late':>6}{'밀림':>6}")
+
+    def show(label, stats):
+        print(f"{label:<16}{stats['fps']:>9.1f}{stats['age_ms']:>9.1f}{stats['sent']:>6}{stats['dropped']:>9}"
+              f"{stats['skipped']:>9}{stats['late']:>6}{stats['congestion']:>6}")
+        assert stats["sent"] + stats["dropped"] + stats["skipped"] == stats["seen"], stats
+
+    for fps in TARGET_FPS:
+        stats = watch(camera, camera_server.StreamOptions(max_fps=fps), args.seconds)
+        show(f"fps={fps}", stats)
+        assert abs(stats["fps"] - fps) <= fps * 0.1 + 0.5, (fps, stats)
+
+    for delay in WRITE_DELAYS:
+        stats = watch(camera, camera_server.StreamOptions(), args.seconds, write_delay=delay)
+        show(f"쓰기 {delay * 1000:.0f}ms/장", stats)
+        # 보낸 프레임은 항상 최신 프레임 → 나이가 쓰기 지연만큼 쌓이지 않음 (카메라 프레임 1장 간격 이내)
+        assert stats["age_ms"] < 1000 / FakeVideoCapture.fps + 10, stats
+        if delay > 1 / FakeVideoCapture.fps:
+            assert stats["dropped"] > 0, stats
+
+    check_stats_route(camera)
+    camera.stop()
+
+
+if __name__ == "__main__":
+    main()
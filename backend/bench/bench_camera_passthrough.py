@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+MJPEG pass-through vs 디코딩/재인코딩 스트림 CPU 비교 (가짜 카메라 - bench/fake_camera.py, 960x720@30 MJPEG)
+- decode: retrieve()에서 BGR 디코딩 → 프레임마다 imencode (passthrough=False)
+- passthrough: CAP_PROP_CONVERT_RGB=0으로 받은 카메라 MJPEG를 그대로 전송 (디코딩 없음)
+- 확인: DHT 없는 MJPEG에 표준 Huffman 테이블 삽입, /capture는 픽셀 디코딩 후 인코딩,
+  MJPEG 버퍼를 못 받는 백엔드면 디코딩 모드로 자동 전환
+- CPU는 프로세스 CPU 시간 / 경과 시간 (100% = 코어 1개)
+
+사용법: python bench/bench_camera_passthrough.py [--seconds 3] [--viewers 0,1,2]
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.dirname(__file__))
+
+import cv2
+import numpy as np
+
+import camera_server
+from bench_camera_broadcast import run_viewers
+from fake_camera import FakeVideoCapture
+
+camera_server.cv2.VideoCapture = FakeVideoCapture
+
+
+def measure(passthrough, viewer_counts, seconds):
+    camera = camera_server.CameraBroadcaster(0, "카메라 1", camera_server.CameraSettings(passthrough=passthrough))
+    assert camera.start()
+    assert camera.passthrough_active == passthrough
+    rows = []
+    for count in viewer_counts:
+        frames, encodes, decodes = camera.frames, camera.encodes, camera.decodes
+        fps, cpu = run_viewers(count, lambda stop_event: camera_server.generate_frames(camera, "카메라 1"), seconds)
+        rows.append((count, fps, cpu, camera.frames - frames, camera.encodes - encodes, camera.decodes - decodes))
+    camera.stop()
+    return rows
+
+
+def check_stream_and_capture():
+    """DHT 없는 카메라 MJPEG → 스트림 프레임에 표준 테이블 삽입, /capture는 디코딩 후 품질 90 JPEG"""
+    FakeVideoCapture.strip_huffman = True
+    camera = camera_server.CameraBroadcaster(0, "카메라 1")
+    assert camera.start() and camera.passthrough_active
+    stream = camera_server.generate_frames(camera, "카메라 1")
+    chunk = next(stream)
+    stream.close()
+    jpeg = chunk[chunk.index(b'\xff\xd8'):-2]
+    assert b'\xff\xc4' in jpeg[:jpeg.index(b'\xff\xda')], "DHT 없음"
+    assert cv2.imdecode(np.frombuffer(jpeg, np.uint8), cv2.IMREAD_COLOR).shape == (720, 960, 3)
+    assert camera.decodes == 0 and camera.encodes == 0
+
+    camera_server.camera_pool.cameras[1] = camera
+    with camera_server.app.test_client() as client:
+        response = client.get('/capture')
+    camera_server.camera_pool.cameras.clear()
+    assert response.status_code == 200 and response.data[:2] == b'\xff\xd8'
+    print(f"[확인] DHT 없는 MJPEG → 표준 Huffman 테이블 삽입 후 전송 (디코딩 0회), "
+          f"/capture → 디코딩 {camera.decodes}회 + 인코딩 {camera.encodes}회")
+    camera.stop()
+    FakeVideoCapture.strip_huffman = False
+
+    FakeVideoCapture.raw_supported = False
+    camera = camera_server.CameraBroadcaster(0, "카메라 1")
+    assert camera.start() and not camera.passthrough_active
+    camera.stop()
+    FakeVideoCapture.raw_supported = True
+    print("[확인] MJPEG 버퍼를 지원하지 않는 백엔드 → 디코딩 모드로 동작")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--viewers", default="0,1,2")
+    args = parser.parse_args()
+    viewer_counts = [int(value) for value in args.viewers.split(",")]
+
+    results = {
+        "decode": measure(False, viewer_counts, args.seconds),
+        "passthrough": measure(True, viewer_counts, args.seconds),
+    }
+    check_stream_and_capture()
+
+    print(f"가짜 카메라 960x720@{FakeVideoCapture.fps:.0f} MJPEG, {args.seconds:.0f}초씩")
+    print(f"{'방식':<12}{'시청자':>6}{'시청자당 FPS':>14}{'CPU %':>9}   캡처/인코딩/디코딩")
+    for label, rows in results.items():
+        for count, fps, cpu, frames, encodes, decodes in rows:
+            print(f"{label:<12}{count:>6}{fps:>14.1f}{cpu:>9.1f}   {frames}/{encodes}/{decodes}")
+    decode_cpu = results["decode"][viewer_counts.index(1)][2] if 1 in viewer_counts else None
+    pass_cpu = results["passthrough"][viewer_counts.index(1)][2] if 1 in viewer_counts else None
+    if decode_cpu and pass_cpu:
+        print(f"스트림 1개 CPU: {decode_cpu:.1f}% → {pass_cpu:.1f}% ({decode_cpu / max(pass_cpu, 0.1):.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+CameraPool 카메라 수별 FPS/CPU 확인 (가짜 카메라 - bench/fake_camera.py, 960x720@30 MJPEG)
+- 카메라 N대(1, 2, 4)를 풀로 열고 카메라마다 시청자 1명 → 카메라당 FPS와 전체 CPU (카메라 수에 비례하는지)
+- 라우트 확인: /video/<id>, /capture/<id>, 기존 /video·/video2·/capture2 별칭, 없는 ID 404, /stats
+- --decode면 pass-through 없이 디코딩/재인코딩 모드로 측정 (카메라당 CPU가 잘 보임)
+
+사용법: python bench/bench_camera_pool.py [--seconds 3] [--counts 1,2,4] [--decode]
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.dirname(__file__))
+
+import camera_server
+from fake_camera import FakeVideoCapture
+
+camera_server.cv2.VideoCapture = FakeVideoCapture
+
+
+def watch_all(pool, seconds):
+    """카메라마다 시청자 1명이 seconds 동안 스트림을 읽음 → (카메라별 FPS 목록, CPU %)"""
+    stop_event = threading.Event()
+    camera_ids = list(pool.cameras)
+    frames = dict.fromkeys(camera_ids, 0)
+
+    def viewer(camera_id):
+        stream = camera_server.generate_frames(pool.get(camera_id), f"카메라 {camera_id}")
+        try:
+            for _ in stream:
+                frames[camera_id] += 1
+                if stop_event.is_set():
+                    break
+        finally:
+            stream.close()
+
+    threads = [threading.Thread(target=viewer, args=(camera_id,)) for camera_id in camera_ids]
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop_event.set()
+    elapsed = time.perf_counter() - start
+    cpu = (time.process_time() - cpu_start) / elapsed * 100
+    for thread in threads:
+        thread.join()
+    return [frames[camera_id] / elapsed for camera_id in camera_ids], cpu
+
+
+def first_stream_frame(client, path):
+    response = client.get(path, buffered=False)
+    if response.status_code != 200:
+        return response.status_code, None
+    chunks = response.response
+    chunk = next(iter(chunks))
+    response.close()
+    return response.status_code, chunk
+
+
+def check_routes(pool):
+    with camera_server.app.test_client() as client:
+        for path in ('/video/3', '/video', '/video2'):
+            status, chunk = first_stream_frame(client, path)
+            assert status == 200 and chunk.startswith(b'--frame') and b'\xff\xd8' in chunk, (path, status)
+        for path in ('/capture/3', '/capture', '/capture2'):
+            response = client.get(path)
+            assert response.status_code == 200 and response.data[:2] == b'\xff\xd8', (path, response.status_code)
+        assert client.get('/video/9').status_code == 404
+        assert client.get('/capture/9').status_code == 404
+        stats = client.get('/stats').get_json()
+        assert sorted(stats) == [str(camera_id) for camera_id in pool.cameras], stats
+    print(f"[확인] /video/<id>, /capture/<id>, /video·/video2·/capture·/capture2 별칭, 없는 ID 404, /stats 카메라 {len(stats)}대")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--counts", default="1,2,4")
+    parser.add_argument("--decode", action="store_true", help="pass-through 없이 디코딩/재인코딩")
+    args = parser.parse_args()
+    counts = [int(value) for value in args.counts.split(",")]
+    settings = camera_server.CameraSettings(passthrough=not args.decode)
+
+    rows = []
+    for count in counts:
+        pool = camera_server.camera_pool
+        pool.start(list(range(count)), settings)
+        assert all(pool.get(camera_id) is not None for camera_id in pool.cameras)
+        fps_list, cpu = watch_all(pool, args.seconds)
+        rows.append((count, min(fps_list), cpu))
+        if count >= 3:
+            check_routes(pool)
+        pool.stop()
+
+    mode = "디코딩/재인코딩" if args.decode else "pass-through"
+    print(f"가짜 카메라 960x720@{FakeVideoCapture.fps:.0f} MJPEG ({mode}), 카메라마다 시청자 1명, {args.seconds:.0f}초씩")
+    print(f"{'카메라':>6}{'최소 FPS':>10}{'CPU %':>9}{'카메라당 CPU %':>16}")
+    for count, fps, cpu in rows:
+        print(f"{count:>6}{fps:>10.1f}{cpu:>9.1f}{cpu / count:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+모터 명령 프레임 생성 마이크로 벤치마크
+- 기존 방식(리스트 조립 + 연결 + sum 체크섬)과 현재 방식(struct.Struct 한 번 pack + 필드 기반 체크섬 + LRU 캐시)의 초당 프레임 생성 수 비교
+- 현재 방식은 캐시 미스(매번 다른 값)와 캐시 적중(실제 운용처럼 같은 목표 반복) 두 경우를 측정
+
+사용법: python bench/bench_command_frames.py [--frames 500000] [--distinct 64]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import motor_mode_generators as generators
+
+
+def legacy_mode_command(mode_code, speed, position, force, frame_length=0x0D, motor_id=0x01):
+    """기존 _generate_mode_command 재현"""
+    header = [0x55, 0xAA]
+    command_type = 0x32
+    payload = (
+        [0x25, 0x00] + [mode_code, 0x00] + [0x00, 0x00] +
+        [force & 0xFF, (force >> 8) & 0xFF] +
+        [speed & 0xFF, (speed >> 8) & 0xFF] +
+        [position & 0xFF, (position >> 8) & 0xFF]
+    )
+    checksum = (frame_length + motor_id + command_type + sum(payload)) & 0xFF
+    return bytes(header + [frame_length, motor_id, command_type] + payload + [checksum])
+
+
+def make_args(count, distinct, seed=1234):
+    """(mode, speed, position, force, motor_id) 목록 생성 - distinct개의 조합을 반복"""
+    rng = random.Random(seed)
+    pool = [
+        (rng.choice((0x00, 0x01, 0x02, 0x05)), rng.randrange(0, 5000), rng.randrange(0, 16000),
+         rng.randrange(0, 2000), rng.choice((1, 2)))
+        for _ in range(distinct)
+    ]
+    return [pool[i % distinct] for i in range(count)]
+
+
+def run(label, func, args_list):
+    start = time.perf_counter()
+    for mode, speed, position, force, motor_id in args_list:
+        func(mode, speed, position, force, motor_id=motor_id)
+    elapsed = time.perf_counter() - start
+    count = len(args_list)
+    print(f"[BENCH] {label:<16} {count:,} frames  {elapsed:.2f}s  "
+          f"{count / elapsed:,.0f} frames/s  {elapsed / count * 1e6:.2f} us/frame")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='모터 명령 프레임 생성 마이크로 벤치마크')
+    arg_parser.add_argument('--frames', type=int, default=500_000, help='측정 프레임 수')
+    arg_parser.add_argument('--distinct', type=int, default=64, help='캐시 적중 측정 시 반복되는 서로 다른 명령 조합 수')
+    args = arg_parser.parse_args()
+
+    unique_args = make_args(args.frames, args.frames)
+    repeated_args = make_args(args.frames, args.distinct)
+
+    # 같은 입력에 대해 기존 방식과 바이트 단위로 동일한지 먼저 확인
+    for mode, speed, position, force, motor_id in unique_args[:10_000]:
+        assert legacy_mode_command(mode, speed, position, force, motor_id=motor_id) == \
+            generators._generate_mode_command(mode, speed, position, force, motor_id=motor_id)
+
+    run("legacy", legacy_mode_command, unique_args)
+    generators._encode_mode_frame.cache_clear()
+    run("struct (miss)", generators._generate_mode_command, unique_args)
+    generators._encode_mode_frame.cache_clear()
+    run("struct (cached)", generators._generate_mode_command, repeated_args)
+    print(f"[BENCH] cache: {generators.get_frame_cache_info()}")
+
+    start = time.perf_counter()
+    for i in range(args.frames):
+        generators.generate_status_read_command(motor_id=1 + (i & 1))
+    elapsed = time.perf_counter() - start
+    print(f"[BENCH] status read      {args.frames:,} frames  {elapsed:.2f}s  {args.frames / elapsed:,.0f} frames/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+EEPROM 레이아웃 코덱 검증 + 인코딩/디코딩 속도 측정 (하드웨어 불필요)
+- fuzz 1: 임의 13바이트 → unpack → pack 결과가 원래 바이트와 같은지 (모든 변형)
+- fuzz 2: 임의 쓰기 값 → encode_values/pack → unpack/decode_values 왕복, 기존 바이트별 인코딩 결과와 비교
+- fuzz 3: 엔디안이 섞인 가상 레이아웃 (struct 바이트 순서와 다른 필드 변환 경로 확인)
+- 속도: 레이아웃 코덱 vs 기존 방식(필드별 시프트/마스크로 바이트 조립, 필드별 인덱싱으로 해석)
+
+사용법: python bench/bench_eeprom_layout.py [--fuzz 20000] [--iterations 200000] [--seed 1]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from eeprom_layout import EEPROM_VARIANTS, EepromField, EepromLayout, get_eeprom_layout
+
+
+def legacy_encode(record, values):
+    """레이아웃 도입 전 write_eeprom_mtr20의 바이트별 인코딩 (None 필드는 기존 바이트 유지)"""
+    record = bytearray(record)
+    record[0] = values["tipType"] & 0xFF
+    record[1] = (values["shotCount"] >> 8) & 0xFF
+    record[2] = values["shotCount"] & 0xFF
+    if values["inspectorCode"] is not None:
+        record[5] = (ord(values["inspectorCode"][0]) if values["inspectorCode"] else 0x41) & 0xFF
+    if values["judgeResult"] is not None:
+        record[6] = 0x01 if values["judgeResult"] == "PASS" else 0x00
+    if values["dailySerial"] is not None:
+        record[7] = (values["dailySerial"] >> 8) & 0xFF
+        record[8] = values["dailySerial"] & 0xFF
+    record[9] = (values["year"] - 2000) & 0xFF
+    record[10] = values["month"] & 0xFF
+    record[11] = values["day"] & 0xFF
+    record[12] = values["makerCode"] & 0xFF
+    return bytes(record)
+
+
+def legacy_decode(record):
+    """레이아웃 도입 전 read_eeprom_mtr20의 필드별 해석"""
+    inspector_code = record[5]
+    judge_result = record[6]
+    return {
+        "tipType": record[0],
+        "shotCount": (record[1] << 8) | record[2],
+        "year": 2000 + record[9],
+        "month": record[10],
+        "day": record[11],
+        "makerCode": record[12],
+        "inspectorCode": chr(inspector_code) if 32 <= inspector_code <= 126 else 'A',
+        "judgeResult": 'PASS' if judge_result == 1 else 'NG' if judge_result == 0 else 'UNKNOWN',
+        "dailySerial": (record[7] << 8) | record[8],
+    }
+
+
+def layout_encode(layout, record, values):
+    buffer = bytearray(record)
+    layout.encode_into(buffer, 0, values)
+    return bytes(buffer)
+
+
+def layout_encode_fields(layout, record, values):
+    """원시 필드 dict 경로 (write_record_diff와 같은 순서)"""
+    fields = layout.unpack(record)
+    fields.update(layout.encode_values(values))
+    return layout.pack(fields)
+
+
+def layout_decode(layout, record):
+    return layout.decode(record)
+
+
+def random_values(rng):
+    return {
+        "tipType": rng.randrange(0, 0x200),          # 범위 밖 값도 하위 바이트만 쓰는지 확인
+        "shotCount": rng.randrange(0, 0x20000),
+        "year": rng.randrange(2000, 2300),
+        "month": rng.randrange(0, 0x100),
+        "day": rng.randrange(0, 0x100),
+        "makerCode": rng.randrange(0, 0x200),
+        "inspectorCode": rng.choice([None, "", chr(rng.randrange(32, 127)) + "X"]),
+        "judgeResult": rng.choice([None, "PASS", "NG"]),
+        "dailySerial": rng.choice([None, rng.randrange(0, 0x20000)]),
+    }
+
+
+def fuzz(count, rng):
+    for layout in EEPROM_VARIANTS.values():
+        for _ in range(count):
+            record = bytes(rng.getrandbits(8) for _ in range(layout.size))
+            assert layout.pack(layout.unpack(record)) == record, (layout.name, record.hex())
+            assert layout_decode(layout, record) == legacy_decode(record), (layout.name, record.hex())
+
+            values = random_values(rng)
+            encoded = layout_encode(layout, record, values)
+            assert encoded == legacy_encode(record, values), (layout.name, record.hex(), values)
+            assert layout_encode_fields(layout, record, values) == encoded
+            assert layout.decode_values(layout.unpack(encoded)) == layout_decode(layout, encoded)
+            assert layout_decode(layout, encoded) == legacy_decode(encoded)
+    print(f"[FUZZ] 변형 {len(EEPROM_VARIANTS)}개 x {count}회: 바이트 왕복/기존 인코딩·디코딩과 일치")
+
+    mixed = EepromLayout("MIXED", "9.9", None, 0x52, 0x00, (
+        EepromField("a", "a", 0, 2, "little", "uint"),
+        EepromField("b", "b", 2, 4, "big", "uint"),
+        EepromField("c", "c", 7, 2, "big", "uint"),
+        EepromField("d", "d", 9, 2, "little", "uint"),
+        EepromField("e", "e", 11, 2, "little", "uint"),
+    ))
+    assert mixed.size == 13 and mixed.names[2] == "_gap6", mixed.names
+    for _ in range(count):
+        record = bytes(rng.getrandbits(8) for _ in range(mixed.size))
+        fields = mixed.unpack(record)
+        assert mixed.pack(fields) == record
+        assert fields["a"] == int.from_bytes(record[0:2], "little") and fields["b"] == int.from_bytes(record[2:6], "big")
+        assert fields["c"] == int.from_bytes(record[7:9], "big") and fields["e"] == int.from_bytes(record[11:13], "little")
+    print(f"[FUZZ] 엔디안 혼합 레이아웃 {count}회: 필드 값/바이트 왕복 일치")
+
+    try:
+        EepromLayout("BAD", "0.0", None, 0x50, 0, (EepromField("a", "a", 0, 2, "big", "uint"),
+                                                   EepromField("b", "b", 1, 1, "big", "uint")))
+        raise AssertionError("겹치는 필드가 허용됨")
+    except ValueError:
+        pass
+    assert get_eeprom_layout("2.0", "UNKNOWN") is EEPROM_VARIANTS[("2.0", "CLASSYS")]
+    assert get_eeprom_layout("4.0", "CUTERA") is EEPROM_VARIANTS[("4.0", None)]
+    assert get_eeprom_layout("3.0", "CLASSYS") is None
+
+
+def bench(label, func, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<16} {iterations / elapsed / 1000:8.1f}k/s  ({elapsed / iterations * 1e6:.2f}us)")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fuzz", type=int, default=20000)
+    parser.add_argument("--iterations", type=int, default=200000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    fuzz(args.fuzz, rng)
+
+    layout = EEPROM_VARIANTS[("2.0", "CLASSYS")]
+    record = bytes(rng.getrandbits(8) for _ in range(layout.size))
+    values = random_values(rng)
+    values.update(inspectorCode="B", judgeResult="PASS", dailySerial=42)
+
+    bench("legacy encode", lambda: legacy_encode(record, values), args.iterations)
+    bench("layout encode", lambda: layout_encode(layout, record, values), args.iterations)
+    bench("legacy decode", lambda: legacy_decode(record), args.iterations)
+    bench("layout decode", lambda: layout_decode(layout, record), args.iterations)
+    bench("fields encode", lambda: layout_encode_fields(layout, record, values), args.iterations)
+    bench("fields decode", lambda: layout.decode_values(layout.unpack(record)), args.iterations)
+
+
+if __name__ == "__main__":
+    main()
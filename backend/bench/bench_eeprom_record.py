@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+EEPROM 레코드 쓰기/읽기 시간 비교 (가짜 FT232H 사용 - bench/fake_ft232h.py)
+- legacy: 필드별 write_to 11회 + 매번 sleep(10ms), 읽기는 read_from 9회 (레코드 코덱 도입 전 방식)
+- record: 레코드 순차 읽기 1회 + 페이지 쓰기(8바이트 단위) + ACK polling, 읽기는 순차 읽기 1회
+- 두 방식이 같은 EEPROM 내용을 만드는지도 확인 (Reserved 바이트 유지 포함)
+- 판정/시리얼 재기록: full(전체 쓰기 + 전체 읽기, 기존 eeprom_write 처리) vs diff(바뀐 바이트만 쓰기 + 검증)
+
+사용법: python bench/bench_eeprom_record.py [--rounds 10] [--twr-ms 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.dirname(__file__))
+
+import eeprom_ft232h
+from fake_ft232h import FakeI2cController
+from device_executors import _ms_stats
+
+eeprom_ft232h.I2cController = FakeI2cController
+
+RECORD = dict(tip_type=3, shot_count=1234, year=2026, month=10, day=17, maker_code=4,
+              inspector_code="B", judge_result="PASS", daily_serial=42)
+
+
+def legacy_write(slave, offset, tip_type, shot_count, year, month, day, maker_code, inspector_code, judge_result, daily_serial):
+    """레코드 코덱 도입 전 write_eeprom_mtr20의 I2C 접근 순서"""
+    values = [
+        (0, tip_type), (1, (shot_count >> 8) & 0xFF), (2, shot_count & 0xFF),
+        (5, ord(inspector_code[0]) & 0xFF), (6, 0x01 if judge_result == "PASS" else 0x00),
+        (7, (daily_serial >> 8) & 0xFF), (8, daily_serial & 0xFF),
+        (9, (year - 2000) & 0xFF), (10, month & 0xFF), (11, day & 0xFF), (12, maker_code & 0xFF),
+    ]
+    for regaddr, value in values:
+        slave.write_to(offset + regaddr, [value])
+        time.sleep(0.01)
+
+
+def legacy_read(slave, offset):
+    for regaddr, length in ((0, 1), (1, 2), (9, 1), (10, 1), (11, 1), (12, 1), (5, 1), (6, 1), (7, 2)):
+        slave.read_from(offset + regaddr, length)
+
+
+def timed(func, count):
+    samples = []
+    for _ in range(count):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def print_row(label, samples):
+    stats = _ms_stats(samples)
+    print(f"{label:<14} mean {stats['mean_ms']:7.2f}ms  p95 {stats['p95_ms']:7.2f}ms  max {stats['max_ms']:7.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--twr-ms", type=float, default=5.0, help="EEPROM 내부 쓰기 사이클 시간")
+    parser.add_argument("--transaction-ms", type=float, default=1.0)
+    args = parser.parse_args()
+
+    FakeI2cController.reset()
+    FakeI2cController.write_cycle_time = args.twr_ms / 1000
+    FakeI2cController.transaction_time = args.transaction_ms / 1000
+    session = eeprom_ft232h.i2c_session
+    offset = eeprom_ft232h.MTR20_CLASSYS_OFFSET
+    address = eeprom_ft232h.MTR20_EEPROM_ADDRESS
+
+    # Reserved 바이트(+3~4)에 임의 값 → 레코드 쓰기 후에도 유지되는지 확인
+    with session.port(address) as slave:
+        slave.write_to(offset + 3, b'\x5A\xA5')
+        eeprom_ft232h.wait_write_cycle(slave)
+
+    with session.port(address) as slave:
+        legacy_writes = timed(lambda: legacy_write(slave, offset, **RECORD), args.rounds)
+        legacy_reads = timed(lambda: legacy_read(slave, offset), args.rounds)
+        legacy_image = bytes(FakeI2cController.eeproms[address].memory)
+
+    cycles_before = FakeI2cController.eeproms[address].write_cycles
+    polls_before = FakeI2cController.poll_count
+    record_writes = timed(lambda: eeprom_ft232h.write_eeprom_mtr20(country="CLASSYS", **RECORD), args.rounds)
+    record_reads = timed(lambda: eeprom_ft232h.read_eeprom_mtr20("CLASSYS"), args.rounds)
+    eeprom = FakeI2cController.eeproms[address]
+    assert bytes(eeprom.memory) == legacy_image, "레코드 쓰기 결과가 legacy와 다름"
+    assert eeprom.memory[offset + 3:offset + 5] == b'\x5A\xA5', "Reserved 바이트가 바뀜"
+    result = eeprom_ft232h.read_eeprom_mtr20("CLASSYS")
+    assert result["shotCount"] == 1234 and result["dailySerial"] == 42 and result["judgeResult"] == "PASS", result
+
+    print(f"tWR {args.twr_ms:.1f}ms, 트랜잭션 {args.transaction_ms:.1f}ms, 페이지 {eeprom_ft232h.EEPROM_PAGE_SIZE}바이트")
+    print_row("legacy write", legacy_writes)
+    print_row("record write", record_writes)
+    print_row("legacy read", legacy_reads)
+    print_row("record read", record_reads)
+    print(f"record 쓰기 1회당 쓰기 사이클 {(eeprom.write_cycles - cycles_before) / args.rounds:.1f}회 (legacy 11회), "
+          f"ACK poll {(FakeI2cController.poll_count - polls_before) / args.rounds:.1f}회")
+    print("EEPROM 내용 legacy와 동일, Reserved 바이트 유지 확인")
+
+    # 이미 기록된 팁에 판정/시리얼만 다시 찍기 (JudgePanel의 eeprom_write)
+    serials = iter(range(100, 100 + args.rounds * 2))
+
+    def restamp_full():
+        result = eeprom_ft232h.write_eeprom_mtr20(country="CLASSYS", **dict(RECORD, judge_result="NG", daily_serial=next(serials)))
+        assert result["success"] and eeprom_ft232h.read_eeprom_mtr20("CLASSYS")["success"], result
+
+    def restamp_diff():
+        result = eeprom_ft232h.write_eeprom_mtr20(country="CLASSYS", write_mode=eeprom_ft232h.WRITE_MODE_DIFF,
+                                                  **dict(RECORD, judge_result="NG", daily_serial=next(serials)))
+        assert result["success"] and result["data"]["judgeResult"] == "NG", result
+        return result
+
+    cycles_before = eeprom.write_cycles
+    full_restamps = timed(restamp_full, args.rounds)
+    full_cycles = eeprom.write_cycles - cycles_before
+    cycles_before, bytes_before = eeprom.write_cycles, eeprom.bytes_written
+    diff_restamps = timed(restamp_diff, args.rounds)
+    diff_cycles, diff_bytes = eeprom.write_cycles - cycles_before, eeprom.bytes_written - bytes_before
+    print_row("restamp full", full_restamps)
+    print_row("restamp diff", diff_restamps)
+    print(f"재기록 1회당 쓰기 사이클 full {full_cycles / args.rounds:.1f}회 / diff {diff_cycles / args.rounds:.1f}회 "
+          f"(diff 평균 {diff_bytes / args.rounds:.1f}바이트)")
+
+    # 같은 값 재기록 → 쓰기 없음
+    last_serial = eeprom_ft232h.read_eeprom_mtr20("CLASSYS")["dailySerial"]
+    cycles_before = eeprom.write_cycles
+    result = eeprom_ft232h.write_eeprom_mtr20(country="CLASSYS", write_mode=eeprom_ft232h.WRITE_MODE_DIFF,
+                                              **dict(RECORD, judge_result="NG", daily_serial=last_serial))
+    assert result["success"] and result["changedBytes"] == 0 and eeprom.write_cycles == cycles_before, result
+    print("같은 값 diff 쓰기: 쓰기 사이클 0회 확인")
+    session.close()
+
+
+if __name__ == "__main__":
+    main()
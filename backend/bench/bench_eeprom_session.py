@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+FT232H I2C 세션 재사용 효과 측정 (가짜 FT232H 사용 - bench/fake_ft232h.py)
+- legacy: 호출마다 I2cController 생성 → configure → 읽기 → terminate (기존 방식)
+- session cold: 세션을 닫은 뒤 첫 read_eeprom_mtr20 (configure 포함)
+- session warm: 세션이 열려 있는 상태의 read_eeprom_mtr20
+- 복구 확인: 케이블 분리(I2cIOError) / 장시간 유휴 후 상태 확인 실패 시 재configure 되는지 확인
+
+실제 장치의 configure 시간은 --configure-ms로 조절 (USB 열기 + MPSSE 초기화, 장치/OS마다 다름)
+
+사용법: python bench/bench_eeprom_session.py [--reads 50] [--configure-ms 20]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.dirname(__file__))
+
+import eeprom_ft232h
+from fake_ft232h import FakeI2cController
+from device_executors import _ms_stats
+
+eeprom_ft232h.I2cController = FakeI2cController
+
+
+def legacy_read_mtr20(country="CLASSYS"):
+    """세션 도입 전 read_eeprom_mtr20과 같은 순서의 I2C 접근 (호출마다 configure/terminate)"""
+    offset = eeprom_ft232h.MTR20_CLASSYS_OFFSET
+    i2c = FakeI2cController()
+    i2c.configure(eeprom_ft232h.FTDI_URL)
+    slave = i2c.get_port(eeprom_ft232h.MTR20_EEPROM_ADDRESS)
+    for regaddr, length in ((0, 1), (1, 2), (9, 1), (10, 1), (11, 1), (12, 1), (5, 1), (6, 1), (7, 2)):
+        slave.read_from(offset + regaddr, length)
+    i2c.terminate()
+
+
+def session_read_mtr20():
+    result = eeprom_ft232h.read_eeprom_mtr20("CLASSYS")
+    assert result["success"], result
+    return result
+
+
+def timed(func, count):
+    samples = []
+    for _ in range(count):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def print_row(label, samples):
+    stats = _ms_stats(samples)
+    print(f"{label:<16} n={len(samples):<4} mean {stats['mean_ms']:7.2f}ms  p95 {stats['p95_ms']:7.2f}ms  max {stats['max_ms']:7.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--reads", type=int, default=50)
+    parser.add_argument("--configure-ms", type=float, default=20.0)
+    parser.add_argument("--transaction-ms", type=float, default=1.0)
+    args = parser.parse_args()
+
+    FakeI2cController.reset()
+    FakeI2cController.configure_time = args.configure_ms / 1000
+    FakeI2cController.transaction_time = args.transaction_ms / 1000
+    session = eeprom_ft232h.i2c_session
+
+    result = eeprom_ft232h.write_eeprom_mtr20(3, 1234, 2026, 10, 17, 4, "CLASSYS", "B", "PASS", 42)
+    assert result["success"], result
+
+    legacy = timed(legacy_read_mtr20, args.reads)
+
+    cold = []
+    for _ in range(min(args.reads, 10)):
+        session.close()
+        cold += timed(session_read_mtr20, 1)
+    warm = timed(session_read_mtr20, args.reads)
+
+    print(f"configure {args.configure_ms:.1f}ms, 트랜잭션 {args.transaction_ms:.1f}ms (legacy 읽기 = 트랜잭션 9회, 세션 읽기 = 순차 읽기 1회)")
+    print_row("legacy", legacy)
+    print_row("session cold", cold)
+    print_row("session warm", warm)
+    print(f"warm 읽기 속도 향상: {sum(legacy) / len(legacy) / (sum(warm) / len(warm)):.2f}x")
+
+    # 복구 1: 사용 중 케이블 분리 → I2cIOError → 세션 무효화 → 읽기 재시도에서 재configure
+    configure_before = session.configure_count
+    FakeI2cController.unplugged = True
+    session_read_mtr20()
+    assert session.configure_count == configure_before + 1, session.get_stats()
+    print(f"[복구] 읽기 중 I2cIOError → 재configure 후 성공: {session.get_stats()}")
+
+    # 복구 2: 유휴 중 분리 → 다음 사용 전 상태 확인에서 감지 → 재configure (첫 트랜잭션부터 성공)
+    configure_before = session.configure_count
+    session.health_check_interval = 0.0
+    FakeI2cController.unplugged = True
+    session_read_mtr20()
+    assert session.configure_count == configure_before + 1, session.get_stats()
+    print(f"[복구] 상태 확인 실패 → 재configure 후 성공: {session.get_stats()}")
+
+    # 복구 3: 쓰기 중 분리 → run()이 재configure 후 같은 쓰기를 재시도
+    configure_before = session.configure_count
+    session.health_check_interval = 5.0
+    FakeI2cController.unplugged = True
+    result = eeprom_ft232h.write_eeprom_mtr20(3, 4321, 2026, 10, 17, 4, "CLASSYS", "B", "PASS", 43)
+    assert result["success"] and session.configure_count == configure_before + 1, (result, session.get_stats())
+    assert session_read_mtr20()["shotCount"] == 4321
+    print(f"[복구] 쓰기 중 I2cIOError → 재configure 후 재시도 성공: {session.get_stats()}")
+
+    session.close()
+
+
+if __name__ == "__main__":
+    main()
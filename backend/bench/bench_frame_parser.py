@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+0xAA55 응답 스트림 파서 마이크로 벤치마크
+- 합성 상태 프레임 사이에 쓰레기 바이트(가짜 AA 55 헤더 포함)를 섞은 스트림 생성
+- 임의 크기의 청크로 나누어 MotorFrameParser에 공급하고 decode_status까지 수행
+- 비교용으로 기존 방식(pop(0) 재동기화 + 다음 헤더 탐색 + hex 디코딩)을 일부 프레임으로 측정
+
+사용법: python bench/bench_frame_parser.py [--frames 1000000] [--legacy-frames 20000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.dirname(__file__))
+
+from motor_frame_parser import MotorFrameParser, decode_status
+from fake_motor import build_status_frame
+
+
+def make_stream(frame_count, garbage_ratio=0.05, seed=1234):
+    """프레임 스트림과 청크 목록 생성 (garbage_ratio 비율의 프레임 앞에 쓰레기 삽입)"""
+    rng = random.Random(seed)
+    parts = []
+    for i in range(frame_count):
+        if rng.random() < garbage_ratio:
+            garbage = bytearray(rng.randrange(256) for _ in range(rng.randrange(1, 12)))
+            if rng.random() < 0.3:
+                garbage += b'\xAA\x55\xFF'  # 길이 초과 가짜 헤더
+            parts.append(bytes(garbage))
+        motor_id = 1 + (i & 1)
+        parts.append(build_status_frame(motor_id, i & 0x3FFF, (i * 7) & 0x3FFF, force=i & 0xFF, sensor=i & 0x7FFF))
+    stream = b''.join(parts)
+
+    chunks = []
+    pos = 0
+    while pos < len(stream):
+        size = rng.randrange(16, 512)
+        chunks.append(stream[pos:pos + size])
+        pos += size
+    return stream, chunks
+
+
+def legacy_parse(chunks):
+    """기존 read_loop/find_next_header/parse_response 방식 재현"""
+    decoded = 0
+    buffer = bytearray()
+    for data in chunks:
+        buffer += data
+        while len(buffer) >= 2:
+            if buffer[0] == 0xAA and buffer[1] == 0x55:
+                next_header = None
+                for i in range(2, len(buffer) - 1):
+                    if buffer[i] == 0xAA and buffer[i + 1] == 0x55:
+                        next_header = i
+                        break
+                if not next_header:
+                    break
+                frame = buffer[:next_header]
+                buffer = buffer[next_header:]
+                hex_str = frame.hex().upper()
+                if len(hex_str) < 34:
+                    continue
+                int(hex_str[6:8], 16)
+                for a, b in ((14, 18), (18, 22), (26, 30), (30, 34)):
+                    val = hex_str[a:b]
+                    value = int(val[2:] + val[:2], 16)
+                    if value >= 0x8000:
+                        value -= 0x10000
+                decoded += 1
+            else:
+                buffer.pop(0)
+    return decoded
+
+
+def current_parse(chunks):
+    decoded = 0
+    parser = MotorFrameParser()
+    for data in chunks:
+        for frame in parser.feed(data):
+            if decode_status(frame) is not None:
+                decoded += 1
+    return decoded, parser
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='0xAA55 프레임 파서 마이크로 벤치마크')
+    arg_parser.add_argument('--frames', type=int, default=1_000_000, help='현재 파서 측정 프레임 수')
+    arg_parser.add_argument('--legacy-frames', type=int, default=20_000, help='기존 파서 측정 프레임 수 (0이면 생략)')
+    args = arg_parser.parse_args()
+
+    print(f"[BENCH] 스트림 생성 중... ({args.frames:,} 프레임)")
+    stream, chunks = make_stream(args.frames)
+    print(f"[BENCH] 스트림 크기: {len(stream):,} bytes, 청크 {len(chunks):,}개")
+
+    start = time.perf_counter()
+    decoded, parser = current_parse(chunks)
+    elapsed = time.perf_counter() - start
+    print(f"[BENCH] current  decoded={decoded:,}/{args.frames:,}  {elapsed:.2f}s  "
+          f"{decoded / elapsed:,.0f} frames/s  {elapsed / max(decoded, 1) * 1e6:.2f} us/frame  "
+          f"(dropped={parser.dropped_bytes:,} bytes)")
+
+    if args.legacy_frames:
+        _, legacy_chunks = make_stream(args.legacy_frames)
+        start = time.perf_counter()
+        legacy_decoded = legacy_parse(legacy_chunks)
+        legacy_elapsed = time.perf_counter() - start
+        print(f"[BENCH] legacy   decoded={legacy_decoded:,}/{args.legacy_frames:,}  {legacy_elapsed:.2f}s  "
+              f"{legacy_decoded / legacy_elapsed:,.0f} frames/s  "
+              f"{legacy_elapsed / max(legacy_decoded, 1) * 1e6:.2f} us/frame")
+
+
+if __name__ == '__main__':
+    main()
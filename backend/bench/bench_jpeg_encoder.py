@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+JPEG 인코더별 960x720 프레임 인코딩 시간 비교 (camera_server JPEG_ENCODERS)
+- 프레임: 가짜 카메라 합성 영상 (bench/fake_camera.py) 디코딩 결과, 480x360 축소 프레임도 측정
+- 인코더 x 서브샘플링(444/422/420) x 품질(70/90)별 프레임당 ms, JPEG 크기
+- 예산: 디코딩 모드 스트림 2개(30fps) + /capture 초당 1장을 인코딩할 때 코어 1개 대비 CPU %
+  (Raspberry Pi급 CPU는 x86 데스크톱보다 4~6배 느리다고 보고 --pi-factor로 환산)
+
+사용법: python bench/bench_jpeg_encoder.py [--iterations 50] [--pi-factor 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.dirname(__file__))
+
+import cv2
+
+import camera_server
+from fake_camera import FakeVideoCapture
+
+QUALITIES = [70, 90]
+STREAMS = 2
+STREAM_FPS = 30
+CAPTURES_PER_SECOND = 1
+
+
+def encode_ms(encoder, frame, quality, subsampling, iterations):
+    encoder.encode(frame, quality, subsampling)  # 워밍업
+    start = time.perf_counter()
+    for _ in range(iterations):
+        jpeg = encoder.encode(frame, quality, subsampling)
+    return (time.perf_counter() - start) / iterations * 1000, len(jpeg)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--pi-factor", type=float, default=5.0, help="Raspberry Pi급 CPU 환산 배수")
+    args = parser.parse_args()
+    cv2.setNumThreads(1)  # 인코딩 스레드 1개 기준 (요청 스레드마다 인코딩)
+
+    capture = FakeVideoCapture(0)
+    capture.grab()
+    frame = capture.retrieve()[1]
+    small = cv2.resize(frame, (480, 360), interpolation=cv2.INTER_AREA)
+    names = camera_server.available_jpeg_encoders()
+    missing = [name for name in camera_server.JPEG_ENCODERS if name not in names]
+
+    print(f"프레임 {frame.shape[1]}x{frame.shape[0]} (480x360 축소 포함), 반복 {args.iterations}회, "
+          f"사용 가능: {', '.join(names)}" + (f" (없음: {', '.join(missing)})" if missing else ""))
+    print(f"{'인코더':<12}{'샘플링':>6}{'품질':>6}{'960x720 ms':>12}{'KB':>7}{'480x360 ms':>12}{'예산 CPU %':>12}{'Pi 환산 %':>11}")
+    results = {}
+    for name in names:
+        encoder = camera_server.create_jpeg_encoder(name)
+        for subsampling in camera_server.JPEG_SUBSAMPLINGS:
+            for quality in QUALITIES:
+                full_ms, size = encode_ms(encoder, frame, quality, subsampling, args.iterations)
+                small_ms, _ = encode_ms(encoder, small, quality, subsampling, args.iterations)
+                budget = (STREAMS * STREAM_FPS + CAPTURES_PER_SECOND) * full_ms / 10  # ms/s → % of 1 core
+                results[(name, subsampling, quality)] = full_ms
+                print(f"{name:<12}{subsampling:>6}{quality:>6}{full_ms:>12.2f}{size / 1024:>7.0f}{small_ms:>12.2f}"
+                      f"{budget:>12.1f}{budget * args.pi_factor:>11.0f}")
+
+    baseline = results[("opencv", "420", 90)]
+    best = min(results.items(), key=lambda item: item[1] if item[0][1:] == ("420", 90) else float("inf"))
+    print(f"품질 90/420 기준: opencv {baseline:.2f}ms → {best[0][0]} {best[1]:.2f}ms ({baseline / best[1]:.2f}x), "
+          f"스트림 {STREAMS}개 x {STREAM_FPS}fps + /capture {CAPTURES_PER_SECOND}장/초")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+EEPROM 쓰기 중 이벤트 루프 지연(lag) 측정
+- 가짜 FT232H(bench/fake_ft232h.py)로 write_eeprom_mtr20 + read_eeprom_mtr20 (ws_server의 eeprom_write 처리와 동일 순서) 실행
+- 1) 이벤트 루프에서 직접 호출 (기존 handler 방식)  2) DeviceExecutor로 오프로딩 (현재 방식)
+- 두 경우 모두 EventLoopLagMonitor로 루프 지연을 측정하고, 동시에 5ms 주기 상태 푸시 틱이 몇 번 실행됐는지 셈
+
+사용법: python bench/bench_loop_lag.py [--writes 5]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.dirname(__file__))
+
+import eeprom_ft232h
+from fake_ft232h import FakeI2cController
+from device_executors import DeviceExecutor, EventLoopLagMonitor
+
+eeprom_ft232h.I2cController = FakeI2cController
+
+
+def eeprom_write_and_read():
+    result = eeprom_ft232h.write_eeprom_mtr20(3, 1234, 2026, 10, 17, 4, "CLASSYS", "B", "PASS", 42)
+    read_result = eeprom_ft232h.read_eeprom_mtr20("CLASSYS")
+    assert result["success"] and read_result["success"] and read_result["shotCount"] == 1234, (result, read_result)
+    return read_result
+
+
+async def measure(label, writes, call):
+    monitor = EventLoopLagMonitor(interval=0.005, history=100_000)
+    ticks = 0
+    stop = False
+
+    async def status_ticks():
+        nonlocal ticks
+        while not stop:
+            await asyncio.sleep(0.005)
+            ticks += 1
+
+    monitor.start()
+    ticker = asyncio.get_running_loop().create_task(status_ticks())
+    await asyncio.sleep(0.05)
+    monitor.reset()
+    ticks = 0
+    start = time.perf_counter()
+    for _ in range(writes):
+        await call()
+    elapsed = time.perf_counter() - start
+    stop = True
+    await ticker
+    monitor.task.cancel()
+    stats = monitor.get_stats()
+    print(f"[BENCH] {label:<10} {writes} writes  {elapsed:.2f}s  "
+          f"lag mean={stats['mean_ms']}ms p95={stats['p95_ms']}ms max={stats['max_ms']}ms  "
+          f"status ticks={ticks} (ideal {int(elapsed / 0.005)})")
+
+
+async def main_async(writes):
+    async def inline():
+        eeprom_write_and_read()
+
+    executor = DeviceExecutor("eeprom", max_workers=1)
+
+    async def offloaded():
+        await executor.run(eeprom_write_and_read)
+
+    await measure("inline", writes, inline)
+    await measure("executor", writes, offloaded)
+    print(f"[BENCH] executor stats: {executor.get_stats()}")
+    executor.shutdown()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='EEPROM 쓰기 중 이벤트 루프 지연 측정')
+    arg_parser.add_argument('--writes', type=int, default=5, help='EEPROM 쓰기+읽기 반복 횟수')
+    args = arg_parser.parse_args()
+    asyncio.run(main_async(args.writes))
+
+
+if __name__ == '__main__':
+    main()
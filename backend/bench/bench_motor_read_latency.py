@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+모터 상태 프레임 수신 지연 벤치마크
+- pty 기반 가짜 모터(FakeDualMotor)에 DualMotorController를 연결
+- 가짜 모터가 프레임을 송신한 시각 → parse_response로 상태가 갱신된 시각의 차이를 측정
+- 기존 방식(10ms sleep 폴링)과 현재 read_loop를 비교
+
+사용법: python bench/bench_motor_read_latency.py [--seconds 5]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.dirname(__file__))
+
+from dual_motor_controller import DualMotorController
+from fake_motor import FakeDualMotor
+
+
+class _LatencyProbe:
+    """parse_response 직후 시각을 기록하는 믹스인"""
+
+    def attach_probe(self, fake):
+        self._fake = fake
+        self.latencies = []
+
+    def parse_response(self, frame):
+        super().parse_response(frame)
+        now = time.perf_counter()
+        if len(frame) < 17:
+            return
+        motor_id = frame[3]
+        seq = frame[15] | (frame[16] << 8)
+        sent = self._fake.sent_at.pop((motor_id, seq), None)
+        if sent is not None:
+            self.latencies.append(now - sent)
+
+
+class LegacyPollingController(_LatencyProbe, DualMotorController):
+    """기존 read_loop 재현 - 10ms sleep 후 in_waiting/read(1024), 헤더-헤더 분할"""
+
+    def read_loop(self):
+        buffer = bytearray()
+        while self.running:
+            try:
+                self.reader_last_activity = time.time()
+                time.sleep(0.01)
+                if self.serial.in_waiting > 0:
+                    data = self.serial.read(self.serial.in_waiting)
+                else:
+                    data = self.serial.read(1024)
+                if data:
+                    buffer += data
+                    while len(buffer) >= 2:
+                        if buffer[0] == 0xAA and buffer[1] == 0x55:
+                            next_header = None
+                            for i in range(2, len(buffer) - 1):
+                                if buffer[i] == 0xAA and buffer[i + 1] == 0x55:
+                                    next_header = i
+                                    break
+                            if not next_header:
+                                break
+                            frame = buffer[:next_header]
+                            buffer = buffer[next_header:]
+                            self.parse_response(frame)
+                        else:
+                            buffer.pop(0)
+            except Exception:
+                time.sleep(0.1)
+
+
+class CurrentController(_LatencyProbe, DualMotorController):
+    """현재 DualMotorController.read_loop 사용"""
+
+
+def run(controller_cls, seconds):
+    with FakeDualMotor() as fake:
+        controller = controller_cls()
+        controller.attach_probe(fake)
+        result = controller.connect(fake.port, 115200, "none", 8, "1")
+        if not controller.is_connected():
+            raise RuntimeError(result)
+        try:
+            time.sleep(seconds)
+        finally:
+            controller.disconnect()
+            time.sleep(0.2)
+        return controller.latencies
+
+
+def report(name, latencies):
+    if not latencies:
+        print(f"[BENCH] {name}: 측정된 프레임 없음")
+        return
+    ms = sorted(x * 1000 for x in latencies)
+    p95 = ms[int(len(ms) * 0.95) - 1]
+    print(f"[BENCH] {name:<10} frames={len(ms):5d}  "
+          f"mean={statistics.mean(ms):6.2f}ms  p50={statistics.median(ms):6.2f}ms  "
+          f"p95={p95:6.2f}ms  max={ms[-1]:6.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='모터 상태 프레임 수신 지연 벤치마크 (pty 가짜 모터)')
+    parser.add_argument('--seconds', type=float, default=5.0, help='각 방식별 측정 시간 (초)')
+    args = parser.parse_args()
+
+    print(f"[BENCH] 프레임 송신 → 상태 갱신 지연 측정 ({args.seconds:.0f}초씩)")
+    report("before", run(LegacyPollingController, args.seconds))
+    report("after", run(CurrentController, args.seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+저항 측정 속도 비교 (pymodbus RTU 시뮬레이터 - bench/modbus_simulator.py, pty 연결)
+- once: 측정마다 연결 → pymodbus로 slave 1/2 읽기 → 해제 (기존 measure_resistance_once / ws_server 방식)
+- client: 상시 연결 ResistanceMeasurer, pymodbus read_holding_registers 2회 (fast_read=False)
+- fast: 상시 연결 ResistanceMeasurer.read_both (RTU 프레임 직접 송수신, 현재 ws_server 방식)
+- 복구 확인: 포트가 닫혔거나 측정 중 I/O 오류가 나면 재연결 후 같은 측정을 재시도하는지 확인
+
+--baud 9600이면 브리지가 바이트 전송 시간을 흉내냄 (실제 측정기와 같은 조건)
+
+사용법: python bench/bench_resistance.py [--seconds 3] [--baud 0]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.dirname(__file__))
+
+from pymodbus import pymodbus_apply_logging_config
+
+pymodbus_apply_logging_config(logging.CRITICAL)  # 시뮬레이터 서버의 프레임 덤프/deprecation 경고 숨김
+
+from modbus_simulator import ResistanceSimulator
+from resistance import ResistanceMeasurer
+
+
+def run_for(seconds, measure):
+    count = 0
+    failures = 0
+    deadline = time.perf_counter() + seconds
+    start = time.perf_counter()
+    while time.perf_counter() < deadline:
+        result = measure()
+        count += 1
+        if result.get("status1") != "OK" or result.get("status2") != "OK":
+            failures += 1
+    return count / (time.perf_counter() - start), failures
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--baud", type=int, default=0, help="0이면 전송 지연 없음")
+    args = parser.parse_args()
+
+    simulator = ResistanceSimulator(values={1: 1234, 2: 5678}, baudrate=args.baud).start()
+    port = simulator.client_port
+    quiet = open(os.devnull, "w")
+
+    def once():
+        stdout, sys.stdout = sys.stdout, quiet  # 측정마다 나오는 연결/해제 로그 숨김
+        try:
+            with ResistanceMeasurer(port=port, fast_read=False) as measurer:
+                return measurer.measure_resistance(log=False)
+        finally:
+            sys.stdout = stdout
+
+    rows = []
+    rows.append(("once", *run_for(args.seconds, once)))
+
+    client_measurer = ResistanceMeasurer(port=port, fast_read=False)
+    rows.append(("client", *run_for(args.seconds, lambda: client_measurer.measure_resistance(log=False))))
+    client_measurer.disconnect()
+
+    measurer = ResistanceMeasurer(port=port)
+    result = measurer.measure_resistance(log=False)
+    assert result["resistance1"] == 1234 and result["resistance2"] == 5678, result
+    rows.append(("fast", *run_for(args.seconds, lambda: measurer.measure_resistance(log=False))))
+
+    print(f"baud {args.baud or '제한 없음'}, {args.seconds:.0f}초씩")
+    for label, rate, failures in rows:
+        print(f"{label:<8} {rate:8.1f} 측정/s  ({1000 / rate:6.2f}ms/측정, 실패 {failures})")
+    print(f"fast / once: {rows[2][1] / rows[0][1]:.1f}x, fast / client: {rows[2][1] / rows[1][1]:.1f}x")
+
+    # 복구: 포트가 밖에서 닫힌 상태 → 통신 오류 → 재연결 후 재시도
+    measurer.client.socket.close()
+    simulator.set_resistance(1, 4321)
+    result = measurer.measure_resistance(log=False)
+    assert result["status1"] == "OK" and result["resistance1"] == 4321, result
+    print(f"[복구] 포트 닫힘 → 재연결 후 측정 성공: {measurer.get_stats()}")
+
+    # 복구: 포트는 열린 것으로 보이지만 fd가 죽은 상태 (USB 분리) → I/O 오류 → 재연결 후 재시도
+    dead_port = measurer.client.socket
+    os.close(dead_port.fd)
+    simulator.set_resistance(2, 8765)
+    result = measurer.measure_resistance(log=False)
+    assert result["status2"] == "OK" and result["resistance2"] == 8765 and measurer.reconnects == 1, (result, measurer.get_stats())
+    print(f"[복구] 측정 중 I/O 오류 → 재연결 후 재시도 성공: {measurer.get_stats()}")
+    dead_port.is_open = False  # 이미 닫은 fd 번호를 새 포트가 재사용하므로 GC 때 다시 닫지 않도록
+
+    # 없는 slave → 해당 채널만 READ_FAIL, 연결은 유지
+    measurer.slave_id_2 = 9
+    measurer.timeout = 0.05
+    measurer.client.socket.timeout = 0.05
+    result = measurer.measure_resistance(log=False)
+    assert result["status1"] == "OK" and result["status2"] == "READ_FAIL" and result["connected"], result
+    print(f"[응답 없음] slave 9 → READ_FAIL, 연결 유지: {result}")
+
+    measurer.disconnect()
+    simulator.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+저항 연속 측정(ResistanceSampler) 확인 (pymodbus RTU 시뮬레이터 - bench/modbus_simulator.py, pty 연결)
+- 이상치 내성: 정상 저항 + 잡음 + 순간 이상치(x10)에서 단발 측정 판정 vs 디바운스 판정 오판 횟수
+- 감지 지연: 저항이 임계값 위로 바뀐 뒤 디바운스 판정이 비정상으로 바뀔 때까지 걸린 샘플 수/시간
+- 측정 주기: 목표 rate 대비 실제 측정 주기, 통계 조회(get_stats) 시간
+
+사용법: python bench/bench_resistance_sampling.py [--seconds 5] [--baud 9600] [--rate 0]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.dirname(__file__))
+
+from pymodbus import pymodbus_apply_logging_config
+
+pymodbus_apply_logging_config(logging.CRITICAL)  # 시뮬레이터 서버의 프레임 덤프/deprecation 경고 숨김
+
+from modbus_simulator import ResistanceSimulator
+from resistance import ResistanceMeasurer, ResistanceSampler
+
+NORMAL_MOHM = 5000      # 정상 저항 5Ω
+THRESHOLD_MOHM = 10000  # 임계값 10Ω
+ABNORMAL_MOHM = 20000   # 비정상 저항 20Ω
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--baud", type=int, default=9600, help="0이면 전송 지연 없음")
+    parser.add_argument("--rate", type=float, default=0.0, help="목표 측정 주기 (Hz, 0이면 최대 속도)")
+    parser.add_argument("--outlier-rate", type=float, default=0.05)
+    args = parser.parse_args()
+
+    simulator = ResistanceSimulator(values={1: NORMAL_MOHM, 2: NORMAL_MOHM}, baudrate=args.baud,
+                                    noise=200, outlier_rate=args.outlier_rate).start()
+    measurer = ResistanceMeasurer(port=simulator.client_port)
+
+    # 단발 측정 판정 (기존 방식: 측정 1회가 임계값을 넘으면 비정상)
+    single_reads = 0
+    single_false = 0
+    deadline = time.perf_counter() + args.seconds
+    while time.perf_counter() < deadline:
+        result = measurer.measure_resistance(log=False)
+        single_reads += 1
+        if any(result[f"resistance{channel}"] > THRESHOLD_MOHM for channel in (1, 2)):
+            single_false += 1
+
+    # 연속 측정 디바운스 판정
+    changes = []
+    sampler = ResistanceSampler(measurer, rate_hz=args.rate, threshold_mohm=THRESHOLD_MOHM,
+                                on_judgment=lambda abnormal, stats: changes.append((time.perf_counter(), abnormal, stats["samples"])))
+    sampler.start()
+    time.sleep(args.seconds)
+    stats = sampler.get_stats()
+    false_changes = len(changes)
+
+    print(f"baud {args.baud or '제한 없음'}, 이상치 확률 {args.outlier_rate:.0%}, 임계값 {THRESHOLD_MOHM} mΩ, {args.seconds:.0f}초씩")
+    print(f"단발 측정   {single_reads:5d}회 중 비정상 오판 {single_false}회 ({single_false / single_reads:.1%})")
+    print(f"연속 측정   {stats['samples']:5d}샘플 중 판정 변경 {false_changes}회 "
+          f"(window={stats['window']}, debounce={stats['debounce']})")
+    print(f"측정 주기   목표 {args.rate or '최대'}Hz → 실제 {stats['measured_rate_hz']}Hz, 읽기 실패 {stats['read_failures']}")
+    for channel, channel_stats in stats["channels"].items():
+        print(f"  채널 {channel}: 평균 {channel_stats['mean']}, 중앙값 {channel_stats['median']}, "
+              f"표준편차 {channel_stats['std']}, 최대 {channel_stats['max']} (최근 {channel_stats['count']}개)")
+    assert false_changes == 0, changes
+
+    # 감지 지연: 채널 2 저항 상승 → 비정상 판정까지
+    step_time = time.perf_counter()
+    step_samples = sampler.samples
+    simulator.set_resistance(2, ABNORMAL_MOHM)
+    while not (changes and changes[-1][1]) and time.perf_counter() - step_time < 5:  # 판정 알림까지 대기
+        time.sleep(0.001)
+    assert sampler.abnormal and changes and changes[-1][1], changes
+    detected_time, _, detected_samples = changes[-1]
+    print(f"감지 지연   {detected_samples - step_samples}샘플, {(detected_time - step_time) * 1000:.0f}ms "
+          f"(채널 2 {NORMAL_MOHM} → {ABNORMAL_MOHM} mΩ)")
+
+    simulator.set_resistance(2, NORMAL_MOHM)
+    while changes[-1][1] and time.perf_counter() - step_time < 10:
+        time.sleep(0.001)
+    assert not sampler.abnormal and not changes[-1][1], sampler.get_stats()
+    print(f"복귀        정상 판정 복귀 (판정 변경 {len(changes)}회)")
+
+    iterations = 2000
+    start = time.perf_counter()
+    for _ in range(iterations):
+        sampler.get_stats()
+    stats_us = (time.perf_counter() - start) / iterations * 1e6
+    start = time.perf_counter()
+    for _ in range(iterations):
+        sampler.get_stats(buffer=256)
+    buffer_us = (time.perf_counter() - start) / iterations * 1e6
+    print(f"통계 조회   get_stats {stats_us:.0f}us, buffer 256개 포함 {buffer_us:.0f}us")
+
+    sampler.stop()
+    measurer.disconnect()
+    simulator.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+가짜 카메라 (벤치마크용) - cv2.VideoCapture 대체
+- 설정한 FPS 주기마다 새 프레임이 생기는 것처럼 grab()이 다음 프레임 시각까지 대기 (드라이버 큐 1장)
+- 여러 스레드가 같은 객체에서 grab()하면 드라이버처럼 순서대로 처리 (프레임을 나눠 가짐)
+- 프레임은 960x720 합성 영상을 카메라가 보내는 MJPEG로 미리 인코딩해 두고,
+  retrieve()에서 BGR로 디코딩 (MJPEG 카메라에서 OpenCV가 하는 일과 같은 CPU 비용)
+- CAP_PROP_CONVERT_RGB=0이면 MJPEG 버퍼를 1행 uint8 배열로 그대로 반환 (raw_supported=False면 무시)
+- strip_huffman=True면 UVC 카메라처럼 Huffman 테이블(DHT)을 뺀 MJPEG를 보냄
+
+사용법: camera_server.cv2.VideoCapture = FakeVideoCapture
+"""
+
+import threading
+import time
+
+import cv2
+import numpy as np
+
+FRAME_WIDTH = 960
+FRAME_HEIGHT = 720
+_FRAME_COUNT = 8
+
+
+def _strip_huffman_tables(jpeg):
+    data = jpeg.tobytes()
+    output = bytearray(data[:2])
+    pos = 2
+    while data[pos + 1] != 0xDA:
+        length = int.from_bytes(data[pos + 2:pos + 4], 'big')
+        if data[pos + 1] != 0xC4:
+            output += data[pos:pos + 2 + length]
+        pos += 2 + length
+    output += data[pos:]
+    return np.frombuffer(bytes(output), np.uint8)
+
+
+def _make_frames(width, height, count):
+    rng = np.random.default_rng(1)
+    base = cv2.GaussianBlur(rng.integers(0, 256, (height, width, 3), dtype=np.uint8), (0, 0), 3)
+    gradient = np.linspace(0, 120, width, dtype=np.float32)[None, :, None]
+    frames = []
+    for index in range(count):
+        frame = np.clip(base * 0.6 + gradient, 0, 255).astype(np.uint8)
+        cv2.circle(frame, (width // 2 + index * 20, height // 2), 120, (30, 200, 240), 6)
+        cv2.putText(frame, f"FRAME {index}", (40, 80), cv2.FONT_HERSHEY_SIMPLEX, 2, (255, 255, 255), 3)
+        frames.append(cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 90])[1])
+    return frames
+
+
+class FakeVideoCapture:
+    fps = 30.0
+    raw_supported = True
+    strip_huffman = False
+    _frames = None
+    opened = []  # 생성된 인스턴스 (벤치마크에서 grab 횟수 확인용)
+
+    def __init__(self, index=0, api=None):
+        if FakeVideoCapture._frames is None:
+            FakeVideoCapture._frames = _make_frames(FRAME_WIDTH, FRAME_HEIGHT, _FRAME_COUNT)
+        self.index = index
+        self.props = {}
+        self._open = True
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+        self._last_frame_number = -1
+        self._current = None
+        self.grabs = 0
+        FakeVideoCapture.opened.append(self)
+
+    def isOpened(self):
+        return self._open
+
+    def release(self):
+        self._open = False
+
+    def set(self, prop, value):
+        self.props[prop] = value
+        return True
+
+    def get(self, prop):
+        return self.props.get(prop, 0)
+
+    def grab(self):
+        """다음 프레임이 생길 때까지 대기 (이미 가져간 프레임은 다시 주지 않음)"""
+        with self._lock:
+            if not self._open:
+                return False
+            period = 1.0 / self.fps
+            number = max(int((time.perf_counter() - self._start) / period), self._last_frame_number + 1)
+            wait = self._start + number * period - time.perf_counter()
+            if wait > 0:
+                time.sleep(wait)
+            self._last_frame_number = number
+            self._current = number
+            self.grabs += 1
+            return True
+
+    def retrieve(self):
+        if self._current is None:
+            return False, None
+        jpeg = self._frames[self._current % len(self._frames)]
+        if self.raw_supported and self.props.get(cv2.CAP_PROP_CONVERT_RGB, 1) == 0:
+            if self.strip_huffman:
+                jpeg = _strip_huffman_tables(jpeg)
+            return True, jpeg.reshape(1, -1).copy()
+        return True, cv2.imdecode(jpeg, cv2.IMREAD_COLOR)
+
+    def read(self):
+        if not self.grab():
+            return False, None
+        return self.retrieve()
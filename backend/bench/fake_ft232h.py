@@ -0,0 +1,140 @@
+"""
+가짜 FT232H I2C 컨트롤러 + 24Cxx EEPROM (벤치마크용)
+- pyftdi.i2c.I2cController/I2cPort에서 eeprom_ft232h가 쓰는 부분만 흉내냄
+  (configure / get_port / terminate / configured / ftdi.poll_modem_status, write_to / read_from / write / read / poll)
+- 시간 모델: configure(USB 장치 열기 + MPSSE 초기화) 지연, 트랜잭션마다 USB 왕복 지연,
+  쓰기 후 내부 쓰기 사이클(tWR) 동안 NACK → I2cIOError
+- EEPROM 내용은 프로세스 안에서 유지 (세션을 다시 열어도 같은 데이터)
+"""
+
+import time
+
+from pyftdi.i2c import I2cIOError
+
+EEPROM_SIZE = 256
+PAGE_SIZE = 16  # 24C02 계열 페이지 크기
+
+
+class FakeEeprom:
+    def __init__(self, size=EEPROM_SIZE, page_size=PAGE_SIZE):
+        self.memory = bytearray(b'\xFF' * size)
+        self.page_size = page_size
+        self.busy_until = 0.0  # 내부 쓰기 사이클 종료 시각
+        self.write_cycles = 0  # 쓰기 사이클 횟수 (페이지 쓰기 1회 = 1)
+        self.bytes_written = 0
+
+
+class FakeFtdi:
+    """I2cController.ftdi 대용 - 세션 상태 확인(poll_modem_status)용"""
+
+    def __init__(self, controller):
+        self.controller = controller
+
+    def poll_modem_status(self):
+        if not self.controller.configured or FakeI2cController.unplugged:
+            raise I2cIOError("FTDI device not responding")
+        time.sleep(self.controller.transaction_time)
+        return 0
+
+
+class FakeI2cController:
+    """
+    Args:
+        configure_time: configure() 1회 지연 (초)
+        transaction_time: I2C 트랜잭션 1회의 USB 왕복 지연 (초)
+        write_cycle_time: EEPROM 내부 쓰기 사이클 tWR (초)
+    """
+
+    eeproms = {}  # I2C 주소 → FakeEeprom (컨트롤러를 새로 만들어도 유지)
+    configure_time = 0.02
+    transaction_time = 0.001
+    write_cycle_time = 0.005
+    configure_count = 0
+    poll_count = 0  # ACK polling 횟수
+    unplugged = False  # True로 바꾸면 기존 컨트롤러의 모든 USB 전송이 실패 (케이블 분리 흉내)
+
+    def __init__(self):
+        self.configured = False
+        self.ftdi = FakeFtdi(self)
+
+    def configure(self, url, **kwargs):
+        time.sleep(self.configure_time)
+        FakeI2cController.configure_count += 1
+        FakeI2cController.unplugged = False  # 다시 configure하면 새 USB 핸들로 복구
+        self.configured = True
+
+    def terminate(self):
+        self.configured = False
+
+    def get_port(self, address):
+        if not self.configured:
+            raise I2cIOError("FTDI controller not initialized")
+        eeprom = self.eeproms.setdefault(address, FakeEeprom())
+        return FakeI2cPort(self, address, eeprom)
+
+    @classmethod
+    def reset(cls):
+        cls.eeproms = {}
+        cls.configure_count = 0
+        cls.poll_count = 0
+        cls.unplugged = False
+
+
+class FakeI2cPort:
+    def __init__(self, controller, address, eeprom):
+        self.controller = controller
+        self.address = address
+        self.eeprom = eeprom
+
+    def _transaction(self):
+        if not self.controller.configured:
+            raise I2cIOError("FTDI controller not initialized")
+        if FakeI2cController.unplugged:
+            raise I2cIOError("USB transfer failed (device unplugged)")
+        time.sleep(self.controller.transaction_time)
+        if time.perf_counter() < self.eeprom.busy_until:
+            raise I2cIOError(f"NACK from slave 0x{self.address:02X} (write cycle)")
+
+    def poll(self, write=False, relax=True, start=True):
+        """ACK polling - 쓰기 사이클 중이면 NACK(False)"""
+        if not self.controller.configured:
+            raise I2cIOError("FTDI controller not initialized")
+        if FakeI2cController.unplugged:
+            raise I2cIOError("USB transfer failed (device unplugged)")
+        time.sleep(self.controller.transaction_time)
+        FakeI2cController.poll_count += 1
+        return time.perf_counter() >= self.eeprom.busy_until
+
+    def write_to(self, regaddr, out, relax=True, start=True):
+        self.write(bytes([regaddr]) + bytes(out), relax, start)
+
+    def write(self, out, relax=True, start=True):
+        self._transaction()
+        out = bytes(out)
+        if len(out) < 1:
+            return
+        regaddr, data = out[0], out[1:]
+        if not data:
+            return  # 주소만 쓰기 (ACK polling / 읽기 포인터 설정)
+        eeprom = self.eeprom
+        page_start = regaddr - regaddr % eeprom.page_size
+        for index, value in enumerate(data):
+            # 페이지 경계를 넘으면 같은 페이지 처음으로 감김 (실제 24Cxx 동작)
+            address = page_start + (regaddr - page_start + index) % eeprom.page_size
+            eeprom.memory[address] = value
+        eeprom.bytes_written += len(data)
+        eeprom.write_cycles += 1
+        eeprom.busy_until = time.perf_counter() + self.controller.write_cycle_time
+        self._pointer = (regaddr + len(data)) % len(eeprom.memory)
+
+    def read_from(self, regaddr, readlen=0, relax=True, start=True):
+        self._transaction()
+        memory = self.eeprom.memory
+        return bytes(memory[(regaddr + i) % len(memory)] for i in range(readlen))
+
+    def read(self, readlen=0, relax=True, start=True):
+        self._transaction()
+        pointer = getattr(self, '_pointer', 0)
+        memory = self.eeprom.memory
+        self._pointer = (pointer + readlen) % len(memory)
+        return bytes(memory[(pointer + i) % len(memory)] for i in range(readlen))
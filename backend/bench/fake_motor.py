@@ -0,0 +1,161 @@
+"""
+pty 기반 가짜 듀얼 모터 드라이버 (벤치마크용)
+- os.openpty()로 만든 가상 시리얼 포트의 master 쪽에서 모터 드라이버 프로토콜을 흉내냄
+- 상태 읽기(0x30) 명령에 0xAA55 상태 프레임으로 응답
+- 모드 명령(0x32)의 목표 위치/속도를 받아 시간에 따라 위치를 이동시킴
+- 응답 프레임의 sensor 필드에 시퀀스 번호를 넣고 송신 시각을 기록 (지연 측정용)
+"""
+
+import os
+import select
+import struct
+import threading
+import time
+import tty
+
+STATUS_CMD = 0x30
+MODE_CMD = 0x32
+
+# 상태 응답 프레임 레이아웃 (DualMotorController.parse_response 기준)
+# AA 55 | len | id | cmd | reg(2) | setPos(2) | actPos(2) | current(2) | force(2) | sensor(2) | checksum
+_STATUS_BODY = struct.Struct('<BBBHhhhhh')
+STATUS_FRAME_LENGTH = _STATUS_BODY.size - 2  # len 바이트 = cmd ~ payload 끝 길이 (len, id 제외)
+
+
+def build_status_frame(motor_id, set_pos, position, force=0, sensor=0, current=0):
+    """상태 응답 프레임 생성 (AA 55 헤더, little-endian 필드)"""
+    body = _STATUS_BODY.pack(STATUS_FRAME_LENGTH, motor_id, STATUS_CMD, 0x0000,
+                             set_pos, position, current, force, sensor)
+    checksum = sum(body) & 0xFF
+    return b'\xAA\x55' + body + bytes([checksum])
+
+
+class _MotorState:
+    def __init__(self):
+        self.position = 0
+        self.target = 0
+        self.speed = 0
+        self.last_update = time.perf_counter()
+        self.status_reads = 0
+        self.mode_commands = 0
+
+    def advance(self, default_speed):
+        now = time.perf_counter()
+        dt = now - self.last_update
+        self.last_update = now
+        speed = self.speed or default_speed
+        step = int(speed * dt)
+        if self.position < self.target:
+            self.position = min(self.target, self.position + max(step, 0))
+        elif self.position > self.target:
+            self.position = max(self.target, self.position - max(step, 0))
+
+
+class FakeDualMotor:
+    """
+    가짜 모터 드라이버
+
+    Args:
+        turnaround: 명령 수신 후 응답까지의 드라이버 처리 시간 (초)
+        default_speed: 속도가 0인 명령(servo/position)의 이동 속도 (단위/초)
+    """
+
+    def __init__(self, turnaround=0.0, default_speed=4000):
+        self.turnaround = turnaround
+        self.default_speed = default_speed
+        self.master_fd, self._slave_fd = os.openpty()
+        tty.setraw(self.master_fd)
+        tty.setraw(self._slave_fd)
+        self.port = os.ttyname(self._slave_fd)
+        self.motors = {0x01: _MotorState(), 0x02: _MotorState()}
+        self.sent_at = {}  # (motor_id, seq) -> 송신 시각 (perf_counter)
+        self.frames_sent = 0
+        self._seq = 0
+        self._running = False
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._running = False
+        if self._thread:
+            self._thread.join(timeout=1)
+        for fd in (self.master_fd, self._slave_fd):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+        return False
+
+    def _serve(self):
+        buffer = bytearray()
+        while self._running:
+            try:
+                ready, _, _ = select.select([self.master_fd], [], [], 0.05)
+            except (OSError, ValueError):
+                break
+            if not ready:
+                continue
+            try:
+                buffer += os.read(self.master_fd, 4096)
+            except OSError:
+                break
+
+            while True:
+                start = buffer.find(b'\x55\xAA')
+                if start < 0:
+                    del buffer[:max(len(buffer) - 1, 0)]
+                    break
+                if start:
+                    del buffer[:start]
+                if len(buffer) < 3:
+                    break
+                frame_size = buffer[2] + 5
+                if len(buffer) < frame_size:
+                    break
+                frame = bytes(buffer[:frame_size])
+                del buffer[:frame_size]
+                self._handle(frame)
+
+    def _handle(self, frame):
+        motor_id = frame[3]
+        command_type = frame[4]
+        motor = self.motors.get(motor_id)
+        if motor is None:
+            return
+
+        if command_type == MODE_CMD:
+            motor.advance(self.default_speed)
+            motor.mode_commands += 1
+            if frame[2] == 0x0D:
+                speed, target = struct.unpack_from('<Hh', frame, 13)
+                motor.speed = speed
+                motor.target = target
+            return
+
+        if command_type != STATUS_CMD:
+            return
+
+        motor.advance(self.default_speed)
+        motor.status_reads += 1
+        if self.turnaround:
+            time.sleep(self.turnaround)
+
+        with self._lock:
+            self._seq = (self._seq + 1) & 0x7FFF
+            seq = self._seq
+        response = build_status_frame(motor_id, motor.target, motor.position, sensor=seq)
+        self.sent_at[(motor_id, seq)] = time.perf_counter()
+        os.write(self.master_fd, response)
+        self.frames_sent += 1
@@ -0,0 +1,118 @@
+"""
+pty 기반 Modbus RTU 저항계 시뮬레이터 (벤치마크용)
+- pty 두 쌍을 브리지 스레드로 이어서 가상 시리얼 케이블을 만듦 (client_port ↔ server_port)
+  선택적으로 baudrate에 맞춰 바이트 전송 시간을 흉내냄 (8N1 = 바이트당 10비트)
+- server_port에서 pymodbus ModbusSerialServer(RTU)가 slave 1/2의 holding register 0에 응답
+  (프레이밍/CRC/slave 주소 처리/없는 slave 무응답은 pymodbus 그대로)
+- 측정값 변경(set_resistance)과 잡음/이상치는 브리지에서 응답 레지스터 값을 바꾸고 CRC를 다시 계산해서 넣음
+  (pymodbus 버전마다 데이터스토어 API가 달라서 응답 단계에서 처리)
+"""
+
+import asyncio
+import os
+import random
+import select
+import threading
+import time
+import tty
+
+from pymodbus.datastore import ModbusSequentialDataBlock, ModbusServerContext
+from pymodbus.framer import FramerType
+from pymodbus.server import ModbusSerialServer
+
+try:
+    from pymodbus.datastore import ModbusDeviceContext as _DeviceContext
+except ImportError:  # pymodbus < 3.10
+    from pymodbus.datastore import ModbusSlaveContext as _DeviceContext
+
+
+def _open_pty():
+    master, slave = os.openpty()
+    tty.setraw(master)
+    tty.setraw(slave)
+    return master, slave, os.ttyname(slave)
+
+
+def modbus_crc(data):
+    crc = 0xFFFF
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+    return crc.to_bytes(2, 'little')
+
+
+class ResistanceSimulator:
+    """
+    Args:
+        values: slave ID → 저항값(mΩ)
+        baudrate: 0이면 전송 지연 없음, 아니면 바이트당 10/baudrate초 지연
+        noise: 읽을 때마다 더할 ± 잡음 (mΩ)
+        outlier_rate: 읽기마다 이상치(값 x10)가 나올 확률
+    """
+
+    def __init__(self, values=None, baudrate=0, noise=0, outlier_rate=0.0):
+        self.values = dict(values or {1: 1234, 2: 5678})
+        self.baudrate = baudrate
+        self.noise = noise
+        self.outlier_rate = outlier_rate
+        self._client_master, self._client_slave, self.client_port = _open_pty()
+        self._server_master, self._server_slave, self.server_port = _open_pty()
+        self._running = False
+        self.responses = 0
+
+    def start(self):
+        self._running = True
+        threading.Thread(target=self._bridge, daemon=True).start()
+        threading.Thread(target=self._serve, daemon=True).start()
+        time.sleep(0.5)  # 서버가 포트를 열 때까지 대기
+        return self
+
+    def stop(self):
+        self._running = False
+
+    def set_resistance(self, slave_id, value):
+        self.values[slave_id] = value
+
+    def _sample(self, slave_id):
+        value = self.values[slave_id]
+        if self.outlier_rate and random.random() < self.outlier_rate:
+            value *= 10  # 접촉 불량 같은 순간 이상치
+        elif self.noise:
+            value += random.randint(-self.noise, self.noise)
+        return max(0, min(0xFFFF, value))
+
+    def _rewrite_response(self, data):
+        """holding register 1개 읽기 응답(7바이트)의 값을 현재 설정값으로 교체"""
+        if len(data) == 7 and data[1] == 0x03 and data[2] == 0x02 and data[0] in self.values:
+            body = bytes(data[:3]) + self._sample(data[0]).to_bytes(2, 'big')
+            self.responses += 1
+            return body + modbus_crc(body)
+        return data
+
+    def _bridge(self):
+        peers = {self._client_master: self._server_master, self._server_master: self._client_master}
+        while self._running:
+            readable, _, _ = select.select(list(peers), [], [], 0.1)
+            for fd in readable:
+                data = os.read(fd, 4096)
+                if fd == self._server_master:
+                    data = self._rewrite_response(data)
+                if self.baudrate:
+                    time.sleep(len(data) * 10 / self.baudrate)
+                os.write(peers[fd], data)
+
+    def _serve(self):
+        devices = {slave_id: _DeviceContext(hr=ModbusSequentialDataBlock(1, [value] * 4))
+                   for slave_id, value in self.values.items()}
+        try:
+            context = ModbusServerContext(devices=devices, single=False)
+        except TypeError:  # pymodbus < 3.10
+            context = ModbusServerContext(slaves=devices, single=False)
+
+        async def main():
+            server = ModbusSerialServer(context, framer=FramerType.RTU, port=self.server_port,
+                                        baudrate=self.baudrate or 9600)
+            await server.serve_forever()
+
+        asyncio.run(main())
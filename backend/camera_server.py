@@ -11,17 +11,50 @@ import subprocess
 import os
 import sys
 import argparse
+import io
+import zipfile
+import itertools
+from collections import deque, namedtuple
+
+import numpy as np
+
+# libjpeg-turbo 인코더 (선택 사항 - 없으면 OpenCV 인코더 사용)
+try:
+    import turbojpeg
+except ImportError:
+    turbojpeg = None
+
+try:
+    import simplejpeg
+except ImportError:
+    simplejpeg = None
 
 app = Flask(__name__)
-CORS(app)
+# 프레임 헤더는 Electron(fetch)에서 읽을 수 있도록 노출
+CORS(app, expose_headers=['X-Frame-Seq', 'X-Frame-Timestamp', 'X-Frame-Monotonic', 'X-Frame-Age-Ms', 'X-Burst-Count'])
+
+# 카메라 설정 (카메라마다 따로 지정 가능)
+# passthrough: 카메라가 보낸 MJPEG를 디코딩/재인코딩 없이 스트림으로 전달 (--no-passthrough로 끄기)
+# stream_quality: 스트림 JPEG 품질 (None = pass-through 원본 또는 기본 품질 95)
+# capture_quality: /capture JPEG 품질
+# max_errors: 연속 읽기 오류가 이 횟수가 되면 카메라 재초기화, reopen_delay: 해제 후 다시 열기까지 대기 (초)
+# subsampling: 재인코딩 JPEG 색차 서브샘플링 ("444", "422", "420" - 420이 가장 작고 빠름, OpenCV 기본값과 같음)
+# burst_frames: 최근 프레임 링 버퍼 크기 (/capture_burst 최대 장수, 30fps에서 30 = 1초)
+CameraSettings = namedtuple(
+    "CameraSettings",
+    "width height fps passthrough stream_quality capture_quality max_errors reopen_delay subsampling burst_frames",
+    defaults=(960, 720, 30, True, None, 90, 10, 2.0, "420", 30),
+)
 
-# 전역 카메라 객체
-cap = None
-cap2 = None
+# 시청자별 스트림 옵션 (/video?quality=&scale=&fps=&kbps=)
+# quality: JPEG 품질 (없으면 카메라 stream_quality, kbps가 있으면 자동 조정의 상한)
+# scale: 축소 비율 (0 < scale <= 1, 예: 0.5 → 480x360 썸네일)
+# max_fps: 목표 전송 FPS (마감 시각 기준), kbps: 목표 비트레이트 (품질 자동 조정 + 초과 시 프레임 건너뜀)
+StreamOptions = namedtuple("StreamOptions", "quality scale max_fps kbps", defaults=(None, 1.0, None, None))
 
-# 카메라 인덱스 (커맨드라인 인수로 받음)
-camera_index_1 = None
-camera_index_2 = None
+# 카메라 인덱스 목록 (커맨드라인 인수로 받음, 순서대로 카메라 ID 1, 2, ...)
+camera_indices = []
+camera_settings = CameraSettings()
 
 # 종료 플래그
 shutdown_flag = False
@@ -148,12 +181,541 @@ def find_available_cameras(limit=10):
     print(f"[INFO] 사용 가능한 카메라: {available_cameras}")
     return available_cameras
 
+def _standard_huffman_tables():
+    """OpenCV(libjpeg) 기본 인코딩 결과에서 표준 Huffman 테이블(DHT) 세그먼트 추출"""
+    _, buffer = cv2.imencode('.jpg', np.zeros((8, 8, 3), np.uint8))
+    data = buffer.tobytes()
+    segments = []
+    pos = 2
+    while pos + 4 <= len(data) and data[pos + 1] != 0xDA:
+        length = int.from_bytes(data[pos + 2:pos + 4], 'big')
+        if data[pos + 1] == 0xC4:
+            segments.append(data[pos:pos + 2 + length])
+        pos += 2 + length
+    return b''.join(segments)
+
+STANDARD_HUFFMAN_TABLES = _standard_huffman_tables()
+
+def with_huffman_tables(jpeg):
+    """
+    UVC MJPEG 프레임은 Huffman 테이블(DHT)을 생략하는 경우가 있음 (표준 테이블 사용 전제)
+    → 헤더에 DHT가 없으면 SOS 앞에 표준 테이블을 넣어서 브라우저/디코더가 읽을 수 있는 JPEG로 만듦
+    """
+    pos = 2
+    while pos + 4 <= len(jpeg) and jpeg[pos] == 0xFF:
+        marker = jpeg[pos + 1]
+        if marker == 0xC4:
+            return jpeg
+        if marker == 0xDA:
+            return jpeg[:pos] + STANDARD_HUFFMAN_TABLES + jpeg[pos:]
+        pos += 2 + int.from_bytes(jpeg[pos + 2:pos + 4], 'big')
+    return jpeg
+
+# 축소 비율 → JPEG 축소 디코딩 플래그 (libjpeg DCT 축소, 전체 디코딩 + resize보다 빠름)
+_REDUCED_DECODE_FLAGS = {0.5: cv2.IMREAD_REDUCED_COLOR_2, 0.25: cv2.IMREAD_REDUCED_COLOR_4, 0.125: cv2.IMREAD_REDUCED_COLOR_8}
+
+JPEG_EOI_SEARCH = 32  # EOI(FFD9) 뒤에 붙는 드라이버 패딩을 감안해 끝부분에서 찾을 바이트 수
+
+
+def is_jpeg_buffer(frame):
+    """
+    retrieve() 결과가 압축된 JPEG 버퍼(1차원/1행 uint8)인지 확인 (CAP_PROP_CONVERT_RGB=0 지원 여부)
+    SOI(FFD8)로 시작하고 끝부분에 EOI(FFD9)가 있어야 함 → 잘린 MJPEG 버퍼는 False
+    """
+    return bool(frame is not None and frame.dtype == np.uint8 and frame.size > 4
+                and (frame.ndim == 1 or (frame.ndim == 2 and frame.shape[0] == 1))
+                and frame.flat[0] == 0xFF and frame.flat[1] == 0xD8
+                and b'\xff\xd9' in frame.ravel()[-JPEG_EOI_SEARCH:].tobytes())
+
+# JPEG 인코더 (모두 BGR uint8 프레임 → JPEG bytes, 실패 시 None)
+# quality None은 OpenCV 기본 품질(95)과 같게 맞춤
+JPEG_DEFAULT_QUALITY = 95
+JPEG_SUBSAMPLINGS = ("444", "422", "420")
+
+class OpenCVJpegEncoder:
+    """cv2.imencode (항상 사용 가능)"""
+    name = "opencv"
+    _SAMPLING_FACTORS = {
+        "444": cv2.IMWRITE_JPEG_SAMPLING_FACTOR_444,
+        "422": cv2.IMWRITE_JPEG_SAMPLING_FACTOR_422,
+        "420": cv2.IMWRITE_JPEG_SAMPLING_FACTOR_420,
+    }
+
+    def encode(self, frame, quality=None, subsampling="420"):
+        params = [cv2.IMWRITE_JPEG_QUALITY, quality or JPEG_DEFAULT_QUALITY,
+                  cv2.IMWRITE_JPEG_SAMPLING_FACTOR, self._SAMPLING_FACTORS[subsampling]]
+        ret, buffer = cv2.imencode('.jpg', frame, params)
+        return buffer.tobytes() if ret else None
+
+class TurboJpegEncoder:
+    """PyTurboJPEG (시스템 libturbojpeg 필요)"""
+    name = "turbojpeg"
+
+    def __init__(self):
+        self._jpeg = turbojpeg.TurboJPEG()  # 라이브러리를 찾지 못하면 예외
+        self._subsamplings = {"444": turbojpeg.TJSAMP_444, "422": turbojpeg.TJSAMP_422, "420": turbojpeg.TJSAMP_420}
+
+    def encode(self, frame, quality=None, subsampling="420"):
+        return self._jpeg.encode(frame, quality=quality or JPEG_DEFAULT_QUALITY, pixel_format=turbojpeg.TJPF_BGR,
+                                 jpeg_subsample=self._subsamplings[subsampling])
+
+class SimpleJpegEncoder:
+    """simplejpeg (libjpeg-turbo 내장 wheel)"""
+    name = "simplejpeg"
+
+    def encode(self, frame, quality=None, subsampling="420"):
+        if not frame.flags['C_CONTIGUOUS']:
+            frame = np.ascontiguousarray(frame)
+        return simplejpeg.encode_jpeg(frame, quality=quality or JPEG_DEFAULT_QUALITY, colorspace='BGR',
+                                      colorsubsampling=subsampling)
+
+JPEG_ENCODERS = {"turbojpeg": TurboJpegEncoder, "simplejpeg": SimpleJpegEncoder, "opencv": OpenCVJpegEncoder}
+
+def available_jpeg_encoders():
+    """이 환경에서 쓸 수 있는 인코더 이름 (빠른 순)"""
+    names = []
+    if turbojpeg is not None:
+        try:
+            turbojpeg.TurboJPEG()
+            names.append("turbojpeg")
+        except Exception:
+            pass
+    if simplejpeg is not None:
+        names.append("simplejpeg")
+    names.append("opencv")
+    return names
+
+def create_jpeg_encoder(name="auto"):
+    """
+    JPEG 인코더 생성 - auto는 turbojpeg > simplejpeg > opencv 순으로 사용 가능한 것
+    지정한 인코더를 쓸 수 없으면 경고 후 다음 후보로 대체 (opencv는 항상 사용 가능)
+    """
+    if name != "auto" and name not in JPEG_ENCODERS:
+        raise ValueError(f"알 수 없는 JPEG 인코더: {name} (auto, {', '.join(JPEG_ENCODERS)})")
+    candidates = list(JPEG_ENCODERS) if name == "auto" else [name] + [key for key in JPEG_ENCODERS if key != name]
+    for candidate in candidates:
+        if (candidate == "turbojpeg" and turbojpeg is None) or (candidate == "simplejpeg" and simplejpeg is None):
+            continue
+        try:
+            encoder = JPEG_ENCODERS[candidate]()
+        except Exception as e:
+            if name != "auto":
+                print(f"[WARN] JPEG 인코더 {candidate} 초기화 실패: {e}")
+            continue
+        if name not in ("auto", candidate):
+            print(f"[WARN] JPEG 인코더 {name}을(를) 사용할 수 없음 → {candidate} 사용")
+        return encoder
+
+# 전역 JPEG 인코더 (--jpeg-encoder로 변경)
+jpeg_encoder = create_jpeg_encoder()
+
+class FramePacket:
+    """
+    캡처 스레드가 게시한 프레임 1장
+    - pass-through 모드: raw(카메라 MJPEG)만 있고 frame(BGR)은 픽셀이 필요할 때 한 번만 디코딩
+    - (품질, 축소 비율)별 JPEG와 축소 프레임은 처음 요청될 때 한 번만 만들어서 보관 (같은 설정의 시청자끼리 공유)
+    - 디코딩/인코딩 잠금은 프레임마다 따로 → 버스트 캡처가 지난 프레임을 인코딩해도 실시간 스트림은 기다리지 않음
+    """
+    __slots__ = ("seq", "timestamp", "monotonic", "frame", "raw", "jpegs", "scaled", "lock")
+
+    def __init__(self, seq, timestamp, monotonic, frame=None, raw=None):
+        self.seq = seq
+        self.timestamp = timestamp  # 캡처 시각 (epoch 초)
+        self.monotonic = monotonic  # 캡처 시각 (time.perf_counter, 프레임 간격 계산용)
+        self.frame = frame
+        self.raw = raw
+        self.jpegs = {}   # (JPEG 품질(None=기본), 축소 비율) → 인코딩 결과
+        self.scaled = {}  # 축소 비율 → 축소 프레임
+        self.lock = threading.RLock()  # 같은 프레임을 여러 클라이언트가 동시에 디코딩/인코딩하지 않도록
+
+class CameraBroadcaster:
+    """
+    카메라 1대 공유 캡처
+    - 캡처 스레드 1개만 카메라에서 grab/retrieve하고 최신 프레임을 슬롯에 게시
+    - /video 스트림 클라이언트와 /capture는 모두 슬롯에서 읽음 (카메라 직접 접근 없음)
+    - 최근 burst_frames장은 미리 할당한 링 버퍼에 순번별로 보관 (/capture_burst가 연속 프레임을 빠짐없이 읽음)
+    - JPEG는 프레임마다 품질별로 한 번만 인코딩해서 모든 클라이언트가 공유
+      → 시청자 수가 늘어도 grab/인코딩 CPU는 그대로, 시청자가 없으면 인코딩하지 않음
+    - passthrough: CAP_PROP_CONVERT_RGB=0으로 카메라 MJPEG 버퍼를 그대로 받아 스트림에 전달
+      (디코딩은 /capture 등 픽셀이 필요할 때만, 카메라/백엔드가 지원하지 않으면 디코딩 모드로 동작)
+    """
+
+    def __init__(self, index, label, settings=None):
+        self.index = index
+        self.label = label  # 로그용 이름 (예: "카메라 1")
+        self.settings = settings or CameraSettings()
+        self.passthrough_active = False  # 카메라가 실제로 압축 버퍼를 주는지 (open에서 확인)
+        self.cap = None
+        self._packet = None
+        self._latest_encoded = None  # 마지막으로 인코딩한 원본 크기 (프레임, JPEG) - /capture?mode=latest용
+        self._seq = 0
+        self._ring = [None] * self.settings.burst_frames  # 순번 % 크기 → 프레임
+        self._condition = threading.Condition()  # 새 프레임 게시 알림
+        self._stop_event = threading.Event()
+        self._thread = None
+
+        # 통계
+        self._clients = []  # 스트림 시청자별 StreamAdapter (전송/놓침/지연 카운터)
+        self.frames = 0
+        self.encodes = 0
+        self.decodes = 0
+        self.reopens = 0
+        self._frame_times = deque(maxlen=60)
+
+    def open(self):
+        """카메라 열기 + 설정 적용 + 워밍업"""
+        print(f"[INFO] {self.label} (인덱스: {self.index}) 초기화 중...")
+        cap = cv2.VideoCapture(self.index, cv2.CAP_DSHOW)
+        if not cap.isOpened():
+            print(f"[ERROR] 카메라 (인덱스: {self.index}) 초기화 실패")
+            self.cap = None
+            return False
+
+        # 카메라 설정 적용
+        passthrough = self.settings.passthrough
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.settings.width)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.settings.height)
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        cap.set(cv2.CAP_PROP_FPS, self.settings.fps)  # FPS 설정
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc('M', 'J', 'P', 'G'))  # MJPEG 코덱
+        if passthrough:
+            cap.set(cv2.CAP_PROP_CONVERT_RGB, 0)  # 디코딩하지 않은 MJPEG 버퍼 요청
+
+        time.sleep(1.0)  # 카메라 안정화 대기 시간 증가
+
+        # 워밍업: 몇 개의 더미 프레임 읽기
+        print(f"[INFO] 카메라 {self.index} 워밍업 중...")
+        frame = None
+        for i in range(5):
+            ret, frame = cap.read()
+            if ret:
+                print(f"[DEBUG] 카메라 {self.index} 워밍업 프레임 {i+1}/5 성공")
+            else:
+                print(f"[WARN] 카메라 {self.index} 워밍업 프레임 {i+1}/5 실패")
+            time.sleep(0.1)
+
+        self.passthrough_active = passthrough and is_jpeg_buffer(frame)
+        if passthrough and not self.passthrough_active:
+            print(f"[WARN] 카메라 {self.index}: MJPEG 버퍼를 받을 수 없음 → 디코딩 모드로 동작")
+            cap.set(cv2.CAP_PROP_CONVERT_RGB, 1)
+        elif self.passthrough_active:
+            print(f"[INFO] 카메라 {self.index}: MJPEG pass-through 모드")
+
+        self.cap = cap
+        print(f"[OK] 카메라 (인덱스: {self.index}) 초기화 완료")
+        return True
+
+    def start(self):
+        """카메라를 열고 캡처 스레드 시작 (열기 실패 시 False)"""
+        if not self.open():
+            return False
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name=f"capture-{self.index}", daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self):
+        """캡처 스레드 종료 후 카메라 해제"""
+        self._stop_event.set()
+        with self._condition:
+            self._condition.notify_all()  # 프레임을 기다리는 클라이언트 깨우기
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2.0)
+        self._thread = None
+        self._release()
+
+    def _release(self):
+        cap, self.cap = self.cap, None
+        if cap is not None:
+            try:
+                if cap.isOpened():
+                    print(f"[DEBUG] {self.label} 해제 시도...")
+                    cap.release()
+                    print(f"[OK] {self.label} 해제 완료")
+            except Exception as e:
+                print(f"[WARN] {self.label} 해제 중 오류: {e}")
+
+    def _reopen(self):
+        """연속 오류 → 이 카메라만 다시 열기 (다른 카메라 스트림은 영향 없음)"""
+        print(f"[ERROR] {self.label} 최대 오류 횟수 초과, 카메라 재초기화 시도")
+        self._release()
+        self.reopens += 1
+        self._stop_event.wait(self.settings.reopen_delay)  # DirectShow가 리소스를 해제하는 데 시간이 필요
+        if not self._stop_event.is_set():
+            self.open()
+
+    def is_stopped(self):
+        return self._stop_event.is_set()
+
+    def is_connected(self):
+        return self._thread is not None and self._thread.is_alive() and self.cap is not None
+
+    def _run(self):
+        error_count = 0
+        while not self._stop_event.is_set() and not shutdown_flag:
+            if self.cap is None:
+                self._reopen()  # 재초기화 실패 → 다시 시도
+                continue
+
+            try:
+                # 항상 최신 프레임을 가져오기 위해 grab() 후 retrieve() 사용
+                if not self.cap.grab():
+                    error_count += 1
+                    print(f"[ERROR] {self.label}에서 프레임 grab 실패 ({error_count}/{self.settings.max_errors})")
+                    success = False
+                else:
+                    success, frame = self.cap.retrieve()
+                    if success and self.passthrough_active and not is_jpeg_buffer(frame):
+                        success = False  # 잘린/손상된 MJPEG 버퍼
+                    if not success:
+                        error_count += 1
+                        print(f"[ERROR] {self.label}에서 프레임 읽기 실패 ({error_count}/{self.settings.max_errors})")
+            except Exception as e:
+                error_count += 1
+                print(f"[ERROR] {self.label} 예외 발생 ({error_count}/{self.settings.max_errors}): {e}")
+                success = False
+
+            if not success:
+                if error_count >= self.settings.max_errors:
+                    self._reopen()
+                    error_count = 0
+                else:
+                    self._stop_event.wait(0.5)
+                continue
+
+            # 성공적으로 프레임을 읽었으면 에러 카운터 리셋
+            error_count = 0
+            self._publish(frame)
+
+    def _publish(self, frame):
+        raw = frame.tobytes() if self.passthrough_active else None  # 드라이버 버퍼 재사용 대비 복사
+        now = time.perf_counter()
+        with self._condition:
+            self._seq += 1
+            if raw is not None:
+                self._packet = FramePacket(self._seq, time.time(), now, raw=raw)
+            else:
+                self._packet = FramePacket(self._seq, time.time(), now, frame=frame)
+            self._ring[self._seq % len(self._ring)] = self._packet
+            self.frames += 1
+            self._frame_times.append(now)
+            self._condition.notify_all()
+
+    def wait_packet(self, last_seq=0, timeout=1.0):
+        """last_seq보다 새 프레임이 게시될 때까지 대기 (timeout/종료 시 None)"""
+        with self._condition:
+            self._condition.wait_for(lambda: self._seq > last_seq or self._stop_event.is_set(), timeout)
+            packet = self._packet
+        return packet if packet is not None and packet.seq > last_seq else None
+
+    def get_packet(self, seq, timeout=1.0):
+        """
+        순번 seq 프레임 (링 버퍼) - 아직 게시 전이면 게시될 때까지 대기 (timeout/종료 시 None)
+        링에서 이미 밀려난 순번이면 남아 있는 가장 오래된 프레임
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._seq >= seq or self._stop_event.is_set(), timeout)
+            if self._seq < seq:
+                return None
+            seq = max(seq, self._seq - len(self._ring) + 1)
+            packet = self._ring[seq % len(self._ring)]
+        return packet if packet is not None and packet.seq == seq else None
+
+    def iter_burst(self, count, interval=0.0, after=None):
+        """
+        연속 프레임 count장 (링 버퍼에서 순번 순서대로 - 카메라/실시간 스트림에는 영향 없음)
+        interval: 고른 프레임 사이 최소 간격 (초, 0이면 연속 프레임 전부, 카메라 프레임 시각 흔들림은 반 프레임까지 허용)
+        after: 이 순번 다음 프레임부터 (링에 남아 있으면 지난 프레임도 바로 반환), None이면 현재 최신 프레임부터
+        """
+        if after is None:
+            latest = self.wait_packet()
+            if latest is None:
+                return
+            seq = latest.seq
+        else:
+            seq = after + 1
+        tolerance = 0.5 / self.settings.fps
+        last_time = None
+        selected = 0
+        while selected < count:
+            packet = self.get_packet(seq, timeout=max(1.0, interval * 2))
+            if packet is None:
+                return  # 카메라 정리됨 또는 프레임 없음
+            seq = packet.seq + 1
+            if last_time is not None and packet.monotonic - last_time < interval - tolerance:
+                continue
+            last_time = packet.monotonic
+            selected += 1
+            yield packet
+
+    def decode_frame(self, packet):
+        """프레임 BGR 픽셀 (pass-through 프레임은 처음 요청될 때 한 번만 디코딩, 실패 시 None)"""
+        if packet.frame is None and packet.raw is not None:
+            with packet.lock:
+                if packet.frame is None:
+                    packet.frame = cv2.imdecode(np.frombuffer(packet.raw, np.uint8), cv2.IMREAD_COLOR)
+                    self.decodes += 1
+                    if packet.frame is None:
+                        print(f"[ERROR] {self.label} MJPEG 프레임 디코딩 실패")
+        return packet.frame
+
+    def scaled_frame(self, packet, scale=1.0):
+        """
+        축소 프레임 (비율별로 한 번만 생성, 실패 시 None)
+        pass-through 프레임을 1/2, 1/4, 1/8로 줄일 때는 JPEG 축소 디코딩으로 바로 만듦
+        """
+        if scale >= 1.0:
+            return self.decode_frame(packet)
+        frame = packet.scaled.get(scale)
+        if frame is None:
+            with packet.lock:
+                frame = packet.scaled.get(scale)
+                if frame is None:
+                    flag = _REDUCED_DECODE_FLAGS.get(scale)
+                    if flag is not None and packet.frame is None and packet.raw is not None:
+                        frame = cv2.imdecode(np.frombuffer(packet.raw, np.uint8), flag)
+                        self.decodes += 1
+                    else:
+                        full = self.decode_frame(packet)
+                        if full is None:
+                            return None
+                        height, width = full.shape[:2]
+                        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+                        frame = cv2.resize(full, size, interpolation=cv2.INTER_AREA)
+                    packet.scaled[scale] = frame
+        return frame
+
+    def encode_jpeg(self, packet, quality=None, scale=1.0):
+        """
+        프레임 JPEG (같은 프레임/품질/축소 비율은 한 번만 인코딩, 실패 시 None)
+        pass-through 프레임 + 기본 품질 + 원본 크기면 카메라 MJPEG를 그대로 사용 (디코딩/재인코딩 없음)
+        """
+        key = (quality, scale)
+        jpeg = packet.jpegs.get(key)
+        if jpeg is None and quality is None and scale >= 1.0 and packet.raw is not None:
+            jpeg = packet.jpegs[key] = with_huffman_tables(packet.raw)
+        if jpeg is None:
+            with packet.lock:
+                jpeg = packet.jpegs.get(key)
+                if jpeg is None:
+                    frame = self.scaled_frame(packet, scale)
+                    if frame is None:
+                        return None
+                    try:
+                        jpeg = jpeg_encoder.encode(frame, quality, self.settings.subsampling)
+                    except Exception as e:
+                        print(f"[ERROR] {self.label} 프레임 인코딩 오류 ({jpeg_encoder.name}): {e}")
+                        jpeg = None
+                    if jpeg is None:
+                        print(f"[ERROR] {self.label} 프레임 인코딩 실패")
+                        return None
+                    packet.jpegs[key] = jpeg
+                    self.encodes += 1
+                    if scale >= 1.0:
+                        self._latest_encoded = (packet, jpeg)
+        return jpeg
+
+    @property
+    def viewers(self):
+        return len(self._clients)
+
+    def latest_jpeg(self, packet, oldest_seq=0):
+        """
+        이미 만들어진 원본 크기 JPEG (새로 인코딩하지 않음) → (프레임, JPEG), 없으면 (packet, None)
+        pass-through 모드는 카메라 MJPEG, 디코딩 모드는 스트림 시청자가 인코딩해 둔 것 중 가장 높은 품질
+        최신 프레임이 아직 인코딩 전이면 oldest_seq 이상인 프레임 중 마지막으로 인코딩된 것 사용
+        """
+        if packet.raw is not None:
+            return packet, self.encode_jpeg(packet)  # DHT 삽입만 (디코딩/인코딩 없음)
+        encoded = [(quality or JPEG_DEFAULT_QUALITY, jpeg) for (quality, scale), jpeg in list(packet.jpegs.items())
+                   if scale >= 1.0]
+        if encoded:
+            return packet, max(encoded, key=lambda item: item[0])[1]
+        latest = self._latest_encoded
+        if latest is not None and latest[0].seq >= oldest_seq:
+            return latest
+        return packet, None
+
+    def add_viewer(self, client):
+        with self._condition:
+            self._clients.append(client)
+
+    def remove_viewer(self, client):
+        with self._condition:
+            self._clients.remove(client)
+
+    def get_stats(self):
+        times = list(self._frame_times)
+        return {
+            "index": self.index,
+            "connected": self.is_connected(),
+            "passthrough": self.passthrough_active,
+            "encoder": jpeg_encoder.name,
+            "viewers": self.viewers,
+            "frames": self.frames,
+            "encodes": self.encodes,
+            "decodes": self.decodes,
+            "reopens": self.reopens,
+            "fps": round((len(times) - 1) / (times[-1] - times[0]), 1) if len(times) > 1 and times[-1] > times[0] else None,
+            "clients": [client.get_stats() for client in list(self._clients)],
+        }
+
+class CameraPool:
+    """
+    카메라 N대 관리 (카메라 ID 1, 2, ... → CameraBroadcaster)
+    - 카메라마다 캡처 스레드/프레임 슬롯/설정/오류 재초기화가 독립
+      → 카메라 수와 관계없이 코드 경로는 하나, 비용은 카메라 수에 비례
+    - 열기에 실패한 카메라는 ID는 유지하고 None으로 등록 (연결 안 됨 응답)
+    """
+
+    def __init__(self):
+        self.cameras = {}
+
+    def __contains__(self, camera_id):
+        return camera_id in self.cameras
+
+    def get(self, camera_id):
+        return self.cameras.get(camera_id)
+
+    def start(self, indices, settings=None):
+        """
+        카메라 인덱스 목록 순서대로 ID 1, 2, ...를 붙여 열고 캡처 스레드 시작
+        settings: CameraSettings 하나(모든 카메라 공통) 또는 카메라별 목록
+        """
+        for camera_id, index in enumerate(indices, start=1):
+            camera = CameraBroadcaster(index, f"카메라 {camera_id}",
+                                       settings[camera_id - 1] if isinstance(settings, list) else settings)
+            try:
+                started = camera.start()
+            except Exception as e:
+                print(f"[ERROR] 카메라 {camera_id} (인덱스: {index}) 초기화 오류: {e}")
+                started = False
+            self.cameras[camera_id] = camera if started else None
+
+    def stop(self):
+        """모든 카메라 캡처 스레드 종료 후 해제 (카메라 사이 해제 대기 포함)"""
+        cameras, self.cameras = self.cameras, {}
+        for position, (camera_id, camera) in enumerate(cameras.items()):
+            if camera is None:
+                continue
+            if position:
+                time.sleep(0.3)  # 리소스 해제 대기
+            try:
+                camera.stop()
+            except Exception as e:
+                print(f"[WARN] 카메라 {camera_id} 해제 중 오류: {e}")
+
+    def get_stats(self):
+        return {str(camera_id): camera.get_stats() if camera else None
+                for camera_id, camera in self.cameras.items()}
+
+# 전역 카메라 풀
+camera_pool = CameraPool()
+
 def initialize_cameras():
-    """카메라 초기화 함수 - 커맨드라인 인수로 받은 카메라 인덱스 사용"""
-    global cap, cap2, camera_index_1, camera_index_2
-    
+    """카메라 초기화 함수 - 커맨드라인 인수로 받은 카메라 인덱스 사용 (카메라별 캡처 스레드 시작)"""
     print("[INFO] 카메라 초기화 시작...")
-    print(f"[INFO] 지정된 카메라 인덱스: Camera 1={camera_index_1}, Camera 2={camera_index_2}")
+    print(f"[INFO] 지정된 카메라 인덱스: " + ", ".join(f"Camera {camera_id}={index}" for camera_id, index in enumerate(camera_indices, start=1)))
     
     # 기존 카메라가 있다면 먼저 해제
     cleanup_cameras()
@@ -162,123 +724,30 @@ def initialize_cameras():
     print("[DEBUG] 카메라 리소스 해제 후 대기 중...")
     time.sleep(2.0)
     
+    if not camera_indices:
+        print("[ERROR] 카메라 인덱스가 지정되지 않았습니다.")
+        return
+
     try:
-        # 첫 번째 카메라 초기화
-        if camera_index_1 is not None:
-            cam_idx1 = camera_index_1
-            print(f"[INFO] 첫 번째 카메라 (인덱스: {cam_idx1}) 초기화 중...")
-            cap = cv2.VideoCapture(cam_idx1, cv2.CAP_DSHOW)
-            if cap.isOpened():
-                # 카메라 설정 적용
-                cap.set(cv2.CAP_PROP_FRAME_WIDTH, 960)
-                cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
-                cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
-                cap.set(cv2.CAP_PROP_FPS, 30)  # FPS 설정
-                cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc('M', 'J', 'P', 'G'))  # MJPEG 코덱
-                
-                time.sleep(1.0)  # 카메라 안정화 대기 시간 증가
-                
-                # 워밍업: 몇 개의 더미 프레임 읽기
-                print(f"[INFO] 카메라 {cam_idx1} 워밍업 중...")
-                for i in range(5):
-                    ret, _ = cap.read()
-                    if ret:
-                        print(f"[DEBUG] 카메라 {cam_idx1} 워밍업 프레임 {i+1}/5 성공")
-                    else:
-                        print(f"[WARN] 카메라 {cam_idx1} 워밍업 프레임 {i+1}/5 실패")
-                    time.sleep(0.1)
-                
-                print(f"[OK] 카메라 (인덱스: {cam_idx1}) 초기화 완료")
-            else:
-                print(f"[ERROR] 카메라 (인덱스: {cam_idx1}) 초기화 실패")
-                cap = None
-        else:
-            print("[ERROR] 첫 번째 카메라 인덱스가 지정되지 않았습니다.")
-            cap = None
-
-        # 두 번째 카메라 초기화
-        if camera_index_2 is not None:
-            cam_idx2 = camera_index_2
-            print(f"[INFO] 두 번째 카메라 (인덱스: {cam_idx2}) 초기화 중...")
-            cap2 = cv2.VideoCapture(cam_idx2, cv2.CAP_DSHOW)
-            if cap2.isOpened():
-                # 카메라 설정 적용
-                cap2.set(cv2.CAP_PROP_FRAME_WIDTH, 960)
-                cap2.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
-                cap2.set(cv2.CAP_PROP_BUFFERSIZE, 1)
-                cap2.set(cv2.CAP_PROP_FPS, 30)  # FPS 설정
-                cap2.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc('M', 'J', 'P', 'G'))  # MJPEG 코덱
-                
-                time.sleep(1.0)  # 카메라 안정화 대기 시간 증가
-                
-                # 워밍업: 몇 개의 더미 프레임 읽기
-                print(f"[INFO] 카메라 {cam_idx2} 워밍업 중...")
-                for i in range(5):
-                    ret, _ = cap2.read()
-                    if ret:
-                        print(f"[DEBUG] 카메라 {cam_idx2} 워밍업 프레임 {i+1}/5 성공")
-                    else:
-                        print(f"[WARN] 카메라 {cam_idx2} 워밍업 프레임 {i+1}/5 실패")
-                    time.sleep(0.1)
-                
-                print(f"[OK] 카메라 (인덱스: {cam_idx2}) 초기화 완료")
-            else:
-                print(f"[ERROR] 카메라 (인덱스: {cam_idx2}) 초기화 실패")
-                cap2 = None
-        else:
-            print("[INFO] 두 번째 카메라 인덱스가 지정되지 않았습니다.")
-            cap2 = None
-            
+        camera_pool.start(camera_indices, camera_settings)
     except Exception as e:
         print(f"[ERROR] 카메라 초기화 오류: {e}")
 
 def cleanup_cameras():
-    """카메라 리소스 정리"""
-    global cap, cap2
-    
+    """카메라 리소스 정리 (캡처 스레드 종료 후 해제)"""
     print("[INFO] 카메라 리소스 정리 중...")
     try:
-        # 첫 번째 카메라 해제
-        if cap is not None:
-            try:
-                if cap.isOpened():
-                    print("[DEBUG] 첫 번째 카메라 해제 시도...")
-                    cap.release()
-                    print("[OK] 첫 번째 카메라 해제 완료")
-            except Exception as e:
-                print(f"[WARN] 첫 번째 카메라 해제 중 오류: {e}")
-            finally:
-                cap = None
-        
-        # 리소스 해제 대기
-        time.sleep(0.3)
-        
-        # 두 번째 카메라 해제
-        if cap2 is not None:
-            try:
-                if cap2.isOpened():
-                    print("[DEBUG] 두 번째 카메라 해제 시도...")
-                    cap2.release()
-                    print("[OK] 두 번째 카메라 해제 완료")
-            except Exception as e:
-                print(f"[WARN] 두 번째 카메라 해제 중 오류: {e}")
-            finally:
-                cap2 = None
+        camera_pool.stop()
         
         # OpenCV 리소스 완전 해제를 위한 대기
         print("[DEBUG] 카메라 리소스 완전 해제 대기 중...")
-        time.sleep(0.5)
-        print("[DEBUG] 카메라 리소스 완전 해제 대기 중...")
-        time.sleep(0.5)
+        time.sleep(1.0)
         
         # cv2.destroyAllWindows()는 GUI 관련이므로 서버에서는 불필요
         
         print("[OK] 카메라 리소스 정리 완료")
     except Exception as e:
         print(f"[ERROR] 카메라 리소스 정리 중 오류: {e}")
-        # 오류가 발생해도 강제로 None 할당
-        cap = None
-        cap2 = None
 
 def signal_handler(sig, frame):
     """시그널 핸들러 - 프로그램 종료 시 카메라 정리"""
@@ -296,131 +765,167 @@ signal.signal(signal.SIGTERM, signal_handler)
 # 프로그램 종료 시 자동 정리
 atexit.register(cleanup_cameras)
 
-def generate_frames():
-    global cap, shutdown_flag
-    error_count = 0
-    max_errors = 10
-    frame_count = 0
-    
-    while not shutdown_flag:
-        if cap is None or not cap.isOpened():
-            print("[ERROR] 카메라 0번이 연결되지 않음")
-            break
-            
-        try:
-            # 항상 최신 프레임을 가져오기 위해 grab() 후 retrieve() 사용
-            grab_success = cap.grab()
-            if not grab_success:
-                error_count += 1
-                print(f"[ERROR] 카메라 0번에서 프레임 grab 실패 ({error_count}/{max_errors})")
-                time.sleep(0.5)
-                continue
+def parse_stream_options(args):
+    """쿼리 파라미터(quality, scale, fps, kbps) → StreamOptions (범위를 벗어나면 ValueError)"""
+    quality = args.get('quality', type=int)
+    scale = args.get('scale', 1.0, type=float)
+    max_fps = args.get('fps', type=float)
+    kbps = args.get('kbps', type=float)
+    if quality is not None and not 10 <= quality <= 100:
+        raise ValueError(f"quality는 10~100이어야 합니다: {quality}")
+    if not 0 < scale <= 1:
+        raise ValueError(f"scale은 0보다 크고 1 이하여야 합니다: {scale}")
+    if max_fps is not None and max_fps <= 0:
+        raise ValueError(f"fps는 0보다 커야 합니다: {max_fps}")
+    if kbps is not None and kbps <= 0:
+        raise ValueError(f"kbps는 0보다 커야 합니다: {kbps}")
+    return StreamOptions(quality=quality, scale=scale, max_fps=max_fps, kbps=kbps)
 
-            success, frame = cap.retrieve()
-            if not success:
-                error_count += 1
-                print(f"[ERROR] 카메라 0번에서 프레임 읽기 실패 ({error_count}/{max_errors})")
-                
-                if error_count >= max_errors:
-                    print("[ERROR] 카메라 0번 최대 오류 횟수 초과, 카메라 재초기화 시도")
-                    initialize_cameras()
-                    error_count = 0
-                    time.sleep(2)
-                    continue
-                    
-                time.sleep(0.5)
-                continue
-                
-        except Exception as e:
-            error_count += 1
-            print(f"[ERROR] 카메라 0번 예외 발생 ({error_count}/{max_errors}): {e}")
-            
-            if error_count >= max_errors:
-                print("[ERROR] 카메라 0번 최대 오류 횟수 초과, 카메라 재초기화 시도")
-                initialize_cameras()
-                error_count = 0
-                time.sleep(2)
-                continue
-                
-            time.sleep(0.5)
-            continue
+class StreamAdapter:
+    """
+    시청자 1명의 스트림 전송 간격/품질 조정 + 전송 통계
+    - 전송 간격: 목표 FPS(fps 옵션, 없으면 카메라 FPS) 마감 시각 기준 - 이전 마감 + 간격으로 잡아서
+      인코딩/쓰기 시간이 쌓여도 목표 FPS 유지, 마감을 한 간격 이상 넘기면 지각(late)으로 세고 현재 시각부터 다시 잡음
+    - 최신 프레임 우선: 인코딩/쓰기 중에 지나간 프레임은 보내지 않음(dropped) → 느린 클라이언트도 지연이 쌓이지 않음
+    - kbps: 프레임 크기가 (목표 비트레이트 / 전송 FPS) 예산을 넘으면 품질을 낮추고, 여유가 많으면 올림
+      실제 전송 간격도 프레임 크기/목표 비트레이트 이상으로 벌려서 목표를 넘지 않도록 프레임을 건너뜀
+    - 소켓 밀림: yield 후 돌아올 때까지 걸린 시간(= 클라이언트 소켓 쓰기 시간)이 프레임 간격보다 많이 길면
+      품질을 낮추고 그 시간만큼 다음 전송을 미룸
+    - 품질은 QUALITY_STEP 단위로만 바뀜 (같은 설정의 시청자끼리 인코딩 결과 공유)
+    """
 
-        # 성공적으로 프레임을 읽었으면 에러 카운터 리셋
-        error_count = 0
-        frame_count += 1
-        
-        ret, buffer = cv2.imencode('.jpg', frame)
-        if not ret:
-            print("[ERROR] 카메라 0번 프레임 인코딩 실패")
-            continue
-            
-        frame = buffer.tobytes()
+    QUALITY_MIN = 30
+    QUALITY_MAX = 95
+    QUALITY_STEP = 5
+    KBPS_START_QUALITY = 80     # kbps만 지정했을 때 시작 품질
+    CONGESTION_FACTOR = 2.0     # 쓰기 시간이 프레임 간격의 이 배수를 넘으면 소켓 밀림으로 판단
+    RECOVER_FRAMES = 30         # 밀림 없이 이만큼 보내면 품질을 한 단계 올림
 
-        yield (b'--frame\r\n'
-               b'Content-Type: image/jpeg\r\n\r\n' + frame + b'\r\n')
+    def __init__(self, options, camera_fps, default_quality=None, client=None):
+        self.options = options
+        self.client = client  # 클라이언트 주소 (통계 표시용)
+        self.frame_interval = 1.0 / camera_fps
+        self.min_interval = 1.0 / options.max_fps if options.max_fps else 0.0
+        # 품질 상한: 요청 품질 > kbps 시작 품질 > 카메라 기본 품질 (None이면 pass-through/기본 인코딩)
+        self.max_quality = options.quality or (self.KBPS_START_QUALITY if options.kbps else default_quality)
+        self.quality = self.max_quality
+        self.next_due = 0.0
+        self.last_seq = 0
+        self._clean_frames = 0
 
-def generate_frames2():
-    global cap2, shutdown_flag
-    error_count = 0
-    max_errors = 10
-    frame_count = 0
-    
-    while not shutdown_flag:
-        if cap2 is None or not cap2.isOpened():
-            print("[ERROR] 카메라 2번이 연결되지 않음")
-            break
-            
-        try:
-            # 항상 최신 프레임을 가져오기 위해 grab() 후 retrieve() 사용
-            grab_success = cap2.grab()
-            if not grab_success:
-                error_count += 1
-                print(f"[ERROR] 카메라 2번에서 프레임 grab 실패 ({error_count}/{max_errors})")
-                time.sleep(0.5)
-                continue
+        # 통계
+        self.started = time.time()
+        self.sent = 0               # 전송한 프레임
+        self.dropped = 0            # 인코딩/쓰기 중에 지나가서 못 본 프레임 (최신 프레임 우선)
+        self.skipped = 0            # 목표 FPS/비트레이트/소켓 밀림 때문에 건너뛴 프레임
+        self.late = 0               # 마감 시각을 한 간격 이상 넘겨서 보낸 프레임
+        self.congestion_events = 0
+        self.bytes_sent = 0
+        self._age_total = 0.0       # 전송 시점의 프레임 나이 합 (캡처 → 전송 시작)
 
-            success, frame = cap2.retrieve()
-            if not success:
-                error_count += 1
-                print(f"[ERROR] 카메라 2번에서 프레임 읽기 실패 ({error_count}/{max_errors})")
-                
-                if error_count >= max_errors:
-                    print("[ERROR] 카메라 2번 최대 오류 횟수 초과, 카메라 재초기화 시도")
-                    initialize_cameras()
-                    error_count = 0
-                    time.sleep(2)
-                    continue
-                    
-                time.sleep(0.5)
+    def accept(self, packet, now):
+        """새로 게시된 프레임을 지금 보낼지 결정 (놓친/건너뛴 프레임 집계)"""
+        if self.last_seq:
+            self.dropped += max(0, packet.seq - self.last_seq - 1)
+        self.last_seq = packet.seq
+        # 카메라 프레임 시각 흔들림 허용 (예: 30fps 카메라에서 15fps 요청 → 한 장 건너 한 장)
+        if now < self.next_due - self.frame_interval * 0.5:
+            self.skipped += 1
+            return False
+        return True
+
+    def _lower_quality(self, steps=1):
+        # 기본 품질(pass-through 포함)로 보내던 중이면 KBPS_START_QUALITY부터 낮춤
+        quality = self.KBPS_START_QUALITY if self.quality is None else self.quality
+        self.quality = max(self.QUALITY_MIN, quality - self.QUALITY_STEP * steps)
+
+    def on_sent(self, packet, size, send_start, send_time):
+        """프레임 1장 전송 후 호출 (size: JPEG 바이트, send_time: yield부터 다시 돌아올 때까지 걸린 시간)"""
+        self.sent += 1
+        self.bytes_sent += size
+        self._age_total += max(0.0, time.time() - send_time - packet.timestamp)
+
+        interval = max(self.min_interval, self.frame_interval)
+        if self.options.kbps:
+            target_bps = self.options.kbps * 1000
+            budget = target_bps / 8 * interval  # 프레임당 바이트 예산
+            if size > budget * 1.1:
+                self._lower_quality()
+            elif size < budget * 0.7 and self.quality < self.max_quality:
+                self.quality = min(self.max_quality, self.quality + self.QUALITY_STEP)
+            interval = max(interval, size * 8 / target_bps)
+
+        if send_time > self.frame_interval * self.CONGESTION_FACTOR:
+            self.congestion_events += 1
+            self._clean_frames = 0
+            self._lower_quality(2)
+            self.next_due = send_start + send_time + send_time  # 소켓이 비워질 시간만큼 추가로 건너뜀
+            return
+
+        self._clean_frames += 1
+        if self._clean_frames >= self.RECOVER_FRAMES and not self.options.kbps and self.quality != self.max_quality:
+            ceiling = self.max_quality or self.KBPS_START_QUALITY
+            # 상한에 도달하면 원래 설정(max_quality, None이면 기본 품질/pass-through)으로 복귀
+            self.quality = min(ceiling, self.quality + self.QUALITY_STEP) if self.quality < ceiling else self.max_quality
+            self._clean_frames = 0
+
+        due = self.next_due
+        if not due or send_start - due > interval:
+            if due:
+                self.late += 1
+            due = send_start  # 첫 프레임이거나 마감을 한 간격 이상 놓침 → 현재 시각부터 다시 잡음
+        self.next_due = due + interval
+
+    def get_stats(self):
+        elapsed = max(time.time() - self.started, 1e-6)
+        return {
+            "client": self.client,
+            "options": self.options._asdict(),
+            "quality": self.quality,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "skipped": self.skipped,
+            "late": self.late,
+            "congestion": self.congestion_events,
+            "fps": round(self.sent / elapsed, 1),
+            "kbps": round(self.bytes_sent * 8 / elapsed / 1000, 1),
+            "age_ms": round(self._age_total / self.sent * 1000, 1) if self.sent else None,
+        }
+
+def generate_frames(camera, label, options=None, client=None):
+    """
+    MJPEG 스트림 - 캡처 스레드가 게시한 최신 프레임을 목표 FPS에 맞춰 전송 (인코딩은 같은 설정의 클라이언트 간 공유)
+    options(StreamOptions)에 따라 품질/축소/목표 FPS/목표 비트레이트를 시청자별로 적용
+    시청자별 전송/놓침/건너뜀/지각 카운터는 /stats의 clients에 표시
+    """
+    if camera is None or not camera.is_connected():
+        print(f"[ERROR] {label}이 연결되지 않음")
+        return
+
+    options = options or StreamOptions()
+    adapter = StreamAdapter(options, camera.settings.fps, camera.settings.stream_quality, client)
+    camera.add_viewer(adapter)
+    try:
+        while not shutdown_flag:
+            packet = camera.wait_packet(adapter.last_seq)
+            if packet is None:
+                if camera.is_stopped():
+                    break  # 카메라 정리됨 (재초기화/종료)
                 continue
-                
-        except Exception as e:
-            error_count += 1
-            print(f"[ERROR] 카메라 2번 예외 발생 ({error_count}/{max_errors}): {e}")
-            
-            if error_count >= max_errors:
-                print("[ERROR] 카메라 2번 최대 오류 횟수 초과, 카메라 재초기화 시도")
-                initialize_cameras()
-                error_count = 0
-                time.sleep(2)
+
+            if not adapter.accept(packet, time.perf_counter()):
                 continue
-                
-            time.sleep(0.5)
-            continue
 
-        # 성공적으로 프레임을 읽었으면 에러 카운터 리셋
-        error_count = 0
-        frame_count += 1
-        
-        ret, buffer = cv2.imencode('.jpg', frame)
-        if not ret:
-            print("[ERROR] 카메라 2번 프레임 인코딩 실패")
-            continue
-            
-        frame = buffer.tobytes()
+            frame = camera.encode_jpeg(packet, adapter.quality, options.scale)
+            if frame is None:
+                continue
 
-        yield (b'--frame\r\n'
-               b'Content-Type: image/jpeg\r\n\r\n' + frame + b'\r\n')
+            send_start = time.perf_counter()
+            yield (b'--frame\r\n'
+                   b'Content-Type: image/jpeg\r\n\r\n' + frame + b'\r\n')
+            adapter.on_sent(packet, len(frame), send_start, time.perf_counter() - send_start)
+    finally:
+        camera.remove_viewer(adapter)
 
 @app.route('/health')
 def health():
@@ -454,76 +959,238 @@ def shutdown():
     # 클라이언트에 성공 응답 반환
     return jsonify({'status': 'shutting down', 'message': 'Server is shutting down safely'}), 200
 
+
+@app.route('/stats')
+def stats():
+    """카메라별 캡처 FPS/시청자 수/인코딩 횟수 (인코딩 횟수는 시청자 수와 무관하게 프레임 수 이하)"""
+    return jsonify(camera_pool.get_stats()), 200
+
+def camera_not_configured(camera_id):
+    return jsonify({'error': f'Camera {camera_id} is not configured'}), 404
+
+@app.route('/video/<int:camera_id>')
+def video_stream(camera_id):
+    """
+    카메라 ID별 MJPEG 스트림 (/video, /video2는 카메라 1, 2)
+    쿼리: quality(10~100), scale(0~1 축소), fps(목표 FPS), kbps(목표 비트레이트) - 예: /video/1?scale=0.5&fps=10
+    """
+    if camera_id not in camera_pool:
+        return camera_not_configured(camera_id)
+    try:
+        options = parse_stream_options(request.args)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return Response(generate_frames(camera_pool.get(camera_id), f"카메라 {camera_id}", options, request.remote_addr),
+                    mimetype='multipart/x-mixed-replace; boundary=frame')
+
 @app.route('/video')
 def video():
-    return Response(generate_frames(),
-                    mimetype='multipart/x-mixed-replace; boundary=frame')
+    return video_stream(1)
 
 @app.route('/video2')
 def video2():
-    return Response(generate_frames2(),
-                    mimetype='multipart/x-mixed-replace; boundary=frame')
+    return video_stream(2)
+
+def frame_headers(packet):
+    """프레임 순번/캡처 시각(epoch 초, 단조 시계 초)/나이 헤더 - 연속 캡처에서 같은 프레임 중복이나 지연 확인용"""
+    return {
+        'X-Frame-Seq': str(packet.seq),
+        'X-Frame-Timestamp': f"{packet.timestamp:.6f}",
+        'X-Frame-Monotonic': f"{packet.monotonic:.6f}",
+        'X-Frame-Age-Ms': f"{(time.time() - packet.timestamp) * 1000:.1f}",
+        'Cache-Control': 'no-store',
+    }
+
+def parse_capture_options(args):
+    """/capture, /capture_burst 공통 쿼리 → (mode, quality) (잘못된 값이면 ValueError)"""
+    mode = args.get('mode', 'hq')
+    quality = args.get('quality', type=int)
+    if mode not in ('hq', 'latest'):
+        raise ValueError(f"mode는 hq 또는 latest여야 합니다: {mode}")
+    if quality is not None and not 10 <= quality <= 100:
+        raise ValueError(f"quality는 10~100이어야 합니다: {quality}")
+    return mode, quality
+
+@app.route('/capture/<int:camera_id>')
+def capture_camera(camera_id):
+    """
+    카메라 ID별 현재 프레임 JPEG (/capture, /capture2는 카메라 1, 2)
+    캡처 스레드가 게시한 최신 프레임 사용 (카메라 직접 읽기 없음, 프레임이 있으면 대기 없음)
+    쿼리:
+    - mode=hq(기본): capture_quality(또는 quality=10~100)로 인코딩 (같은 프레임/품질은 한 번만 인코딩)
+    - mode=latest: 이미 만들어진 JPEG 그대로 (pass-through MJPEG 또는 스트림 인코딩 결과, 없으면 hq)
+    - after=<seq>: 이 순번보다 새 프레임이 나올 때까지 대기 (최대 1초, 연속 캡처에서 같은 프레임 중복 방지)
+    응답 헤더: X-Frame-Seq, X-Frame-Timestamp, X-Frame-Age-Ms
+    """
+    if camera_id not in camera_pool:
+        return camera_not_configured(camera_id)
+    try:
+        mode, quality = parse_capture_options(request.args)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    after = request.args.get('after', 0, type=int)
+
+    camera = camera_pool.get(camera_id)
+    name = f"Camera {camera_id}"
+    try:
+        if camera is None or not camera.is_connected():
+            print(f"[ERROR] 카메라 {camera_id}이 연결되지 않음")
+            return jsonify({'error': f'{name} is not connected'}), 500
+
+        packet = camera.wait_packet(after)
+        if packet is None:
+            return jsonify({'error': f'Failed to read from {name}'}), 500
+
+        jpeg = None
+        if mode == 'latest':
+            # 최신 프레임이 아직 인코딩 전이면 바로 앞 프레임까지 허용 (after보다는 새 프레임)
+            packet, jpeg = camera.latest_jpeg(packet, max(after + 1, packet.seq - 1))
+        if jpeg is None:
+            jpeg = camera.encode_jpeg(packet, quality or camera.settings.capture_quality)
+        if jpeg is None:
+            return jsonify({'error': 'Failed to encode frame'}), 500
+        return Response(jpeg, mimetype='image/jpeg', headers=frame_headers(packet))
+    except Exception as e:
+        return jsonify({'error': f'{name} capture error: {str(e)}'}), 500
+
+def burst_jpeg(camera, packet, mode, quality):
+    """버스트 프레임 JPEG - latest면 그 프레임의 이미 만들어진 JPEG, 없거나 hq면 capture_quality로 인코딩"""
+    if mode == 'latest':
+        used, jpeg = camera.latest_jpeg(packet, packet.seq)
+        if used is packet and jpeg is not None:
+            return jpeg
+    return camera.encode_jpeg(packet, quality or camera.settings.capture_quality)
+
+BURST_END = b'--frame--\r\n'  # 버스트 multipart 닫는 경계
+
+def generate_burst(camera, packets, mode, quality):
+    """버스트 multipart 본문 - 프레임마다 순번/시각 헤더를 붙여 고르는 즉시 전송"""
+    for packet in packets:
+        jpeg = burst_jpeg(camera, packet, mode, quality)
+        if jpeg is None:
+            continue
+        headers = ''.join(f"{key}: {value}\r\n" for key, value in frame_headers(packet).items() if key.startswith('X-Frame'))
+        yield (b'--frame\r\n'
+               + f"Content-Type: image/jpeg\r\nContent-Length: {len(jpeg)}\r\n{headers}\r\n".encode()
+               + jpeg + b'\r\n')
+    yield BURST_END
+
+@app.route('/capture_burst/<int:camera_id>')
+def capture_burst_camera(camera_id):
+    """
+    카메라 ID별 연속 프레임 n장 (/capture_burst는 카메라 1) - 바늘 끝 프레임 평균/모션 블러 판정용
+    캡처 스레드의 링 버퍼에서 읽음 (카메라 직접 읽기 없음, 실시간 스트림에 영향 없음)
+    쿼리:
+    - n: 장수 (1~burst_frames, 기본 5), interval: 프레임 사이 최소 간격 (ms, 기본 0 = 연속 프레임)
+    - after=<seq>: 이 순번 다음 프레임부터 (링에 남아 있으면 지난 프레임 포함), 없으면 현재 최신 프레임부터
+    - format: multipart(기본, 프레임마다 바로 전송) 또는 zip (JPEG + manifest.json)
+    - mode, quality: /capture와 같음
+    프레임별 X-Frame-Seq, X-Frame-Timestamp(epoch 초), X-Frame-Monotonic(단조 시계 초)는 multipart 파트 헤더, zip은 manifest.json
+    """
+    if camera_id not in camera_pool:
+        return camera_not_configured(camera_id)
+    camera = camera_pool.get(camera_id)
+    name = f"Camera {camera_id}"
+    max_frames = camera.settings.burst_frames if camera else CameraSettings().burst_frames
+    try:
+        mode, quality = parse_capture_options(request.args)
+        count = request.args.get('n', 5, type=int)
+        interval = request.args.get('interval', 0.0, type=float)
+        after = request.args.get('after', type=int)
+        output = request.args.get('format', 'multipart')
+        if not 1 <= count <= max_frames:
+            raise ValueError(f"n은 1~{max_frames}이어야 합니다: {count}")
+        if not 0 <= interval <= 1000:
+            raise ValueError(f"interval은 0~1000ms여야 합니다: {interval}")
+        if after is not None and after < 0:
+            raise ValueError(f"after는 0 이상이어야 합니다: {after}")
+        if output not in ('multipart', 'zip'):
+            raise ValueError(f"format은 multipart 또는 zip이어야 합니다: {output}")
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    if camera is None or not camera.is_connected():
+        print(f"[ERROR] 카메라 {camera_id}이 연결되지 않음")
+        return jsonify({'error': f'{name} is not connected'}), 500
+
+    packets = camera.iter_burst(count, interval / 1000, after)
+    if output == 'multipart':
+        # 첫 프레임까지 고른 뒤 응답 시작 → 프레임이 하나도 없으면 zip과 같은 오류 응답
+        parts = generate_burst(camera, packets, mode, quality)
+        first = next(parts)
+        if first == BURST_END:
+            return jsonify({'error': f'Failed to read from {name}'}), 500
+        return Response(itertools.chain([first], parts), mimetype='multipart/mixed; boundary=frame',
+                        headers={'Cache-Control': 'no-store'})
+
+    try:
+        buffer = io.BytesIO()
+        manifest = []
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED) as archive:  # JPEG는 이미 압축됨
+            for packet in packets:
+                jpeg = burst_jpeg(camera, packet, mode, quality)
+                if jpeg is None:
+                    continue
+                filename = f"frame_{len(manifest):03d}_seq{packet.seq}.jpg"
+                archive.writestr(filename, jpeg)
+                manifest.append({'file': filename, 'seq': packet.seq, 'timestamp': packet.timestamp,
+                                 'monotonic': packet.monotonic})
+            archive.writestr('manifest.json', json.dumps({'camera': camera_id, 'frames': manifest}, indent=2))
+        if not manifest:
+            return jsonify({'error': f'Failed to read from {name}'}), 500
+        return Response(buffer.getvalue(), mimetype='application/zip', headers={
+            'Content-Disposition': f'attachment; filename=burst_camera{camera_id}_seq{manifest[0]["seq"]}.zip',
+            'X-Burst-Count': str(len(manifest)),
+            'Cache-Control': 'no-store',
+        })
+    except Exception as e:
+        return jsonify({'error': f'{name} burst capture error: {str(e)}'}), 500
 
 @app.route('/capture')
 def capture():
     """카메라 1에서 현재 프레임을 JPEG 이미지로 반환"""
-    try:
-        global cap
-        if cap is None or not cap.isOpened():
-            print("[ERROR] 카메라 0번이 연결되지 않음")
-            return jsonify({'error': 'Camera 0 is not connected'}), 500
-        
-        success, frame = cap.read()
-        if success:
-            # JPEG 형식으로 인코딩
-            ret, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 90])
-            if ret:
-                return Response(buffer.tobytes(), mimetype='image/jpeg')
-            else:
-                return jsonify({'error': 'Failed to encode frame'}), 500
-        else:
-            return jsonify({'error': 'Failed to read from camera'}), 500
-    except Exception as e:
-        return jsonify({'error': f'Camera capture error: {str(e)}'}), 500
+    return capture_camera(1)
+
+@app.route('/capture_burst')
+def capture_burst():
+    """카메라 1 연속 프레임 (쿼리는 /capture_burst/<id>와 같음)"""
+    return capture_burst_camera(1)
 
 @app.route('/capture2')
 def capture2():
     """카메라 2에서 현재 프레임을 JPEG 이미지로 반환"""
-    try:
-        global cap2
-        if cap2 is None or not cap2.isOpened():
-            print("[ERROR] 카메라 2번이 연결되지 않음")
-            return jsonify({'error': 'Camera 2 is not connected'}), 500
-        
-        success, frame = cap2.read()
-        if success:
-            # JPEG 형식으로 인코딩
-            ret, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 90])
-            if ret:
-                return Response(buffer.tobytes(), mimetype='image/jpeg')
-            else:
-                return jsonify({'error': 'Failed to encode frame'}), 500
-        else:
-            return jsonify({'error': 'Failed to read from camera 2'}), 500
-    except Exception as e:
-        return jsonify({'error': f'Camera 2 capture error: {str(e)}'}), 500
+    return capture_camera(2)
 
 if __name__ == '__main__':
     # 커맨드라인 인수 파싱
-    parser = argparse.ArgumentParser(description='Camera Server (1 or 2 cameras supported)')
-    parser.add_argument('--camera1', type=int, required=True, help='First camera index (required)')
+    parser = argparse.ArgumentParser(description='Camera Server (N cameras, /video/<id> and /capture/<id>)')
+    parser.add_argument('--camera1', type=int, default=None, help='First camera index')
     parser.add_argument('--camera2', type=int, default=None, help='Second camera index (optional)')
+    parser.add_argument('--cameras', type=str, default=None, help='Comma-separated camera indices for camera IDs 1..N (e.g. 0,1,2)')
+    parser.add_argument('--no-passthrough', action='store_true', help='Decode and re-encode every frame instead of forwarding camera MJPEG')
+    parser.add_argument('--jpeg-encoder', choices=['auto'] + list(JPEG_ENCODERS), default='auto', help='JPEG encoder backend (auto: turbojpeg > simplejpeg > opencv)')
+    parser.add_argument('--jpeg-subsampling', choices=JPEG_SUBSAMPLINGS, default='420', help='Chroma subsampling for re-encoded JPEG')
+    parser.add_argument('--stream-quality', type=int, default=None, help='JPEG quality for re-encoded stream frames (default: camera MJPEG / 95)')
+    parser.add_argument('--capture-quality', type=int, default=90, help='JPEG quality for /capture')
+    parser.add_argument('--burst-frames', type=int, default=30, help='Recent frames kept per camera for /capture_burst')
     args = parser.parse_args()
 
-    # 전역 변수에 카메라 인덱스 설정
-    camera_index_1 = args.camera1
-    camera_index_2 = args.camera2
+    # 전역 변수에 카메라 인덱스 설정 (--cameras가 있으면 우선, 없으면 --camera1/--camera2)
+    if args.cameras:
+        camera_indices = [int(value) for value in args.cameras.split(',') if value.strip()]
+    elif args.camera1 is not None:
+        camera_indices = [args.camera1] + ([args.camera2] if args.camera2 is not None else [])
+    else:
+        parser.error('--camera1 또는 --cameras가 필요합니다')
+    camera_settings = CameraSettings(passthrough=not args.no_passthrough, stream_quality=args.stream_quality,
+                                     capture_quality=args.capture_quality, subsampling=args.jpeg_subsampling,
+                                     burst_frames=max(1, args.burst_frames))
+    jpeg_encoder = create_jpeg_encoder(args.jpeg_encoder)
 
     print(f"[INFO] 카메라 서버 시작...")
-    if camera_index_2 is not None:
-        print(f"[INFO] 선택된 카메라 인덱스: Camera 1={camera_index_1}, Camera 2={camera_index_2} (2-카메라 모드)")
-    else:
-        print(f"[INFO] 선택된 카메라 인덱스: Camera 1={camera_index_1} (단일 카메라 모드)")
+    print(f"[INFO] 선택된 카메라 인덱스: " + ", ".join(f"Camera {camera_id}={index}" for camera_id, index in enumerate(camera_indices, start=1))
+          + f" ({len(camera_indices)}-카메라 모드)")
+    print(f"[INFO] JPEG 인코더: {jpeg_encoder.name} (서브샘플링 {camera_settings.subsampling})")
     
     # 카메라 초기화
     initialize_cameras()
@@ -539,4 +1206,3 @@ if __name__ == '__main__':
     finally:
         print("[INFO] 최종 카메라 리소스 정리 중...")
         cleanup_cameras()
-        print("[INFO] 카메라 서버 완전 종료")
\ No newline at end of file
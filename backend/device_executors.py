@@ -0,0 +1,114 @@
+"""
+블로킹 장치 I/O 오프로딩 및 이벤트 루프 응답성 측정
+- DeviceExecutor: 장치별 전용 스레드 실행기 (동시 실행 수/대기 수 제한)
+  EEPROM(FT232H I2C), 저항계(Modbus RTU)처럼 time.sleep/타임아웃이 많은 호출을 이벤트 루프 밖에서 실행
+- EventLoopLagMonitor: 주기적으로 sleep 후 깨어나는 지연(lag)을 측정해서 루프가 막히는지 확인
+"""
+
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _ms_stats(values):
+    """초 단위 값 목록의 last/mean/p95/max (ms)"""
+    if not values:
+        return {"last_ms": None, "mean_ms": None, "p95_ms": None, "max_ms": None}
+    ordered = sorted(values)
+    return {
+        "last_ms": round(values[-1] * 1000, 2),
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 2),
+        "p95_ms": round(ordered[max(int(len(ordered) * 0.95) - 1, 0)] * 1000, 2),
+        "max_ms": round(ordered[-1] * 1000, 2),
+    }
+
+
+class DeviceExecutor:
+    """
+    장치 하나를 위한 전용 실행기
+
+    Args:
+        name: 장치 이름 (스레드 이름/로그용)
+        max_workers: 동시에 실행할 수 있는 호출 수 (같은 버스를 쓰는 장치는 1)
+        max_pending: 실행 대기까지 포함한 최대 호출 수 - 초과 시 호출한 코루틴이 자리가 날 때까지 대기
+        history: 보관할 최근 실행/대기 시간 개수
+    """
+
+    def __init__(self, name, max_workers=1, max_pending=4, history=64):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"{name}-io")
+        self._slots = None  # asyncio.Semaphore (처음 호출한 이벤트 루프에서 생성)
+        self.pending = 0
+        self.calls = 0
+        self.errors = 0
+        self._run_times = deque(maxlen=history)
+        self._wait_times = deque(maxlen=history)
+
+    async def run(self, func, *args, **kwargs):
+        """func(*args, **kwargs)를 전용 스레드에서 실행하고 결과 반환"""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_pending)
+        loop = asyncio.get_running_loop()
+        submitted_at = time.perf_counter()
+        async with self._slots:
+            self.pending += 1
+            try:
+                return await loop.run_in_executor(self._executor, self._call, submitted_at, func, args, kwargs)
+            finally:
+                self.pending -= 1
+
+    def _call(self, submitted_at, func, args, kwargs):
+        started_at = time.perf_counter()
+        self._wait_times.append(started_at - submitted_at)
+        self.calls += 1
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            self.errors += 1
+            raise
+        finally:
+            self._run_times.append(time.perf_counter() - started_at)
+
+    def get_stats(self):
+        return {
+            "pending": self.pending,
+            "calls": self.calls,
+            "errors": self.errors,
+            "run": _ms_stats(list(self._run_times)),
+            "wait": _ms_stats(list(self._wait_times)),
+        }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
+
+
+class EventLoopLagMonitor:
+    """
+    이벤트 루프 지연 측정: interval마다 sleep하고, 예정보다 늦게 깨어난 시간을 lag로 기록
+    (블로킹 호출이 루프에서 실행되면 그 시간만큼 lag가 커짐)
+    """
+
+    def __init__(self, interval=0.02, history=500):
+        self.interval = interval
+        self._lags = deque(maxlen=history)
+        self.task = None
+
+    def start(self):
+        if self.task is None or self.task.done():
+            self.task = asyncio.get_running_loop().create_task(self._run())
+        return self.task
+
+    async def _run(self):
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self._lags.append(max(time.perf_counter() - start - self.interval, 0.0))
+
+    def reset(self):
+        self._lags.clear()
+
+    def get_stats(self):
+        return _ms_stats(list(self._lags))
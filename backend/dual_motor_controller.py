@@ -2,8 +2,10 @@ import serial
 import time
 import os
 import platform
-from threading import Thread, Lock
-from queue import Queue, Empty
+from threading import Thread, Lock, Event
+from queue import Empty
+from collections import deque
+from concurrent.futures import Future, InvalidStateError
 from dataclasses import dataclass
 from typing import Optional
 
@@ -15,6 +17,27 @@ from motor_mode_generators import (
     generate_speed_force_mode_command,
     generate_status_read_command
 )
+from motor_frame_parser import MotorFrameParser, decode_status, MIN_STATUS_FRAME_SIZE
+from motor_transactions import MotorTransactionManager
+from motor_command_queue import MotorCommandQueue, LANE_EMERGENCY, LANE_MOTION, LANE_BOOKKEEPING
+
+class MotionFuture(Future):
+    """
+    모터 이동 완료 Future (concurrent.futures.Future 기반)
+    - 스레드: future.result(timeout=...) 으로 대기
+    - asyncio: await asyncio.wrap_future(future) 로 대기
+    - 목표 위치 허용 오차 안에 들어온 첫 상태 프레임에서 완료되며,
+      결과는 {"motor_id", "target_position", "position", "duration"} (duration: 첫 명령 전송 → 도달, 초)
+    """
+
+    def __init__(self, motor_id, target_position, tolerance=50):
+        super().__init__()
+        self.motor_id = motor_id
+        self.target_position = target_position
+        self.tolerance = tolerance
+        self.started_at = None  # 첫 명령 전송 시각 (perf_counter)
+        self.message = ""  # 큐잉 결과 메시지 (기존 반환 문자열)
+
 
 @dataclass
 class QueuedCommand:
@@ -24,11 +47,13 @@ class QueuedCommand:
     wait_for_completion: bool = False  # 명령 완료까지 대기할지 여부
     target_position: Optional[int] = None  # 대기할 목표 위치 (wait_for_completion=True일 때 사용)
     completion_tolerance: int = 50  # 위치 허용 오차 (기본 50 = 1.25mm for motor2)
+    future: Optional[MotionFuture] = None  # 이동 완료 Future (return_future=True일 때)
+    resolves_future: bool = True  # False이면 전송 시각만 기록하고 완료 판정은 이후 명령에서 수행
 
 class DualMotorController:
     def __init__(self):
         self.serial = None
-        self.command_queue = Queue()  # 명령어 큐 시스템
+        self.command_queue = MotorCommandQueue()  # 우선순위 레인 명령어 큐 시스템 (비상 > 이동 > 부가)
         self.current_command = None  # 현재 처리 중인 명령어 (완료 대기용)
         self.lock = Lock()
         self.running = False
@@ -38,7 +63,39 @@ class DualMotorController:
         self.last_command_motor2 = None
         self.motor1_status_mode = True  # True: 상태 읽기, False: 이동 명령
         self.motor2_status_mode = True  # True: 상태 읽기, False: 이동 명령
-        
+        self.read_timeout = 0.1  # 수신 블로킹 대기 최대 시간 (바이트 도착 시 즉시 깨어남)
+        self.send_event = Event()  # 명령 큐잉 시 send_loop를 즉시 깨우는 이벤트
+
+        # 적응형 상태 폴링 스케줄러 설정
+        self.poll_rate_active = 50.0  # 이동 중/완료 대기 중인 모터의 상태 읽기 주기 (Hz)
+        self.poll_rate_idle = 5.0  # 정지 상태 모터의 상태 읽기 주기 (Hz)
+        self.active_hold_time = 0.5  # 이동 명령 전송 후 이동 중으로 간주하는 최소 시간 (초)
+        self.motion_tolerance = 5  # setPos와 position 차이가 이 값 이하면 정지로 판단
+        self.inter_frame_gap = 0.01  # 버스 상 연속 전송 간 최소 간격 (응답 충돌 방지, 10ms)
+        self.command_settle_time = 0.005  # 이동 명령 전송 후 드라이버 처리 시간 (5ms)
+        self.last_write_time = 0.0
+        self.next_poll_time = {1: 0.0, 2: 0.0}
+        self.last_move_time = {1: float('-inf'), 2: float('-inf')}
+        self.motor_moving = {1: False, 2: False}  # 최근 상태 프레임 기준 이동 여부
+        self.poll_history = {1: deque(maxlen=256), 2: deque(maxlen=256)}  # 상태 읽기 전송 시각
+
+        # 요청/응답 상관관계: 응답을 기다리는 모터에는 새 요청을 보내지 않고,
+        # 서로 다른 모터는 inter_frame_gap 대신 pipeline_gap만 두고 연달아 요청
+        self.transactions = MotorTransactionManager(max_in_flight=1, timeout=0.05)
+        self.pipeline_gap = 0.0  # 연결 시 _calibrate_sweep_gap()으로 측정한 최소 간격으로 갱신
+
+        # 버스 스윕 모드: 두 모터의 상태 읽기를 같은 시각에 pipeline_gap만 두고 연달아 전송
+        self.sweep_mode = False
+        self.sweep_gap_candidates = (0.0, 0.0005, 0.001, 0.002, 0.005, 0.01)  # 보정 시 시도할 간격 (초)
+        self.sweep_calibrated = False
+        self.status_frame_size = MIN_STATUS_FRAME_SIZE + 1  # 상태 응답 프레임 길이 (보정 시 실측값으로 갱신)
+        self.current_sweep = None  # (시작 시각, 응답을 기다리는 모터 ID set)
+        self.sweep_history = deque(maxlen=256)  # 스윕 주기 (첫 요청 전송 → 두 응답 수신 완료, 초)
+
+        # 이동 완료 Future: 명령 전송 후 목표 위치 도달 첫 상태 프레임에서 완료
+        self.motion_waiters = {1: [], 2: []}
+        self.motion_timeout = 30.0  # 이 시간 안에 도달하지 못하면 TimeoutError
+
         # 스레드 상태 모니터링
         self.sender_last_activity = time.time()
         self.reader_last_activity = time.time()
@@ -108,6 +165,37 @@ class DualMotorController:
         self.disconnect()
         return False
 
+    @staticmethod
+    def _serial_options(baudrate, parity, databits, stopbits):
+        """프론트엔드 통신 설정 값을 pyserial 인자로 변환"""
+        parity_map = {
+            "none": serial.PARITY_NONE,
+            "even": serial.PARITY_EVEN,
+            "odd": serial.PARITY_ODD,
+            "mark": serial.PARITY_MARK,
+            "space": serial.PARITY_SPACE
+        }
+
+        stopbits_map = {
+            "1": serial.STOPBITS_ONE,
+            "1.5": serial.STOPBITS_ONE_POINT_FIVE,
+            "2": serial.STOPBITS_TWO
+        }
+
+        # 사용자가 문자열로 입력했을 경우 처리
+        stopbits_key = str(stopbits)
+        if stopbits_key == "2" or stopbits_key == "3":
+            stopbits_key = "2"
+        elif stopbits_key not in stopbits_map:
+            stopbits_key = "1"
+
+        return {
+            "baudrate": int(baudrate),
+            "bytesize": int(databits),
+            "parity": parity_map[parity.lower()],
+            "stopbits": stopbits_map[stopbits_key],
+        }
+
     def connect(self, port, baudrate, parity, databits, stopbits):
         if self.serial and self.serial.is_open:
             # 이미 연결된 상태에서 스레드 상태 확인
@@ -125,46 +213,15 @@ class DualMotorController:
             # 플랫폼에 맞는 포트 이름 가져오기
             port = self.get_platform_port(port)
             
-            parity_map = {
-                "none": serial.PARITY_NONE,
-                "even": serial.PARITY_EVEN,
-                "odd": serial.PARITY_ODD,
-                "mark": serial.PARITY_MARK,
-                "space": serial.PARITY_SPACE
-            }
-
-            stopbits_map = {
-                "1": serial.STOPBITS_ONE,
-                "1.5": serial.STOPBITS_ONE_POINT_FIVE,
-                "2": serial.STOPBITS_TWO
-            }
-
-            # 사용자가 문자열로 입력했을 경우 처리
-            stopbits_key = str(stopbits)
-            if stopbits_key == "2" or stopbits_key == "3":
-                stopbits_key = "2"
-            elif stopbits_key not in stopbits_map:
-                stopbits_key = "1"
-
             self.serial = serial.Serial(
                 port=port,
-                baudrate=int(baudrate),
-                bytesize=int(databits),
-                parity=parity_map[parity.lower()],
-                stopbits=stopbits_map[stopbits_key],
-                timeout=0.1
+                timeout=self.read_timeout,
+                **self._serial_options(baudrate, parity, databits, stopbits)
             )
             self.running = True
-            
-            # 모터1과 모터2를 상태 읽기 모드로 초기화
-            with self.lock:
-                self.motor1_status_mode = True
-                self.last_command_motor1 = generate_status_read_command(motor_id=0x01)
-                print(f"[INFO] 모터1 상태 읽기 모드 초기화: {self.last_command_motor1.hex().upper()}")
-                
-                self.motor2_status_mode = True
-                self.last_command_motor2 = generate_status_read_command(motor_id=0x02)
-                print(f"[INFO] 모터2 상태 읽기 모드 초기화: {self.last_command_motor2.hex().upper()}")
+            self.transactions.reset()
+            self._calibrate_sweep_gap()
+            self._init_status_commands()
             
             self.sender_thread = Thread(target=self.send_loop, daemon=True)
             self.reader_thread = Thread(target=self.read_loop, daemon=True)
@@ -175,6 +232,17 @@ class DualMotorController:
         except Exception as e:
             return f"❌ 포트 연결 실패: {str(e)}"
 
+    def _init_status_commands(self):
+        """모터1과 모터2를 상태 읽기 모드로 초기화"""
+        with self.lock:
+            self.motor1_status_mode = True
+            self.last_command_motor1 = generate_status_read_command(motor_id=0x01)
+            print(f"[INFO] 모터1 상태 읽기 모드 초기화: {self.last_command_motor1.hex().upper()}")
+            
+            self.motor2_status_mode = True
+            self.last_command_motor2 = generate_status_read_command(motor_id=0x02)
+            print(f"[INFO] 모터2 상태 읽기 모드 초기화: {self.last_command_motor2.hex().upper()}")
+
     def disconnect(self):
         self.running = False
         # 명령어 큐 초기화
@@ -188,10 +256,10 @@ class DualMotorController:
         return self.serial and self.serial.is_open
 
     # Motor 1 (기존 모터) 제어 함수들
-    def move_to_position(self, pos: int, mode="position"):
-        return self.move_to_position_motor1(pos, mode)
+    def move_to_position(self, pos: int, mode="position", return_future=False, priority=LANE_MOTION):
+        return self.move_to_position_motor1(pos, mode, return_future, priority)
 
-    def move_to_position_motor1(self, pos: int, mode="position"):
+    def move_to_position_motor1(self, pos: int, mode="position", return_future=False, priority=LANE_MOTION):
         try:
             if mode == "servo":
                 cmd = generate_servo_mode_command(pos, motor_id=0x01)
@@ -202,7 +270,7 @@ class DualMotorController:
 
             # 명령어를 큐에 추가 (우선순위 높음)
             if self.serial and self.serial.is_open:
-                self.command_queue.put(cmd)
+                future = self._queue_motion(cmd, 1, pos, return_future, priority=priority)
                 print(f"[CMD_QUEUE] 모터1 이동 명령 큐잉 - 위치: {pos} ({pos/100:.1f}mm), 모드: {mode}")
                 
                 # 이동 명령 후 상태 읽기 모드로 전환
@@ -213,20 +281,20 @@ class DualMotorController:
                 print(f"[ERROR] 모터1 이동 실패 - 시리얼 포트 닫혀있음")
                 return "❌ 시리얼 포트가 열려있지 않습니다"
                     
-            return f"📤 모터1 위치 이동 명령 큐잉 완료: {' '.join([cmd.hex()[i:i+2].upper() for i in range(0, len(cmd.hex()), 2)])}"
+            return self._motion_result(future, f"📤 모터1 위치 이동 명령 큐잉 완료: {' '.join([cmd.hex()[i:i+2].upper() for i in range(0, len(cmd.hex()), 2)])}")
         except Exception as e:
             return f"❌ 모터1 명령 큐잉 실패: {str(e)}"
 
-    def move_with_speed(self, speed: int, position: int):
-        return self.move_with_speed_motor1(speed, position)
+    def move_with_speed(self, speed: int, position: int, return_future=False, priority=LANE_MOTION):
+        return self.move_with_speed_motor1(speed, position, return_future, priority)
 
-    def move_with_speed_motor1(self, speed: int, position: int):
+    def move_with_speed_motor1(self, speed: int, position: int, return_future=False, priority=LANE_MOTION):
         try:
             cmd = generate_speed_mode_command(speed, position, motor_id=0x01)
             
             # 명령어를 큐에 추가 (우선순위 높음)
             if self.serial and self.serial.is_open:
-                self.command_queue.put(cmd)
+                future = self._queue_motion(cmd, 1, position, return_future, priority=priority)
                 print(f"[CMD_QUEUE] 모터1 속도/위치 명령 큐잉 - 속도: {speed}, 위치: {position} ({position/100:.1f}mm)")
                 
                 # 이동 명령 후 상태 읽기 모드로 전환
@@ -236,7 +304,7 @@ class DualMotorController:
             else:
                 return "❌ 시리얼 포트가 열려있지 않습니다"
                     
-            return f"📤 모터1 속도/위치 이동 명령 큐잉 완료: {' '.join([cmd.hex()[i:i+2].upper() for i in range(0, len(cmd.hex()), 2)])}"
+            return self._motion_result(future, f"📤 모터1 속도/위치 이동 명령 큐잉 완료: {' '.join([cmd.hex()[i:i+2].upper() for i in range(0, len(cmd.hex()), 2)])}")
         except Exception as e:
             return f"❌ 모터1 명령 큐잉 실패: {str(e)}"
 
@@ -251,7 +319,7 @@ class DualMotorController:
             
             # 명령어를 큐에 추가 (우선순위 높음)
             if self.serial and self.serial.is_open:
-                self.command_queue.put(cmd)
+                self._enqueue_command(cmd)
                 print(f"[CMD_QUEUE] 모터1 힘 제어 명령 큐잉 - 힘: {force}N ({force_g}g)")
                 
                 # 힘 제어 명령 후 상태 읽기 모드로 전환
@@ -265,10 +333,10 @@ class DualMotorController:
         except Exception as e:
             return f"❌ 모터1 명령 큐잉 실패: {str(e)}"
 
-    def move_with_speed_force(self, force: float, speed: int, position: int):
-        return self.move_with_speed_force_motor1(force, speed, position)
+    def move_with_speed_force(self, force: float, speed: int, position: int, return_future=False, priority=LANE_MOTION):
+        return self.move_with_speed_force_motor1(force, speed, position, return_future, priority)
 
-    def move_with_speed_force_motor1(self, force: float, speed: int, position: int):
+    def move_with_speed_force_motor1(self, force: float, speed: int, position: int, return_future=False, priority=LANE_MOTION):
         try:
             # N을 g로 변환 (1N = 101.97g)
             force_g = int(force * 101.97)
@@ -276,7 +344,7 @@ class DualMotorController:
             
             # 명령어를 큐에 추가 (우선순위 높음)
             if self.serial and self.serial.is_open:
-                self.command_queue.put(cmd)
+                future = self._queue_motion(cmd, 1, position, return_future, priority=priority)
                 print(f"[CMD_QUEUE] 모터1 속도/힘/위치 명령 큐잉 - 힘: {force}N, 속도: {speed}, 위치: {position} ({position/100:.1f}mm)")
                 
                 # 명령 후 상태 읽기 모드로 전환
@@ -286,12 +354,12 @@ class DualMotorController:
             else:
                 return "❌ 시리얼 포트가 열려있지 않습니다"
                     
-            return f"📤 모터1 속도/힘/위치 이동 명령 큐잉 완료: {' '.join([cmd.hex()[i:i+2].upper() for i in range(0, len(cmd.hex()), 2)])}"
+            return self._motion_result(future, f"📤 모터1 속도/힘/위치 이동 명령 큐잉 완료: {' '.join([cmd.hex()[i:i+2].upper() for i in range(0, len(cmd.hex()), 2)])}")
         except Exception as e:
             return f"❌ 모터1 명령 큐잉 실패: {str(e)}"
 
     # Motor 2 (저항 측정 모터) 제어 함수들
-    def move_to_position_motor2(self, pos: int, mode="servo"):
+    def move_to_position_motor2(self, pos: int, mode="servo", return_future=False, priority=LANE_MOTION):
         try:
             if mode == "servo":
                 cmd = generate_servo_mode_command(pos, motor_id=0x02)
@@ -302,7 +370,7 @@ class DualMotorController:
 
             # 명령어를 큐에 추가 (우선순위 높음)
             if self.serial and self.serial.is_open:
-                self.command_queue.put(cmd)
+                future = self._queue_motion(cmd, 2, pos, return_future, priority=priority)
                 print(f"[CMD_QUEUE] 모터2 위치 이동 명령 큐잉 - 위치: {pos} ({pos/40:.1f}mm), 모드: {mode}")
                 
                 # 이동 명령 후 상태 읽기 모드로 전환
@@ -312,11 +380,11 @@ class DualMotorController:
             else:
                 return "❌ 시리얼 포트가 열려있지 않습니다"
             
-            return f"📤 모터2 위치 이동 명령 큐잉 완료: {cmd.hex().upper()}"
+            return self._motion_result(future, f"📤 모터2 위치 이동 명령 큐잉 완료: {cmd.hex().upper()}")
         except Exception as e:
             return f"❌ 모터2 명령 큐잉 실패: {str(e)}"
 
-    def move_with_speed_motor2(self, speed: int, position: int, deceleration_enabled=False, deceleration_position=0, deceleration_speed=0):
+    def move_with_speed_motor2(self, speed: int, position: int, deceleration_enabled=False, deceleration_position=0, deceleration_speed=0, return_future=False, priority=LANE_MOTION):
         """
         모터2 속도/위치 이동 - 2단계 감속 큐 시스템
         감속이 활성화된 경우 2개의 명령어를 순차적으로 큐에 넣어 안정적인 감속 구현
@@ -326,6 +394,13 @@ class DualMotorController:
                 # 기존 감속 정보 초기화
                 with self.lock:
                     self.motor2_deceleration_info = None
+
+                # 비상 우선순위: 대기 중인 모터2 이동 명령을 버리고 먼저 전송
+                if priority == LANE_EMERGENCY:
+                    self.preempt_motor(2)
+
+                # 완료 Future는 최종 목표(C) 도달 시 완료, 소요 시간은 첫 명령 전송 시점부터 측정
+                future = MotionFuture(2, position) if return_future else None
                 
                 if deceleration_enabled and deceleration_position > 0 and deceleration_speed > 0:
                     # === 2단계 감속 시스템 ===
@@ -350,9 +425,11 @@ class DualMotorController:
                         motor_id=2,
                         wait_for_completion=True,
                         target_position=decel_start_point,
-                        completion_tolerance=50  # 1.25mm 허용 오차
+                        completion_tolerance=50,  # 1.25mm 허용 오차
+                        future=future,
+                        resolves_future=False  # 1단계 도달은 Future 완료 조건이 아님
                     )
-                    self.command_queue.put(queued_cmd1)
+                    self._enqueue_command(queued_cmd1, lane=priority)
                     print(f"[2STAGE_DECEL] 1단계 명령 큐잉: A→B ({decel_start_point}({decel_start_point/40:.1f}mm)까지 속도 {speed}로 이동, 완료 대기)")
                     
                     # 2단계: B에서 C까지 느린 속도로 감속 이동
@@ -361,9 +438,10 @@ class DualMotorController:
                         command=cmd2,
                         motor_id=2,
                         wait_for_completion=False,
-                        target_position=target_pos
+                        target_position=target_pos,
+                        future=future
                     )
-                    self.command_queue.put(queued_cmd2)
+                    self._enqueue_command(queued_cmd2, lane=priority)
                     print(f"[2STAGE_DECEL] 2단계 명령 큐잉: B→C ({target_pos}({target_pos/40:.1f}mm)까지 속도 {deceleration_speed}로 감속 이동)")
                     
                     result_msg = f"📤 모터2 A→B→C 감속 명령 큐잉 완료 - 1단계: {speed}→{decel_start_point}, 2단계: {deceleration_speed}→{target_pos}"
@@ -375,9 +453,10 @@ class DualMotorController:
                         command=cmd,
                         motor_id=2,
                         wait_for_completion=False,
-                        target_position=position
+                        target_position=position,
+                        future=future
                     )
-                    self.command_queue.put(queued_cmd)
+                    self._enqueue_command(queued_cmd, lane=priority)
                     print(f"[CMD_QUEUE] 모터2 일반 이동 명령 큐잉 - 목표: {position}({position/40:.1f}mm), 속도: {speed}")
                     
                     result_msg = f"📤 모터2 일반 이동 명령 큐잉 완료: {position}({position/40:.1f}mm), 속도: {speed}"
@@ -390,11 +469,11 @@ class DualMotorController:
             else:
                 return "❌ 시리얼 포트가 열려있지 않습니다"
 
-            return result_msg
+            return self._motion_result(future, result_msg)
         except Exception as e:
             return f"❌ 모터2 명령 큐잉 실패: {str(e)}"
 
-    def move_with_speed_force_motor2(self, force: float, speed: int, position: int):
+    def move_with_speed_force_motor2(self, force: float, speed: int, position: int, return_future=False, priority=LANE_MOTION):
         try:
             # N을 g로 변환 (1N = 101.97g)
             force_g = int(force * 101.97)
@@ -402,7 +481,7 @@ class DualMotorController:
             
             # 명령어를 큐에 추가 (우선순위 높음)
             if self.serial and self.serial.is_open:
-                self.command_queue.put(cmd)
+                future = self._queue_motion(cmd, 2, position, return_future, priority=priority)
                 print(f"[CMD_QUEUE] 모터2 속도/힘/위치 명령 큐잉 - 힘: {force}N, 속도: {speed}, 위치: {position} ({position/40:.1f}mm)")
                 
                 # 명령 후 상태 읽기 모드로 전환
@@ -412,7 +491,7 @@ class DualMotorController:
             else:
                 return "❌ 시리얼 포트가 열려있지 않습니다"
             
-            return f"📤 모터2 속도/힘/위치 이동 명령 큐잉 완료: {cmd.hex().upper()}"
+            return self._motion_result(future, f"📤 모터2 속도/힘/위치 이동 명령 큐잉 완료: {cmd.hex().upper()}")
         except Exception as e:
             return f"❌ 모터2 명령 큐잉 실패: {str(e)}"
     
@@ -421,14 +500,276 @@ class DualMotorController:
         return self.command_queue.qsize()
     
     def clear_queue(self):
-        """명령어 큐를 비움 (긴급 상황 시 사용)"""
-        while not self.command_queue.empty():
-            try:
-                self.command_queue.get_nowait()
-            except Empty:
-                break
+        """명령어 큐를 비움 (긴급 상황 시 사용) - 대기 중인 이동 완료 Future는 취소"""
+        for queued_cmd in self.command_queue.clear():
+            if isinstance(queued_cmd, QueuedCommand) and queued_cmd.future:
+                queued_cmd.future.cancel()
+        with self.lock:
+            waiters = self.motion_waiters[1] + self.motion_waiters[2]
+            self.motion_waiters = {1: [], 2: []}
+        for future in waiters:
+            future.cancel()
         print("[CMD_QUEUE] 명령어 큐 초기화 완료")
 
+    def _queue_motion(self, cmd, motor_id, target_position, return_future, tolerance=50, priority=LANE_MOTION):
+        """
+        위치 목표가 있는 이동 명령을 큐잉 (return_future=True이면 완료 Future 반환)
+        priority=LANE_EMERGENCY이면 해당 모터의 대기 명령을 선점 취소하고 비상 레인으로 전송
+        """
+        if priority == LANE_EMERGENCY:
+            self.preempt_motor(motor_id)
+        future = MotionFuture(motor_id, target_position, tolerance) if return_future else None
+        self._enqueue_command(QueuedCommand(
+            command=cmd,
+            motor_id=motor_id,
+            target_position=target_position,
+            completion_tolerance=tolerance,
+            future=future
+        ), lane=priority)
+        return future
+
+    def _motion_result(self, future, message):
+        """return_future 여부에 따라 기존 메시지 문자열 또는 Future 반환"""
+        if future is None:
+            return message
+        future.message = message
+        return future
+
+    def _check_motion_completion(self, motor_id, position):
+        """상태 프레임 수신 시 완료 대기 명령/이동 Future의 목표 도달 여부 확인"""
+        now = time.perf_counter()
+        with self.lock:
+            cmd = self.current_command
+            if (cmd and cmd.wait_for_completion and cmd.motor_id == motor_id
+                    and abs(position - cmd.target_position) <= cmd.completion_tolerance):
+                elapsed = time.time() - cmd.wait_start_time
+                print(f"[CMD_QUEUE] 명령 완료! 위치도달: {position}({position/40:.1f}mm), 소요시간: {elapsed:.2f}초")
+                self.current_command = None  # 완료 대기 해제 → 다음 명령 즉시 전송
+                self._wake_sender()
+
+            waiters = self.motion_waiters[motor_id]
+            done = [f for f in waiters
+                    if f.started_at is not None and abs(position - f.target_position) <= f.tolerance]
+            for future in done:
+                waiters.remove(future)
+
+        for future in done:
+            try:
+                future.set_result({
+                    "motor_id": motor_id,
+                    "target_position": future.target_position,
+                    "position": position,
+                    "duration": round(now - future.started_at, 4)
+                })
+            except InvalidStateError:
+                pass  # 호출자가 먼저 취소함 (예: 클라이언트 연결 종료로 대기 태스크 취소)
+
+    def _expire_motion_waiters(self):
+        """motion_timeout 안에 목표에 도달하지 못한 이동 Future를 TimeoutError로 완료"""
+        now = time.perf_counter()
+        expired = []
+        with self.lock:
+            for motor_id, waiters in self.motion_waiters.items():
+                for future in [f for f in waiters
+                               if f.started_at is not None and now - f.started_at > self.motion_timeout]:
+                    waiters.remove(future)
+                    expired.append(future)
+        for future in expired:
+            try:
+                future.set_exception(TimeoutError(
+                    f"모터{future.motor_id} 목표 위치 {future.target_position} 도달 대기 타임아웃 ({self.motion_timeout}초)"))
+            except InvalidStateError:
+                pass  # 호출자가 먼저 취소함
+
+    def _enqueue_command(self, cmd, lane=LANE_MOTION):
+        """명령어를 우선순위 레인에 넣고 send_loop를 즉시 깨움"""
+        self.command_queue.put(cmd, lane)
+        self._wake_sender()
+
+    def preempt_motor(self, motor_id):
+        """해당 모터의 대기 중인 이동 명령, 완료 대기, 이동 Future를 모두 취소 (비상 명령 전송 전)"""
+        dropped = self.command_queue.remove_if(
+            lambda c: (c.motor_id if isinstance(c, QueuedCommand) else c[3]) == motor_id,
+            lanes=(LANE_MOTION, LANE_BOOKKEEPING)
+        )
+        with self.lock:
+            if self.current_command and self.current_command.motor_id == motor_id:
+                self.current_command = None
+            waiters = self.motion_waiters[motor_id]
+            self.motion_waiters[motor_id] = []
+        for cmd in dropped:
+            if isinstance(cmd, QueuedCommand) and cmd.future:
+                cmd.future.cancel()
+        for future in waiters:
+            future.cancel()
+        if dropped:
+            print(f"[CMD_QUEUE] 모터{motor_id} 대기 명령 {len(dropped)}개 선점 취소")
+        return len(dropped)
+
+    def stop_motor(self, motor_id):
+        """모터 즉시 정지 - 대기 중인 이동 명령을 버리고 현재 위치 유지(position 모드) 명령을 비상 레인으로 전송"""
+        if not (self.serial and self.serial.is_open):
+            return "❌ 시리얼 포트가 열려있지 않습니다"
+        self.preempt_motor(motor_id)
+        position = self.motor1_position if motor_id == 1 else self.motor2_position
+        cmd = generate_position_mode_command(position, motor_id=motor_id)
+        self._enqueue_command(QueuedCommand(command=cmd, motor_id=motor_id, target_position=position),
+                              lane=LANE_EMERGENCY)
+        print(f"[CMD_QUEUE] 모터{motor_id} 비상 정지 명령 큐잉 - 현재 위치 유지: {position}")
+        return f"🛑 모터{motor_id} 정지 명령 전송 (현재 위치 유지: {position})"
+
+    def stop_all(self):
+        """모터1, 모터2 모두 즉시 정지"""
+        return " / ".join(self.stop_motor(motor_id) for motor_id in (1, 2))
+
+    def get_queue_stats(self):
+        """우선순위 레인별 대기 깊이 및 대기 시간 통계"""
+        return self.command_queue.get_stats()
+
+    def set_poll_rates(self, active_hz=None, idle_hz=None):
+        """적응형 상태 폴링 주기 설정 (Hz)"""
+        if active_hz is not None:
+            if active_hz <= 0:
+                raise ValueError(f"active_hz는 0보다 커야 합니다: {active_hz}")
+            self.poll_rate_active = float(active_hz)
+        if idle_hz is not None:
+            if idle_hz <= 0:
+                raise ValueError(f"idle_hz는 0보다 커야 합니다: {idle_hz}")
+            self.poll_rate_idle = float(idle_hz)
+        self._wake_sender()
+        print(f"[POLL] 상태 폴링 주기 설정 - 이동 중: {self.poll_rate_active}Hz, 정지: {self.poll_rate_idle}Hz")
+
+    def set_sweep_mode(self, enabled):
+        """버스 스윕 모드 설정 (True: 두 모터 상태 읽기를 한 번에 연달아 전송)"""
+        self.sweep_mode = bool(enabled)
+        self._wake_sender()
+        print(f"[SWEEP] 버스 스윕 모드: {'ON' if self.sweep_mode else 'OFF'} (간격 {self.pipeline_gap * 1000:.2f}ms)")
+
+    def _sweep_wire_time(self):
+        """현재 통신 설정에서 스윕 1회(요청 2개 + 응답 2개)의 순수 전송 시간 (초)"""
+        if not self.serial:
+            return None
+        bits_per_byte = 1 + self.serial.bytesize + (self.serial.parity != serial.PARITY_NONE) + self.serial.stopbits
+        sweep_bytes = 2 * (len(generate_status_read_command(0x01)) + self.status_frame_size)
+        return sweep_bytes * bits_per_byte / self.serial.baudrate
+
+    def _calibrate_sweep_gap(self, sweeps=3, timeout=0.05):
+        """
+        연결 직후(송수신 스레드 시작 전) 모터1/모터2 상태 읽기를 연달아 보내면서
+        두 응답이 모두 수신되는 최소 간격을 찾아 pipeline_gap으로 설정
+        - 응답이 하나도 없으면(드라이버 미연결) 보정을 중단하고 inter_frame_gap 사용
+        """
+        status_cmds = (generate_status_read_command(0x01), generate_status_read_command(0x02))
+        parser = MotorFrameParser()
+        self.sweep_calibrated = False
+        self.pipeline_gap = self.inter_frame_gap
+        try:
+            self.serial.reset_input_buffer()
+            for gap in self.sweep_gap_candidates:
+                periods = []
+                any_response = False
+                for _ in range(sweeps):
+                    start = time.perf_counter()
+                    self.serial.write(status_cmds[0])
+                    self.serial.flush()
+                    if gap:
+                        time.sleep(gap)
+                    self.serial.write(status_cmds[1])
+                    self.serial.flush()
+
+                    received = set()
+                    deadline = start + timeout
+                    while len(received) < 2:
+                        remaining = deadline - time.perf_counter()
+                        if remaining <= 0:
+                            break
+                        self.serial.timeout = remaining
+                        data = self.serial.read(1)
+                        if data and self.serial.in_waiting:
+                            data += self.serial.read(self.serial.in_waiting)
+                        for frame in parser.feed(data):
+                            if decode_status(frame) is not None and frame[3] in (0x01, 0x02):
+                                received.add(frame[3])
+                                self.status_frame_size = len(frame)
+                    any_response = any_response or bool(received)
+                    if len(received) < 2:
+                        break
+                    periods.append(time.perf_counter() - start)
+
+                if len(periods) == sweeps:
+                    return self._apply_sweep_calibration(gap, periods)
+                if not any_response:
+                    break
+                time.sleep(timeout)  # 늦게 도착하는 응답을 버리고 다음 간격 시도
+                self.serial.reset_input_buffer()
+                parser.reset()
+            print(f"[SWEEP] 버스 간격 보정 실패 - 기본 간격 {self.inter_frame_gap * 1000:.0f}ms 사용")
+            return None
+        except Exception as e:
+            print(f"[SWEEP] 버스 간격 보정 중 오류: {e}")
+            return None
+        finally:
+            self.serial.timeout = self.read_timeout
+            self.serial.reset_input_buffer()
+
+    def _apply_sweep_calibration(self, gap, periods):
+        self.pipeline_gap = gap
+        self.sweep_calibrated = True
+        print(f"[SWEEP] 버스 간격 보정 완료 - 최소 간격: {gap * 1000:.2f}ms, "
+              f"스윕 주기: {sum(periods) / len(periods) * 1000:.2f}ms "
+              f"(전송 한계 {self._sweep_wire_time() * 1000:.2f}ms)")
+        return gap
+
+    def get_sweep_stats(self):
+        """스윕 주기 통계 (ms) 및 통신 속도 기준 전송 한계 대비 효율"""
+        periods = sorted(self.sweep_history)
+        wire_time = self._sweep_wire_time()
+        stats = {
+            "enabled": self.sweep_mode,
+            "calibrated": self.sweep_calibrated,
+            "gap_ms": round(self.pipeline_gap * 1000, 2),
+            "sweeps": len(periods),
+            "period_last_ms": None,
+            "period_mean_ms": None,
+            "period_p95_ms": None,
+            "wire_limit_ms": round(wire_time * 1000, 2) if wire_time else None,
+            "efficiency": None,  # 전송 한계 / 평균 스윕 주기 (1.0이면 통신 속도 한계)
+        }
+        if periods:
+            mean = sum(periods) / len(periods)
+            stats["period_last_ms"] = round(self.sweep_history[-1] * 1000, 2)
+            stats["period_mean_ms"] = round(mean * 1000, 2)
+            stats["period_p95_ms"] = round(periods[max(int(len(periods) * 0.95) - 1, 0)] * 1000, 2)
+            if wire_time:
+                stats["efficiency"] = round(wire_time / mean, 3)
+        return stats
+
+    def is_motor_active(self, motor_id):
+        """모터가 이동 중이거나 완료 대기 명령이 있는지 여부"""
+        if time.perf_counter() - self.last_move_time[motor_id] < self.active_hold_time:
+            return True
+        cmd = self.current_command
+        if cmd and cmd.wait_for_completion and cmd.motor_id == motor_id:
+            return True
+        return self.motor_moving[motor_id]
+
+    def get_poll_interval(self, motor_id):
+        rate = self.poll_rate_active if self.is_motor_active(motor_id) else self.poll_rate_idle
+        return 1.0 / rate
+
+    def get_transaction_stats(self):
+        """모터별 요청/응답 왕복 시간(RTT) 및 타임아웃 통계"""
+        return self.transactions.get_stats()
+
+    def get_poll_rates(self, window=1.0):
+        """최근 window초 동안 실제 달성한 모터별 상태 읽기 주기 (Hz)"""
+        now = time.perf_counter()
+        rates = {}
+        for motor_id, history in self.poll_history.items():
+            recent = [t for t in list(history) if now - t <= window]
+            rates[motor_id] = round(len(recent) / window, 1)
+        return rates
+
     def check_thread_health(self):
         """스레드 상태 확인 및 stuck 상태 감지"""
         current_time = time.time()
@@ -505,197 +846,259 @@ class DualMotorController:
             self.recovery_in_progress = False
 
     def send_loop(self):
-        """큐 기반 명령어 전송 루프 - 모든 시리얼 쓰기 작업을 순차적으로 처리"""
+        """
+        큐 기반 명령어 전송 루프 - 모든 시리얼 쓰기 작업을 순차적으로 처리
+        상태 읽기는 모터별 적응형 스케줄(이동 중: poll_rate_active, 정지: poll_rate_idle)로 전송하고,
+        다음 폴링 시각까지는 send_event를 기다리며 대기 (명령 큐잉 시 즉시 깨어남)
+        """
         print("[THREAD] send_loop 시작")
         while self.running:
             try:
                 # 스레드 활동 시간 업데이트
                 self.sender_last_activity = time.time()
-                # 1. 완료 대기 중이 아닐 때만 새 명령어 처리
-                if not (self.current_command and self.current_command.wait_for_completion):
-                    try:
-                        queued_cmd = self.command_queue.get_nowait()
-                        
-                        # 2. 명령어 전송 및 처리 대기
-                        if self.serial and self.serial.is_open:
-                            # QueuedCommand 객체에서 실제 명령어 추출
-                            if isinstance(queued_cmd, QueuedCommand):
-                                cmd_bytes = queued_cmd.command
-                                motor_id = queued_cmd.motor_id
-                                wait_completion = queued_cmd.wait_for_completion
-                                target_pos = queued_cmd.target_position
-                                tolerance = queued_cmd.completion_tolerance
-                            else:
-                                # 하위 호환성: 기존 bytes 객체 처리
-                                cmd_bytes = queued_cmd
-                                motor_id = 1
-                                wait_completion = False
-                                target_pos = None
-                                tolerance = 50
-                            
-                            bytes_written = self.serial.write(cmd_bytes)
-                            self.serial.flush()
-                            print(f"[CMD_QUEUE] 우선순위 명령 전송: {cmd_bytes.hex().upper()} (모터{motor_id}, {bytes_written} bytes)")
-                            
-                            # 3. 완료 대기가 필요한 경우 현재 명령 저장 (비블로킹)
-                            if wait_completion and target_pos is not None:
-                                print(f"[CMD_QUEUE] 명령 완료 대기 설정 - 목표위치: {target_pos}({target_pos/40:.1f}mm), 허용오차: {tolerance}")
-                                with self.lock:
-                                    self.current_command = queued_cmd
-                                    self.current_command.wait_start_time = time.time()  # 대기 시작 시간 기록
-                            else:
-                                time.sleep(0.005)  # 드라이버 처리 시간 보장 (5ms)
-                        
-                    except Empty:
-                        pass  # 큐가 비어있으면 상태 폴링으로 이동
-                
-                # 완료 대기 중인 명령 체크 (항상 실행)
-                with self.lock:
-                    if self.current_command and self.current_command.wait_for_completion:
-                        cmd = self.current_command
-                        current_time = time.time()
-                        
-                        # 현재 위치 확인
-                        if cmd.motor_id == 2:
-                            current_pos = self.motor2_position
-                        else:
-                            current_pos = self.position
-                        
-                        # 목표 위치 도달 확인
-                        if abs(current_pos - cmd.target_position) <= cmd.completion_tolerance:
-                            elapsed = current_time - cmd.wait_start_time
-                            print(f"[CMD_QUEUE] 명령 완료! 위치도달: {current_pos}({current_pos/40:.1f}mm), 소요시간: {elapsed:.2f}초")
-                            self.current_command = None  # 완료 대기 해제
-                        elif current_time - cmd.wait_start_time > 30:  # 30초 타임아웃
-                            print(f"[CMD_QUEUE] 명령 완료 대기 타임아웃 (30초) - 현재위치: {current_pos}, 목표: {cmd.target_position}")
-                            self.current_command = None  # 타임아웃으로 해제
-                
-                # Motor 1 상태 읽기
-                with self.lock:
-                    if self.last_command_motor1 and self.serial and self.serial.is_open:
-                        bytes_written = self.serial.write(self.last_command_motor1)
-                        self.serial.flush()
-                        if bytes_written != len(self.last_command_motor1):
-                            print(f"[Warning] 모터1 전송된 바이트 수 불일치: {bytes_written}/{len(self.last_command_motor1)}")
-                
-                time.sleep(0.01)  # 모터 간 간격 (10ms)
-                
-                # Motor 2 상태 읽기 (기존 감속 로직 제거 - 2단계 큐 시스템 사용)
-                with self.lock:
-                    if self.last_command_motor2 and self.serial and self.serial.is_open:
-                        bytes_written = self.serial.write(self.last_command_motor2)
-                        self.serial.flush()
-                        if bytes_written != len(self.last_command_motor2):
-                            print(f"[Warning] 모터2 전송된 바이트 수 불일치: {bytes_written}/{len(self.last_command_motor2)}")
-                
-                time.sleep(0.03)  # 다음 루프까지 대기 (30ms) - 총 50ms 주기
+
+                # 1~3. 새 명령어 전송 (완료 대기 중에는 비상 레인 명령만 전송)
+                queued_cmd = self._next_command()
+                if queued_cmd is not None:
+                    cmd_bytes = self._command_bytes(queued_cmd)
+                    bytes_written = self._write_frame(cmd_bytes)
+                    if self._command_sent(queued_cmd, bytes_written):
+                        time.sleep(self.command_settle_time)  # 드라이버 처리 시간 보장 (5ms)
+
+                self._check_command_timeout()
+                self._expire_motion_waiters()
+
+                # 4. 폴링 시각이 된 모터만 상태 읽기
+                for motor_id, status_cmd in self._due_status_reads():
+                    bytes_written = self._write_frame(status_cmd, gap=self.pipeline_gap)
+                    self._status_read_sent(motor_id, status_cmd, bytes_written)
+
+                # 5. 다음 폴링 시각까지 대기 (명령 큐잉 또는 응답 수신 시 즉시 깨어남)
+                wait = self._next_wake_delay()
+                if wait > 0:
+                    self.send_event.wait(wait)
+                self.send_event.clear()
                         
             except Exception as e:
                 print(f"[CMD_QUEUE Error] {str(e)}")
                 time.sleep(0.1)
 
+    # --- send_loop 단계별 처리 (블로킹 I/O 없음 - AsyncDualMotorController와 공용) ---
+
+    def _wake_sender(self):
+        """전송 루프를 즉시 깨움"""
+        self.send_event.set()
+
+    def _command_bytes(self, queued_cmd):
+        return queued_cmd.command if isinstance(queued_cmd, QueuedCommand) else queued_cmd
+
+    def _command_motor_id(self, queued_cmd):
+        if isinstance(queued_cmd, QueuedCommand):
+            return queued_cmd.motor_id
+        # 하위 호환성: 기존 bytes 객체 처리 (모터 ID는 프레임 4번째 바이트)
+        return queued_cmd[3] if len(queued_cmd) > 3 else 1
+
+    def _next_command(self):
+        """
+        다음에 전송할 명령 꺼내기 (없거나 포트가 닫혀 있으면 None)
+        완료 대기 중에는 비상 레인 명령만 꺼내고, 취소된 이동 명령은 건너뜀
+        """
+        while True:
+            waiting_completion = bool(self.current_command and self.current_command.wait_for_completion)
+            try:
+                queued_cmd = self.command_queue.get_nowait(
+                    max_lane=LANE_EMERGENCY if waiting_completion else LANE_BOOKKEEPING)
+            except Empty:
+                return None  # 큐가 비어있으면 상태 폴링으로 이동
+            if not (self.serial and self.serial.is_open):
+                return None
+
+            # 이동 완료 Future는 전송 전에 등록 (전송 중 clear_queue 시에도 취소되도록)
+            future = queued_cmd.future if isinstance(queued_cmd, QueuedCommand) else None
+            if future:
+                motor_id = queued_cmd.motor_id
+                if future.cancelled():
+                    print(f"[CMD_QUEUE] 취소된 명령 건너뜀: {queued_cmd.command.hex().upper()} (모터{motor_id})")
+                    continue
+                if queued_cmd.resolves_future:
+                    with self.lock:
+                        self.motion_waiters[motor_id].append(future)
+            return queued_cmd
+
+    def _command_sent(self, queued_cmd, bytes_written):
+        """
+        명령 전송 직후 처리 - 완료 대기 명령이면 current_command로 저장 (비블로킹)
+        Returns: 드라이버 처리 시간(command_settle_time)만큼 쉬어야 하면 True
+        """
+        cmd_bytes = self._command_bytes(queued_cmd)
+        motor_id = self._command_motor_id(queued_cmd)
+        self.last_move_time[motor_id] = time.perf_counter()
+        future = queued_cmd.future if isinstance(queued_cmd, QueuedCommand) else None
+        if future and future.started_at is None:
+            future.started_at = self.last_write_time
+        self.next_poll_time[motor_id] = 0.0  # 이동 명령 직후 바로 상태 확인
+        print(f"[CMD_QUEUE] 우선순위 명령 전송: {cmd_bytes.hex().upper()} (모터{motor_id}, {bytes_written} bytes)")
+
+        if isinstance(queued_cmd, QueuedCommand) and queued_cmd.wait_for_completion and queued_cmd.target_position is not None:
+            target_pos = queued_cmd.target_position
+            print(f"[CMD_QUEUE] 명령 완료 대기 설정 - 목표위치: {target_pos}({target_pos/40:.1f}mm), 허용오차: {queued_cmd.completion_tolerance}")
+            with self.lock:
+                self.current_command = queued_cmd
+                self.current_command.wait_start_time = time.time()  # 대기 시작 시간 기록
+            return False
+        return True
+
+    def _check_command_timeout(self):
+        """완료 대기 중인 명령의 타임아웃 체크 (목표 도달은 상태 프레임 수신 시 _check_motion_completion에서 처리)"""
+        with self.lock:
+            if self.current_command and self.current_command.wait_for_completion:
+                cmd = self.current_command
+                current_time = time.time()
+                current_pos = self.motor2_position if cmd.motor_id == 2 else self.position
+                if current_time - cmd.wait_start_time > 30:  # 30초 타임아웃
+                    print(f"[CMD_QUEUE] 명령 완료 대기 타임아웃 (30초) - 현재위치: {current_pos}, 목표: {cmd.target_position}")
+                    self.current_command = None  # 타임아웃으로 해제
+
+    def _due_status_reads(self):
+        """
+        지금 보내야 할 상태 읽기 명령 목록 [(motor_id, status_cmd)] 반환 및 다음 폴링 시각 예약
+        - 응답 대기 중인(in-flight 한도 도달) 모터는 건너뛰고, 다른 모터는 pipeline_gap만 두고 연달아 전송
+        - 스윕 모드에서는 한 모터라도 시각이 되면 두 모터를 함께 읽고 빠른 쪽 주기로 다음 스윕 예약
+        """
+        now = time.perf_counter()
+        due_motors = [motor_id for motor_id in (1, 2) if now >= self.next_poll_time[motor_id]]
+        if not due_motors:
+            return []
+        if self.sweep_mode:
+            due_motors = (1, 2)
+            next_sweep = now + min(self.get_poll_interval(1), self.get_poll_interval(2))
+        reads = []
+        for motor_id in due_motors:
+            if self.sweep_mode:
+                self.next_poll_time[motor_id] = next_sweep
+            if not self.transactions.can_send(motor_id):
+                continue  # 응답 수신 또는 만료 시 다시 시도
+            if not self.sweep_mode:
+                self.next_poll_time[motor_id] = now + self.get_poll_interval(motor_id)
+            with self.lock:
+                status_cmd = self.last_command_motor1 if motor_id == 1 else self.last_command_motor2
+            if status_cmd and self.serial and self.serial.is_open:
+                reads.append((motor_id, status_cmd))
+        if self.sweep_mode and reads:
+            with self.lock:
+                self.current_sweep = (now, {motor_id for motor_id, _ in reads})
+        return reads
+
+    def _status_read_sent(self, motor_id, status_cmd, bytes_written):
+        self.transactions.begin(motor_id, status_cmd[4])
+        if bytes_written != len(status_cmd):
+            print(f"[Warning] 모터{motor_id} 전송된 바이트 수 불일치: {bytes_written}/{len(status_cmd)}")
+        self.poll_history[motor_id].append(self.last_write_time)
+
+    def _next_wake_delay(self):
+        """다음 폴링 시각까지 남은 시간 (응답 대기 중인 모터는 응답 만료 시각까지, 초)"""
+        now = time.perf_counter()
+        wake_times = []
+        for motor_id in (1, 2):
+            due = self.next_poll_time[motor_id]
+            expiry = self.transactions.next_expiry(motor_id)
+            wake_times.append(expiry if due <= now and expiry is not None else due)
+        return min(wake_times) - now
+
+    def _frame_delay(self, gap=None):
+        """버스 최소 간격(기본 inter_frame_gap)을 지키기 위해 전송 전 기다려야 하는 시간 (초)"""
+        if gap is None:
+            gap = self.inter_frame_gap
+        return self.last_write_time + gap - time.perf_counter()
+
+    def _write_frame(self, data, gap=None):
+        """버스 최소 간격(기본 inter_frame_gap)을 지킨 뒤 프레임 전송"""
+        wait = self._frame_delay(gap)
+        if wait > 0:
+            time.sleep(wait)
+        bytes_written = self.serial.write(data)
+        self.serial.flush()
+        self.last_write_time = time.perf_counter()
+        return bytes_written
+
     def read_loop(self):
+        """
+        이벤트 기반 수신 루프
+        고정 sleep 폴링 대신 첫 바이트가 도착할 때까지 블로킹 대기(read_timeout)하고,
+        깨어나면 수신 버퍼에 쌓인 나머지 바이트를 한 번에 읽어 즉시 파싱
+        """
         print("[THREAD] read_loop 시작")
-        buffer = bytearray()
+        parser = MotorFrameParser()
         while self.running:
             try:
-                # 스레드 활동 시간 업데이트
+                # 스레드 활동 시간 업데이트 (유휴 상태에서도 read_timeout 주기로 갱신)
                 self.reader_last_activity = time.time()
-                time.sleep(0.01)
-                
-                # 시리얼 데이터 읽기
-                if hasattr(self.serial, 'in_waiting') and self.serial.in_waiting > 0:
-                    data = self.serial.read(self.serial.in_waiting)
-                else:
-                    data = self.serial.read(1024)
-                
-                if data:
-                    buffer += data
 
-                    while True:
-                        if len(buffer) < 2:
-                            break
+                # 바이트 도착 시 즉시 반환, 없으면 read_timeout 후 빈 값 반환
+                data = self.serial.read(1)
+                if data:
+                    waiting = self.serial.in_waiting
+                    if waiting > 0:
+                        data += self.serial.read(waiting)
 
-                        # 헤더 확인
-                        if buffer[0] == 0xAA and buffer[1] == 0x55:
-                            # 다음 헤더 찾기
-                            next_header_index = self.find_next_header(buffer)
-                            if next_header_index:
-                                frame = buffer[:next_header_index]
-                                buffer = buffer[next_header_index:]
-                                self.parse_response(frame)
-                            else:
-                                break  # 다음 헤더 없으면 대기
-                        else:
-                            buffer.pop(0)
+                if data:
+                    # 길이 바이트 기반으로 완성된 프레임만 즉시 파싱 (다음 헤더를 기다리지 않음)
+                    for frame in parser.feed(data):
+                        self.parse_response(frame)
             except Exception as e:
                 print(f"[DualReadThread Error] {str(e)}")
                 time.sleep(0.1)
 
-    def find_next_header(self, buffer):
-        try:
-            for i in range(2, len(buffer) - 1):
-                if buffer[i] == 0xAA and buffer[i+1] == 0x55:
-                    return i
-            return None
-        except Exception as e:
-            print(f"[FindHeader Error] {str(e)}")
-            return None
-
     def parse_response(self, frame):
         try:
-            hex_str = frame.hex().upper()
-
-            if len(hex_str) < 34:  # 최소 필요한 길이 체크
+            status = decode_status(frame)
+            if status is None:  # 최소 필요한 길이 체크
                 return
 
-            # 모터 ID 확인 (프레임의 6-7번째 문자, 즉 3번째 바이트)
-            motor_id_hex = hex_str[6:8]
-            motor_id = int(motor_id_hex, 16)
-
-            # 모터1과 모터2 모두 동일한 방식으로 파싱
-            setPos_val = hex_str[14:18]  # setPos
-            rec_val = hex_str[18:22]  # actPos
-            force_val = hex_str[26:30]  # force
-            sensor_val = hex_str[30:34]  # sensor
-
-            setPos_reorder = setPos_val[2:] + setPos_val[:2]
-            rec_reorder = rec_val[2:] + rec_val[:2]
-            force_reorder = force_val[2:] + force_val[:2]
-            sensor_reorder = sensor_val[2:] + sensor_val[:2]
-
-            setPos = int(setPos_reorder, 16)
-            position = int(rec_reorder, 16)
-            force = int(force_reorder, 16)
-            sensor = int(sensor_reorder, 16)
-
-            if setPos >= 0x8000:
-                setPos -= 0x10000
-            if position >= 0x8000:
-                position -= 0x10000
-            if force >= 0x8000:
-                force -= 0x10000
-            if sensor >= 0x8000:
-                sensor -= 0x10000
+            # 모터1과 모터2 모두 동일한 방식으로 파싱 (little-endian signed 16bit)
+            motor_id, setPos, position, force, sensor = status
 
             # 모터 ID에 따라 상태 업데이트
             if motor_id == 0x01:
-                prev_pos = self.motor1_position
+                self.motor_moving[1] = (position != self.motor1_position
+                                        or abs(setPos - position) > self.motion_tolerance)
                 self.motor1_setPos = setPos
                 self.motor1_position = position
                 self.motor1_force = round(force * 0.001 * 9.81, 1)
                 self.motor1_sensor = sensor
             elif motor_id == 0x02:
-                prev_pos = self.motor2_position
+                self.motor_moving[2] = (position != self.motor2_position
+                                        or abs(setPos - position) > self.motion_tolerance)
                 self.motor2_setPos = setPos
                 self.motor2_position = position
                 self.motor2_force = round(force * 0.001 * 9.81, 1)
                 self.motor2_sensor = sensor
 
+            # 목표 위치 도달 확인 (완료 대기 명령 해제, 이동 Future 완료)
+            if motor_id in (0x01, 0x02):
+                self._check_motion_completion(motor_id, position)
+
+            # 응답을 대응하는 요청과 매칭 (RTT 기록) 후 전송 루프 깨움
+            transaction = self.transactions.complete(motor_id, frame[4])
+            if transaction and self.current_sweep:
+                self._record_sweep_response(motor_id, transaction.completed_at)
+            self._wake_sender()
+
         except Exception as e:
             print(f"[DualParse Error] {str(e)}")
             print(f"[DualParse Error] frame: {frame.hex().upper()}")
-            print(f"[DualParse Error] frame length: {len(frame)}, hex length: {len(frame.hex())}")
+            print(f"[DualParse Error] frame length: {len(frame)}")
+
+    def _record_sweep_response(self, motor_id, completed_at):
+        """스윕 응답 수신 기록 - 두 모터 응답이 모두 오면 스윕 주기 저장"""
+        with self.lock:
+            if not self.current_sweep:
+                return
+            started_at, waiting = self.current_sweep
+            waiting.discard(motor_id)
+            if not waiting:
+                self.sweep_history.append(completed_at - started_at)
+                self.current_sweep = None
 
     # Motor 2 상태 조회 함수들
     def get_motor2_status(self):
@@ -2,28 +2,302 @@
 ws_server.py EEPROM 함수 FT232H 변환
 - 기존 SMBus 방식의 EEPROM 통신 함수를 FT232H(pyftdi) 방식으로 변경
 - 주소, 오프셋, 필드 구조는 ws_server.py 기준 그대로 유지
+- I2cController는 I2cSession으로 한 번만 configure해서 재사용 (호출마다 USB 열기/MPSSE 초기화 없음)
+- 레코드 인코딩/디코딩은 eeprom_layout의 변형별 struct 코덱 사용 → 페이지 쓰기 + ACK polling, 읽기는 순차 읽기 1회
+- write_mode="diff": 현재 레코드와 비교해서 바뀐 바이트만 쓰고, 쓴 범위만 다시 읽어 검증
 """
 
+import atexit
 import time
+from contextlib import contextmanager
+from threading import Lock
+
+from pyftdi.ftdi import FtdiError
 from pyftdi.i2c import I2cController, I2cIOError
+from usb.core import USBError
+
+from eeprom_layout import EEPROM_VARIANTS, get_eeprom_layout
 
 # FT232H 설정
 FTDI_URL = 'ftdi://ftdi:232h/1'
 
-# ws_server.py와 동일한 EEPROM 설정 유지
-MTR20_EEPROM_ADDRESS = 0x50  # 기존 그대로
-MTR20_CLASSYS_OFFSET = 0x10  # 기존 그대로
-MTR20_CUTERA_OFFSET = 0x80   # 기존 그대로
+# ws_server.py와 동일한 EEPROM 설정 유지 (실제 값은 eeprom_layout.EEPROM_VARIANTS)
+MTR20_EEPROM_ADDRESS = EEPROM_VARIANTS[("2.0", "CLASSYS")].address  # 0x50
+MTR20_CLASSYS_OFFSET = EEPROM_VARIANTS[("2.0", "CLASSYS")].offset   # 0x10
+MTR20_CUTERA_OFFSET = EEPROM_VARIANTS[("2.0", "CUTERA")].offset     # 0x80
+
+MTR40_EEPROM_ADDRESS = EEPROM_VARIANTS[("4.0", None)].address       # 0x51
+MTR40_OFFSET = EEPROM_VARIANTS[("4.0", None)].offset                # 0x70
+
+# 24C02는 8바이트 페이지, 24C04~24C16은 16바이트 → 8바이트 단위로 나눠 쓰면 양쪽 모두 페이지 경계를 넘지 않음
+EEPROM_PAGE_SIZE = 8
+WRITE_CYCLE_TIMEOUT = 0.02   # 내부 쓰기 사이클(tWR, 데이터시트 최대 5~10ms) 대기 한도
+ACK_POLL_INTERVAL = 0.0005   # ACK polling 간격 (USB 왕복 시간이 더 길어서 실제로는 거의 바로 재시도)
+
+# 쓰기 모드
+WRITE_MODE_FULL = "full"  # 레코드 전체 쓰기 (쓰기 후 ws_server에서 전체 읽기로 확인)
+WRITE_MODE_DIFF = "diff"  # 바뀐 바이트만 쓰기 + 쓴 범위만 검증
+
+# 이 오류가 나면 FT232H 세션을 버리고 다시 configure (NACK, USB 분리/재연결 등)
+I2C_SESSION_ERRORS = (I2cIOError, FtdiError, USBError, OSError)
+
+
+class EepromVerifyError(Exception):
+    """쓰기 후 다시 읽은 값이 쓴 값과 다름"""
+
+
+class I2cSession:
+    """
+    오래 유지되는 FT232H I2C 세션
+
+    - 처음 사용할 때 I2cController를 configure하고, 이후 호출은 같은 컨트롤러를 재사용
+    - Lock으로 보호되어 한 번에 하나의 호출만 버스를 사용
+    - health_check_interval 이상 쉬었다가 사용할 때는 FTDI 장치 응답(modem status)을 먼저 확인
+    - I2cIOError/USB 오류가 나면 세션을 무효화 → 다음 사용 시 자동으로 다시 configure
+
+    Args:
+        url: FTDI 장치 URL
+        health_check_interval: 이 시간(초) 이상 사용하지 않았으면 사용 전 상태 확인
+    """
+
+    def __init__(self, url=FTDI_URL, health_check_interval=5.0):
+        self.url = url
+        self.health_check_interval = health_check_interval
+        self._lock = Lock()
+        self._controller = None
+        self._last_used = 0.0
+
+        # 통계
+        self.configure_count = 0
+        self.invalidations = 0
+        self.health_checks = 0
+        self.last_configure_time = None
+
+    def _configure(self):
+        start = time.perf_counter()
+        controller = I2cController()
+        controller.configure(self.url)
+        self._controller = controller
+        self.configure_count += 1
+        self.last_configure_time = time.perf_counter() - start
+        print(f"[I2C_SESSION] FT232H 세션 configure 완료 ({self.last_configure_time * 1000:.1f}ms, {self.configure_count}회째)")
+
+    def _is_healthy(self):
+        """FTDI 장치가 아직 응답하는지 확인 (USB 제어 전송 1회)"""
+        self.health_checks += 1
+        try:
+            self._controller.ftdi.poll_modem_status()
+            return True
+        except Exception as e:
+            print(f"[I2C_SESSION] 상태 확인 실패: {e}")
+            return False
+
+    def _invalidate(self):
+        controller, self._controller = self._controller, None
+        if controller is not None:
+            self.invalidations += 1
+            try:
+                if controller.configured:
+                    controller.terminate()
+            except Exception:
+                pass
+
+    @contextmanager
+    def port(self, address):
+        """
+        I2C 슬레이브 포트를 빌려줌 (with 블록 동안 Lock 보유)
+        블록 안에서 I2C/USB 오류가 나면 세션을 무효화하고 예외를 그대로 전달
+        """
+        with self._lock:
+            if self._controller is not None and time.perf_counter() - self._last_used > self.health_check_interval:
+                if not self._is_healthy():
+                    self._invalidate()
+            if self._controller is None:
+                self._configure()
+            try:
+                yield self._controller.get_port(address)
+            except I2C_SESSION_ERRORS:
+                self._invalidate()
+                raise
+            finally:
+                self._last_used = time.perf_counter()
+
+    def run(self, address, func, retries=1):
+        """func(slave) 실행 - I2C/USB 오류 시 다시 configure 후 retries번까지 재시도"""
+        for attempt in range(retries + 1):
+            try:
+                with self.port(address) as slave:
+                    return func(slave)
+            except I2C_SESSION_ERRORS as e:
+                if attempt >= retries:
+                    raise
+                print(f"[I2C_SESSION] I2C 오류 - 재configure 후 재시도 ({attempt + 1}/{retries}): {e}")
+
+    def close(self):
+        with self._lock:
+            self._invalidate()
+
+    def get_stats(self):
+        return {
+            "configured": self._controller is not None,
+            "configure_count": self.configure_count,
+            "invalidations": self.invalidations,
+            "health_checks": self.health_checks,
+            "last_configure_ms": round(self.last_configure_time * 1000, 2) if self.last_configure_time is not None else None,
+        }
+
+
+i2c_session = I2cSession()
+atexit.register(i2c_session.close)
+
+
+def read_record(slave, layout):
+    """레코드 전체를 순차 읽기 1회로 읽음"""
+    return slave.read_from(layout.offset, layout.size)
+
+
+def wait_write_cycle(slave, timeout=WRITE_CYCLE_TIMEOUT):
+    """쓰기 후 EEPROM이 다시 ACK할 때까지 polling (고정 sleep 대신 실제 tWR만큼만 대기)"""
+    deadline = time.perf_counter() + timeout
+    while not slave.poll(write=True):
+        if time.perf_counter() > deadline:
+            raise I2cIOError(f"EEPROM 쓰기 사이클 타임아웃 ({timeout * 1000:.0f}ms)")
+        time.sleep(ACK_POLL_INTERVAL)
+
+
+def write_block(slave, regaddr, data, page_size=EEPROM_PAGE_SIZE):
+    """data를 페이지 경계에서 나눠 페이지 쓰기 - 페이지마다 ACK polling으로 쓰기 완료 대기"""
+    data = bytes(data)
+    position = 0
+    while position < len(data):
+        address = regaddr + position
+        chunk = data[position:position + page_size - address % page_size]
+        slave.write_to(address, chunk)
+        wait_write_cycle(slave)
+        position += len(chunk)
+
+
+def write_record(slave, layout, updates):
+    """
+    현재 레코드를 읽어 updates를 덮어쓴 뒤 레코드 전체를 페이지 쓰기
+    (요청에 없는 선택 필드와 Reserved 바이트는 기존 값 유지)
+    """
+    record = bytearray(read_record(slave, layout))
+    fields = layout.unpack(record)
+    fields.update(updates)
+    layout.pack_into(record, 0, fields)
+    write_block(slave, layout.offset, record)
+
+
+def diff_spans(offset, current, target, page_size=EEPROM_PAGE_SIZE):
+    """
+    바뀐 바이트 범위 [(start, end), ...] (레코드 기준 인덱스)
+    같은 페이지 안의 바뀐 바이트는 사이의 안 바뀐 바이트까지 묶어서 페이지 쓰기 1회로 처리
+    """
+    spans = []
+    for index, (old, new) in enumerate(zip(current, target)):
+        if old == new:
+            continue
+        page = (offset + index) // page_size
+        if spans and spans[-1][2] == page:
+            spans[-1][1] = index + 1
+        else:
+            spans.append([index, index + 1, page])
+    return [(start, end) for start, end, _ in spans]
+
+
+def write_record_diff(slave, layout, updates):
+    """
+    현재 레코드를 한 번 읽고 updates와 다른 바이트만 쓴 뒤, 쓴 범위만 다시 읽어 검증
+    Returns:
+        (쓴 뒤의 레코드 필드 dict, 쓴 바이트 수)
+    """
+    offset = layout.offset
+    current = read_record(slave, layout)
+    fields = layout.unpack(current)
+    fields.update(updates)
+    target = layout.pack(fields)
+
+    spans = diff_spans(offset, current, target)
+    for start, end in spans:
+        slave.write_to(offset + start, target[start:end])
+        wait_write_cycle(slave)
+
+    if spans:
+        # 첫 범위 시작 ~ 마지막 범위 끝을 순차 읽기 1회로 읽고, 쓴 범위만 비교
+        verify_start = spans[0][0]
+        readback = slave.read_from(offset + verify_start, spans[-1][1] - verify_start)
+        for start, end in spans:
+            if readback[start - verify_start:end - verify_start] != target[start:end]:
+                raise EepromVerifyError(f"검증 실패 (오프셋 0x{offset + start:02X}~0x{offset + end - 1:02X})")
+    return fields, sum(end - start for start, end in spans)
+
+
+def _read_result(layout, fields):
+    return {"success": True, **layout.decode_values(fields), **layout.result_info()}
+
+
+def write_eeprom(layout, values, write_mode=WRITE_MODE_FULL):
+    """
+    레이아웃 하나에 레코드 쓰기
+
+    Args:
+        layout: eeprom_layout.EepromLayout
+        values: 프론트엔드 키 dict (tipType, shotCount, year, ... - None인 필드는 기존 값 유지)
+        write_mode: "full"(레코드 전체 쓰기) 또는 "diff"(바뀐 바이트만 쓰고 검증, 결과의 "data"에 검증된 레코드 포함)
+    """
+    try:
+        updates = layout.encode_values(values)
+        # 레코드 페이지 쓰기 (I2C 오류 시 세션 재configure 후 1회 재시도)
+        if write_mode == WRITE_MODE_DIFF:
+            fields, changed_bytes = i2c_session.run(layout.address, lambda slave: write_record_diff(slave, layout, updates))
+        else:
+            i2c_session.run(layout.address, lambda slave: write_record(slave, layout, updates))
+        result = {"success": True, "message": f"{layout.name} EEPROM 쓰기 성공 (주소: 0x{layout.address:02X}, 오프셋: 0x{layout.offset:02X})"}
+        if write_mode == WRITE_MODE_DIFF:
+            result["changedBytes"] = changed_bytes
+            result["data"] = _read_result(layout, fields)  # 쓴 범위 검증 완료 → 전체 다시 읽기 불필요
+        return result
+
+    except Exception as e:
+        return {"success": False, "error": f"EEPROM 쓰기 실패: {e}"}
+
+
+def read_eeprom(layout, max_retries=3):
+    """레이아웃 하나의 레코드 읽기 (순차 읽기 1회, 실패 시 max_retries번까지 재시도)"""
+    for attempt in range(max_retries):
+        try:
+            # 오류 시 세션 무효화 → 다음 시도에서 재configure
+            with i2c_session.port(layout.address) as slave:
+                record = read_record(slave, layout)
+            return {"success": True, **layout.decode(record), **layout.result_info()}
+
+        except Exception as e:
+            print(f"[ERROR] {layout.name} EEPROM 읽기 시도 {attempt + 1}/{max_retries} 실패 (주소: 0x{layout.address:02X}, 오프셋: 0x{layout.offset:02X}): {e}")
+            if attempt < max_retries - 1:
+                time.sleep(0.1)
+            else:
+                return {"success": False, "error": f"EEPROM 읽기 실패: {e}"}
+
 
-MTR40_EEPROM_ADDRESS = 0x51  # 기존 그대로
-MTR40_OFFSET = 0x70          # 기존 그대로
+def _write_values(tip_type, shot_count, year, month, day, maker_code, inspector_code, judge_result, daily_serial):
+    return {
+        "tipType": tip_type,
+        "shotCount": shot_count,
+        "year": year,
+        "month": month,
+        "day": day,
+        "makerCode": maker_code,
+        "inspectorCode": inspector_code,
+        "judgeResult": judge_result,
+        "dailySerial": daily_serial,
+    }
 
 
-def write_eeprom_mtr20(tip_type, shot_count, year, month, day, maker_code, country="CLASSYS", inspector_code=None, judge_result=None, daily_serial=None):
+def write_eeprom_mtr20(tip_type, shot_count, year, month, day, maker_code, country="CLASSYS", inspector_code=None, judge_result=None, daily_serial=None, write_mode=WRITE_MODE_FULL):
     """
     MTR 2.0용 EEPROM 쓰기 함수 (FT232H 방식)
-    ※ ws_server.py의 write_eeprom_mtr20() 함수와 완전히 동일한 로직
-    ※ SMBus → FT232H 통신 방식만 변경
+    ※ ws_server.py의 write_eeprom_mtr20() 함수와 동일한 필드 구조 (레이아웃: eeprom_layout.MTR_RECORD_FIELDS)
     
     Args:
         tip_type: TIP ID (1바이트)
@@ -36,336 +310,35 @@ def write_eeprom_mtr20(tip_type, shot_count, year, month, day, maker_code, count
         inspector_code: 검사기 코드 (문자열, 선택적)
         judge_result: 판정 결과 (PASS=1, NG=0, 선택적)
         daily_serial: 일일 시리얼 번호 (정수, 선택적)
+        write_mode: "full" 또는 "diff" (write_eeprom 참고)
     
     EEPROM 설정:
         - CLASSYS: 주소 0x50, 오프셋 0x10
         - CUTERA: 주소 0x50, 오프셋 0x80
-    
-    레이아웃:
-        offset + 0: TIP TYPE (1바이트)
-        offset + 1~2: SHOT COUNT (2바이트, big-endian)
-        offset + 3~4: Reserved
-        offset + 5: 검사기 코드 (1바이트)
-        offset + 6: 판정 결과 (1바이트: PASS=0x01, NG=0x00)
-        offset + 7~8: 일일 시리얼 번호 (2바이트, big-endian)
-        offset + 9~11: 제조 년/월/일 (3바이트)
-        offset + 12: 제조업체 (1바이트)
     """
-    # 국가에 따른 오프셋 설정 (ws_server.py와 동일)
-    eeprom_address = MTR20_EEPROM_ADDRESS
-    offset = MTR20_CUTERA_OFFSET if country == "CUTERA" else MTR20_CLASSYS_OFFSET
-
-    i2c = I2cController()
-    
-    try:
-        # FT232H 연결
-        i2c.configure(FTDI_URL)
-        slave = i2c.get_port(eeprom_address)
-
-        # TIP ID (offset + 0)
-        # 기존: bus.write_byte_data(eeprom_address, offset + 0, tip_type)
-        slave.write_to(offset + 0, [tip_type])
-        time.sleep(0.01)
-
-        # SHOT COUNT (offset + 1: H, offset + 2: L) - big-endian
-        # 기존: bus.write_byte_data(eeprom_address, offset + 1, (shot_count >> 8) & 0xFF)
-        slave.write_to(offset + 1, [(shot_count >> 8) & 0xFF])
-        time.sleep(0.01)
-        # 기존: bus.write_byte_data(eeprom_address, offset + 2, shot_count & 0xFF)
-        slave.write_to(offset + 2, [shot_count & 0xFF])
-        time.sleep(0.01)
-
-        # 검사기 코드 (offset + 5) - 문자열을 ASCII 값으로 변환
-        if inspector_code is not None:
-            inspector_byte = ord(inspector_code[0]) if inspector_code else 0x41  # 기본값 'A'
-            # 기존: bus.write_byte_data(eeprom_address, offset + 5, inspector_byte & 0xFF)
-            slave.write_to(offset + 5, [inspector_byte & 0xFF])
-            time.sleep(0.01)
-
-        # 판정 결과 (offset + 6)
-        if judge_result is not None:
-            judge_byte = 0x01 if judge_result == "PASS" else 0x00
-            # 기존: bus.write_byte_data(eeprom_address, offset + 6, judge_byte)
-            slave.write_to(offset + 6, [judge_byte])
-            time.sleep(0.01)
-
-        # 일일 시리얼 번호 (offset + 7~8) - 2바이트 big-endian
-        if daily_serial is not None:
-            # 기존: bus.write_byte_data(eeprom_address, offset + 7, (daily_serial >> 8) & 0xFF)
-            slave.write_to(offset + 7, [(daily_serial >> 8) & 0xFF])
-            time.sleep(0.01)
-            # 기존: bus.write_byte_data(eeprom_address, offset + 8, daily_serial & 0xFF)
-            slave.write_to(offset + 8, [daily_serial & 0xFF])
-            time.sleep(0.01)
-
-        # DATE: offset + 9=YEAR, offset + 10=MONTH, offset + 11=DAY
-        # 기존: bus.write_byte_data(eeprom_address, offset + 9, (year - 2000) & 0xFF)
-        slave.write_to(offset + 9, [(year - 2000) & 0xFF])
-        time.sleep(0.01)
-        # 기존: bus.write_byte_data(eeprom_address, offset + 10, month & 0xFF)
-        slave.write_to(offset + 10, [month & 0xFF])
-        time.sleep(0.01)
-        # 기존: bus.write_byte_data(eeprom_address, offset + 11, day & 0xFF)
-        slave.write_to(offset + 11, [day & 0xFF])
-        time.sleep(0.01)
-
-        # MAKER CODE (offset + 12)
-        # 기존: bus.write_byte_data(eeprom_address, offset + 12, maker_code & 0xFF)
-        slave.write_to(offset + 12, [maker_code & 0xFF])
-        time.sleep(0.01)
-
-        # 기존: bus.close()
-        i2c.terminate()
-        return {"success": True, "message": f"MTR 2.0 {country} EEPROM 쓰기 성공 (주소: 0x{eeprom_address:02X}, 오프셋: 0x{offset:02X})"}
-
-    except Exception as e:
-        if i2c.configured:
-            i2c.terminate()
-        return {"success": False, "error": f"EEPROM 쓰기 실패: {e}"}
+    values = _write_values(tip_type, shot_count, year, month, day, maker_code, inspector_code, judge_result, daily_serial)
+    return write_eeprom(get_eeprom_layout("2.0", country), values, write_mode)
 
 
 def read_eeprom_mtr20(country="CLASSYS"):
     """
     MTR 2.0용 EEPROM 읽기 함수 (FT232H 방식)
-    ※ ws_server.py의 read_eeprom_mtr20() 함수와 완전히 동일한 로직
-    ※ SMBus → FT232H 통신 방식만 변경
     
     Args:
         country: 국가 ("CLASSYS" 또는 "CUTERA")
-    
-    EEPROM 설정:
-        - CLASSYS: 주소 0x50, 오프셋 0x10
-        - CUTERA: 주소 0x50, 오프셋 0x80
     """
-    # 국가에 따른 오프셋 설정 (ws_server.py와 동일)
-    eeprom_address = MTR20_EEPROM_ADDRESS
-    offset = MTR20_CUTERA_OFFSET if country == "CUTERA" else MTR20_CLASSYS_OFFSET
-
-    i2c = I2cController()
-    max_retries = 3
-
-    for attempt in range(max_retries):
-        try:
-            # FT232H 연결
-            i2c.configure(FTDI_URL)
-            slave = i2c.get_port(eeprom_address)
-
-            # TIP ID (offset + 0)
-            # 기존: tip_type = bus.read_byte_data(eeprom_address, offset + 0)
-            tip_type = slave.read_from(offset + 0, 1)[0]
-
-            # SHOT COUNT (offset + 1=H, offset + 2=L)
-            # 기존: shot = bus.read_i2c_block_data(eeprom_address, offset + 1, 2)
-            shot = slave.read_from(offset + 1, 2)
-            shot_count = (shot[0] << 8) | shot[1]
-
-            # DATE: offset + 9=YEAR, offset + 10=MONTH, offset + 11=DAY
-            # 기존: year_off = bus.read_byte_data(eeprom_address, offset + 9)
-            year_off = slave.read_from(offset + 9, 1)[0]
-            # 기존: month = bus.read_byte_data(eeprom_address, offset + 10)
-            month = slave.read_from(offset + 10, 1)[0]
-            # 기존: day = bus.read_byte_data(eeprom_address, offset + 11)
-            day = slave.read_from(offset + 11, 1)[0]
-            year = 2000 + year_off
-
-            # MAKER CODE (offset + 12)
-            # 기존: maker_code = bus.read_byte_data(eeprom_address, offset + 12)
-            maker_code = slave.read_from(offset + 12, 1)[0]
-            
-            # 검사기 코드 (offset + 5)
-            # 기존: inspector_code = bus.read_byte_data(eeprom_address, offset + 5)
-            inspector_code = slave.read_from(offset + 5, 1)[0]
-            inspector_char = chr(inspector_code) if 32 <= inspector_code <= 126 else 'A'
-            
-            # 판정 결과 (offset + 6)
-            # 기존: judge_result = bus.read_byte_data(eeprom_address, offset + 6)
-            judge_result = slave.read_from(offset + 6, 1)[0]
-            judge_str = 'PASS' if judge_result == 1 else 'NG' if judge_result == 0 else 'UNKNOWN'
-            
-            # 일일 시리얼 번호 (offset + 7=H, offset + 8=L)
-            # 기존: daily_serial_bytes = bus.read_i2c_block_data(eeprom_address, offset + 7, 2)
-            daily_serial_bytes = slave.read_from(offset + 7, 2)
-            daily_serial = (daily_serial_bytes[0] << 8) | daily_serial_bytes[1]
-
-            # 기존: bus.close()
-            i2c.terminate()
-            
-            return {
-                "success": True,
-                "tipType": tip_type,
-                "shotCount": shot_count,
-                "year": year,
-                "month": month,
-                "day": day,
-                "makerCode": maker_code,
-                "inspectorCode": inspector_char,
-                "judgeResult": judge_str,
-                "dailySerial": daily_serial,
-                "mtrVersion": "2.0",
-                "country": country,
-                "eepromAddress": f"0x{eeprom_address:02X}",
-                "offset": f"0x{offset:02X}"
-            }
-
-        except Exception as e:
-            print(f"[ERROR] MTR 2.0 {country} EEPROM 읽기 시도 {attempt + 1}/{max_retries} 실패 (주소: 0x{eeprom_address:02X}, 오프셋: 0x{offset:02X}): {e}")
-            if i2c.configured:
-                i2c.terminate()
-            if attempt < max_retries - 1:
-                time.sleep(0.1)
-            else:
-                return {"success": False, "error": f"EEPROM 읽기 실패: {e}"}
+    return read_eeprom(get_eeprom_layout("2.0", country))
 
 
-def write_eeprom_mtr40(tip_type, shot_count, year, month, day, maker_code, inspector_code=None, judge_result=None, daily_serial=None):
+def write_eeprom_mtr40(tip_type, shot_count, year, month, day, maker_code, inspector_code=None, judge_result=None, daily_serial=None, write_mode=WRITE_MODE_FULL):
     """
-    MTR 4.0용 EEPROM 쓰기 함수 (FT232H 방식)
-    ※ ws_server.py의 write_eeprom_mtr40() 함수와 완전히 동일한 로직
-    ※ SMBus → FT232H 통신 방식만 변경
-    
-    EEPROM 설정:
-        - 주소: 0x51
-        - 오프셋: 0x70
-    
-    레이아웃:
-        offset + 0: TIP TYPE (1바이트)
-        offset + 1~2: SHOT COUNT (2바이트, big-endian)
-        offset + 3~4: Reserved
-        offset + 5: 검사기 코드 (1바이트)
-        offset + 6: 판정 결과 (1바이트: PASS=0x01, NG=0x00)
-        offset + 7~8: 일일 시리얼 번호 (2바이트, big-endian)
-        offset + 9~11: 제조 년/월/일 (3바이트)
-        offset + 12: 제조업체 (1바이트)
+    MTR 4.0용 EEPROM 쓰기 함수 (FT232H 방식, 주소 0x51, 오프셋 0x70)
+    인자는 write_eeprom_mtr20과 동일 (국가 구분 없음)
     """
-    eeprom_address = MTR40_EEPROM_ADDRESS
-    offset = MTR40_OFFSET
-
-    i2c = I2cController()
-    
-    try:
-        # FT232H 연결
-        i2c.configure(FTDI_URL)
-        slave = i2c.get_port(eeprom_address)
-
-        # TIP ID (offset + 0)
-        slave.write_to(offset + 0, [tip_type])
-        time.sleep(0.01)
-
-        # SHOT COUNT (offset + 1: H, offset + 2: L)
-        slave.write_to(offset + 1, [(shot_count >> 8) & 0xFF])
-        time.sleep(0.01)
-        slave.write_to(offset + 2, [shot_count & 0xFF])
-        time.sleep(0.01)
-
-        # 검사기 코드 (offset + 5)
-        if inspector_code is not None:
-            inspector_byte = ord(inspector_code[0]) if inspector_code else 0x41
-            slave.write_to(offset + 5, [inspector_byte & 0xFF])
-            time.sleep(0.01)
-
-        # 판정 결과 (offset + 6)
-        if judge_result is not None:
-            judge_byte = 0x01 if judge_result == "PASS" else 0x00
-            slave.write_to(offset + 6, [judge_byte])
-            time.sleep(0.01)
-
-        # 일일 시리얼 번호 (offset + 7~8)
-        if daily_serial is not None:
-            slave.write_to(offset + 7, [(daily_serial >> 8) & 0xFF])
-            time.sleep(0.01)
-            slave.write_to(offset + 8, [daily_serial & 0xFF])
-            time.sleep(0.01)
-
-        # DATE
-        slave.write_to(offset + 9, [(year - 2000) & 0xFF])
-        time.sleep(0.01)
-        slave.write_to(offset + 10, [month & 0xFF])
-        time.sleep(0.01)
-        slave.write_to(offset + 11, [day & 0xFF])
-        time.sleep(0.01)
-
-        # MAKER CODE
-        slave.write_to(offset + 12, [maker_code & 0xFF])
-        time.sleep(0.01)
-
-        i2c.terminate()
-        return {"success": True, "message": f"MTR 4.0 EEPROM 쓰기 성공 (주소: 0x{eeprom_address:02X}, 오프셋: 0x{offset:02X})"}
-
-    except Exception as e:
-        if i2c.configured:
-            i2c.terminate()
-        return {"success": False, "error": f"EEPROM 쓰기 실패: {e}"}
+    values = _write_values(tip_type, shot_count, year, month, day, maker_code, inspector_code, judge_result, daily_serial)
+    return write_eeprom(get_eeprom_layout("4.0", None), values, write_mode)
 
 
 def read_eeprom_mtr40():
-    """
-    MTR 4.0용 EEPROM 읽기 함수 (FT232H 방식)
-    ※ ws_server.py의 read_eeprom_mtr40() 함수와 완전히 동일한 로직
-    ※ SMBus → FT232H 통신 방식만 변경
-    """
-    eeprom_address = MTR40_EEPROM_ADDRESS
-    offset = MTR40_OFFSET
-
-    i2c = I2cController()
-    max_retries = 3
-
-    for attempt in range(max_retries):
-        try:
-            # FT232H 연결
-            i2c.configure(FTDI_URL)
-            slave = i2c.get_port(eeprom_address)
-
-            # TIP ID (offset + 0)
-            tip_type = slave.read_from(offset + 0, 1)[0]
-
-            # SHOT COUNT (offset + 1=H, offset + 2=L)
-            shot = slave.read_from(offset + 1, 2)
-            shot_count = (shot[0] << 8) | shot[1]
-
-            # DATE
-            year_off = slave.read_from(offset + 9, 1)[0]
-            month = slave.read_from(offset + 10, 1)[0]
-            day = slave.read_from(offset + 11, 1)[0]
-            year = 2000 + year_off
-
-            # MAKER CODE
-            maker_code = slave.read_from(offset + 12, 1)[0]
-            
-            # 검사기 코드
-            inspector_code = slave.read_from(offset + 5, 1)[0]
-            inspector_char = chr(inspector_code) if 32 <= inspector_code <= 126 else 'A'
-            
-            # 판정 결과
-            judge_result = slave.read_from(offset + 6, 1)[0]
-            judge_str = 'PASS' if judge_result == 1 else 'NG' if judge_result == 0 else 'UNKNOWN'
-            
-            # 일일 시리얼 번호
-            daily_serial_bytes = slave.read_from(offset + 7, 2)
-            daily_serial = (daily_serial_bytes[0] << 8) | daily_serial_bytes[1]
-
-            i2c.terminate()
-            
-            return {
-                "success": True,
-                "tipType": tip_type,
-                "shotCount": shot_count,
-                "year": year,
-                "month": month,
-                "day": day,
-                "makerCode": maker_code,
-                "inspectorCode": inspector_char,
-                "judgeResult": judge_str,
-                "dailySerial": daily_serial,
-                "mtrVersion": "4.0",
-                "eepromAddress": f"0x{eeprom_address:02X}",
-                "offset": f"0x{offset:02X}"
-            }
-
-        except Exception as e:
-            print(f"[ERROR] MTR 4.0 EEPROM 읽기 시도 {attempt + 1}/{max_retries} 실패 (주소: 0x{eeprom_address:02X}, 오프셋: 0x{offset:02X}): {e}")
-            if i2c.configured:
-                i2c.terminate()
-            if attempt < max_retries - 1:
-                time.sleep(0.1)
-            else:
-                return {"success": False, "error": f"EEPROM 읽기 실패: {e}"}
\ No newline at end of file
+    """MTR 4.0용 EEPROM 읽기 함수 (FT232H 방식)"""
+    return read_eeprom(get_eeprom_layout("4.0", None))
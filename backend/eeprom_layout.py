@@ -0,0 +1,227 @@
+"""
+니들팁 EEPROM 레코드 레이아웃 (선언형)
+- 필드 표(이름, 오프셋, 폭, 엔디안, 인코딩)에서 변형(variant)별 struct 코덱을 한 번 컴파일
+- 인코딩/디코딩은 struct pack_into/unpack_from 한 번 + 필드별 값 변환
+- 새 팁 세대/국가 오프셋 추가 = EEPROM_VARIANTS에 항목 추가 (코드 변경 없음)
+"""
+
+import struct
+from collections import namedtuple
+
+# name: 레코드 필드 이름 (EEPROM 원시 값 dict의 키)
+# key: 읽기 결과/쓰기 요청의 프론트엔드 키 (None이면 외부에 노출하지 않는 필드)
+# offset: 레코드 시작 기준 바이트 위치, width: 바이트 수
+# endian: "big" / "little" (1바이트 필드는 무관)
+# encoding: 값 변환 방식 (FIELD_ENCODINGS)
+EepromField = namedtuple("EepromField", "name key offset width endian encoding")
+
+
+def _uint_encode(value, field):
+    return value & ((1 << (field.width * 8)) - 1)
+
+
+def _char_encode(value, field):
+    return (ord(value[0]) if value else 0x41) & 0xFF  # 기본값 'A'
+
+
+def _char_decode(raw, field):
+    return chr(raw) if 32 <= raw <= 126 else 'A'
+
+
+def _judge_encode(value, field):
+    return 0x01 if value == "PASS" else 0x00
+
+
+def _judge_decode(raw, field):
+    return 'PASS' if raw == 1 else 'NG' if raw == 0 else 'UNKNOWN'
+
+
+def _year_encode(value, field):
+    return (value - 2000) & 0xFF
+
+
+def _year_decode(raw, field):
+    return 2000 + raw
+
+
+def _identity(value, field):
+    return value
+
+
+# 인코딩 이름 → (쓰기 값 → 원시 값, 원시 값 → 읽기 값)
+FIELD_ENCODINGS = {
+    "uint": (_uint_encode, _identity),
+    "char": (_char_encode, _char_decode),        # ASCII 문자 1개
+    "judge": (_judge_encode, _judge_decode),     # PASS=1, NG=0
+    "year2000": (_year_encode, _year_decode),    # 2000년 기준 오프셋
+    "raw": (_identity, _identity),               # 바이트 그대로 (Reserved 등)
+}
+
+_UINT_CODES = {1: "B", 2: "H", 4: "I"}
+
+
+def _none_if_identity(func):
+    return None if func is _identity else func
+
+
+class EepromLayout:
+    """
+    레코드 레이아웃 하나 (EEPROM 주소 + 레코드 오프셋 + 필드 표)
+
+    - 필드 사이 빈 바이트는 raw 필드로 채워서 레코드 전체를 pack해도 기존 값이 유지됨
+    - 엔디안이 다른 정수 필드는 바이트열로 묶고 변환할 때만 int로 바꿈 (struct는 바이트 순서 하나만 지원)
+
+    Args:
+        name: 변형 이름 (로그/메시지용, 예: "MTR 2.0 CLASSYS")
+        mtr_version: "2.0" / "4.0"
+        country: 국가 (국가 구분이 없는 세대는 None)
+        address: EEPROM I2C 주소
+        offset: 레코드 시작 오프셋
+        fields: EepromField 목록
+    """
+
+    def __init__(self, name, mtr_version, country, address, offset, fields):
+        self.name = name
+        self.mtr_version = mtr_version
+        self.country = country
+        self.address = address
+        self.offset = offset
+        self.fields = self._fill_gaps(sorted(fields, key=lambda field: field.offset))
+        self.size = self.fields[-1].offset + self.fields[-1].width
+        self.names = tuple(field.name for field in self.fields)
+        self.codec = self._compile()
+
+        # 필드 인덱스 기준 변환 표 (변환이 필요 없는 필드는 함수 None → 값 그대로 사용)
+        self._encoders = [(index, field.key, FIELD_ENCODINGS[field.encoding][0], field)
+                          for index, field in enumerate(self.fields) if field.key]
+        self._decoders = [(index, field.key, _none_if_identity(FIELD_ENCODINGS[field.encoding][1]), field)
+                          for index, field in enumerate(self.fields) if field.key]
+
+    @staticmethod
+    def _fill_gaps(fields):
+        filled = []
+        position = 0
+        for field in fields:
+            if field.offset < position:
+                raise ValueError(f"EEPROM 필드 겹침: {field.name} (오프셋 {field.offset})")
+            if field.encoding not in FIELD_ENCODINGS:
+                raise ValueError(f"알 수 없는 인코딩: {field.name} ({field.encoding})")
+            if field.offset > position:
+                filled.append(EepromField(f"_gap{position}", None, position, field.offset - position, "big", "raw"))
+            filled.append(field)
+            position = field.offset + field.width
+        return filled
+
+    def _compile(self):
+        """필드 표 → struct 하나 (가장 많이 쓰인 엔디안을 struct 바이트 순서로 사용)"""
+        multibyte = [field.endian for field in self.fields if field.width > 1 and field.encoding != "raw"]
+        self.endian = max(set(multibyte), key=multibyte.count) if multibyte else "big"
+        self._swapped = []  # (인덱스, 엔디안) - struct 바이트 순서와 다른 정수 필드
+        codes = []
+        for index, field in enumerate(self.fields):
+            if field.encoding == "raw":
+                codes.append(f"{field.width}s")
+            elif field.width > 1 and field.endian != self.endian:
+                codes.append(f"{field.width}s")
+                self._swapped.append((index, field.endian))
+            elif field.width in _UINT_CODES:
+                codes.append(_UINT_CODES[field.width])
+            else:
+                raise ValueError(f"지원하지 않는 필드 폭: {field.name} ({field.width}바이트)")
+        return struct.Struct((">" if self.endian == "big" else "<") + "".join(codes))
+
+    def _unpack_row(self, data, position=0):
+        """레코드 바이트 → 필드 순서대로의 원시 값 list (엔디안 변환 포함)"""
+        row = list(self.codec.unpack_from(data, position))
+        for index, endian in self._swapped:
+            row[index] = int.from_bytes(row[index], endian)
+        return row
+
+    def _pack_row(self, buffer, position, row):
+        for index, endian in self._swapped:
+            row[index] = row[index].to_bytes(self.fields[index].width, endian)
+        self.codec.pack_into(buffer, position, *row)
+
+    def unpack(self, data, position=0):
+        """레코드 바이트 → 원시 필드 dict"""
+        return dict(zip(self.names, self._unpack_row(data, position)))
+
+    def pack(self, fields):
+        """원시 필드 dict → 레코드 바이트"""
+        buffer = bytearray(self.size)
+        self.pack_into(buffer, 0, fields)
+        return bytes(buffer)
+
+    def pack_into(self, buffer, position, fields):
+        self._pack_row(buffer, position, [fields[name] for name in self.names])
+
+    def encode_values(self, values):
+        """쓰기 요청 값(프론트엔드 키) → 원시 필드 dict (값이 None인 필드는 제외 → 기존 값 유지)"""
+        return {self.names[index]: encode(values[key], field)
+                for index, key, encode, field in self._encoders if values.get(key) is not None}
+
+    def decode_values(self, fields):
+        """원시 필드 dict → 읽기 결과 값 (프론트엔드 키)"""
+        return self._decode_row([fields[name] for name in self.names])
+
+    def _decode_row(self, row):
+        return {key: decode(row[index], field) if decode else row[index]
+                for index, key, decode, field in self._decoders}
+
+    def decode(self, data, position=0):
+        """레코드 바이트 → 읽기 결과 값 (중간 dict 없이 unpack_from 1회)"""
+        return self._decode_row(self._unpack_row(data, position))
+
+    def encode_into(self, buffer, position, values):
+        """
+        buffer의 현재 레코드에 쓰기 요청 값을 덮어씀 (unpack_from 1회 + pack_into 1회)
+        값이 None인 필드와 Reserved/빈 바이트는 기존 값 유지
+        """
+        row = self._unpack_row(buffer, position)
+        for index, key, encode, field in self._encoders:
+            value = values.get(key)
+            if value is not None:
+                row[index] = encode(value, field)
+        self._pack_row(buffer, position, row)
+
+    def result_info(self):
+        """읽기/쓰기 결과에 붙는 변형 정보"""
+        info = {"mtrVersion": self.mtr_version}
+        if self.country is not None:
+            info["country"] = self.country
+        info["eepromAddress"] = f"0x{self.address:02X}"
+        info["offset"] = f"0x{self.offset:02X}"
+        return info
+
+
+# MTR 2.0 / 4.0 공통 13바이트 레코드
+MTR_RECORD_FIELDS = (
+    EepromField("tip_type", "tipType", 0, 1, "big", "uint"),
+    EepromField("shot_count", "shotCount", 1, 2, "big", "uint"),
+    EepromField("reserved", None, 3, 2, "big", "raw"),
+    EepromField("inspector_code", "inspectorCode", 5, 1, "big", "char"),
+    EepromField("judge_result", "judgeResult", 6, 1, "big", "judge"),
+    EepromField("daily_serial", "dailySerial", 7, 2, "big", "uint"),
+    EepromField("year", "year", 9, 1, "big", "year2000"),
+    EepromField("month", "month", 10, 1, "big", "uint"),
+    EepromField("day", "day", 11, 1, "big", "uint"),
+    EepromField("maker_code", "makerCode", 12, 1, "big", "uint"),
+)
+
+# (MTR 버전, 국가) → 레이아웃 (국가 구분이 없는 세대는 국가 None)
+EEPROM_VARIANTS = {
+    ("2.0", "CLASSYS"): EepromLayout("MTR 2.0 CLASSYS", "2.0", "CLASSYS", 0x50, 0x10, MTR_RECORD_FIELDS),
+    ("2.0", "CUTERA"): EepromLayout("MTR 2.0 CUTERA", "2.0", "CUTERA", 0x50, 0x80, MTR_RECORD_FIELDS),
+    ("4.0", None): EepromLayout("MTR 4.0", "4.0", None, 0x51, 0x70, MTR_RECORD_FIELDS),
+}
+
+# 알 수 없는 국가일 때 사용할 세대별 기본 국가 (기존 동작: CUTERA 외에는 CLASSYS)
+DEFAULT_COUNTRY = {"2.0": "CLASSYS"}
+
+
+def get_eeprom_layout(mtr_version="2.0", country="CLASSYS"):
+    """MTR 버전/국가 → 레이아웃 (없는 조합이면 None)"""
+    layout = EEPROM_VARIANTS.get((mtr_version, country)) or EEPROM_VARIANTS.get((mtr_version, None))
+    if layout is None and mtr_version in DEFAULT_COUNTRY:
+        layout = EEPROM_VARIANTS.get((mtr_version, DEFAULT_COUNTRY[mtr_version]))
+    return layout
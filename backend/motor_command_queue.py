@@ -0,0 +1,107 @@
+"""
+우선순위 레인 모터 명령 큐
+- LANE_EMERGENCY: 정지/홀드 등 비상 명령 - 완료 대기 중에도 전송되며 다른 레인보다 항상 먼저 처리
+- LANE_MOTION: 일반 이동 명령
+- LANE_BOOKKEEPING: 파라미터 설정 등 급하지 않은 명령
+- 레인별 대기 깊이와 큐 대기 시간(enqueue → 전송) 통계 제공
+"""
+
+import time
+from collections import deque
+from queue import Empty
+from threading import Lock
+
+LANE_EMERGENCY = 0
+LANE_MOTION = 1
+LANE_BOOKKEEPING = 2
+LANE_NAMES = ("emergency", "motion", "bookkeeping")
+
+
+def lane_from_name(name, default=LANE_MOTION):
+    """"emergency"/"motion"/"bookkeeping" 문자열을 레인 번호로 변환 (없으면 default)"""
+    if name is None:
+        return default
+    try:
+        return LANE_NAMES.index(str(name).lower())
+    except ValueError:
+        raise ValueError(f"지원하지 않는 우선순위입니다: {name}")
+
+
+class MotorCommandQueue:
+    """
+    레인별 FIFO로 구성된 우선순위 명령 큐 (queue.Queue와 호환되는 put/get_nowait/qsize/empty 제공)
+
+    Args:
+        history: 레인별로 보관할 최근 대기 시간 개수
+    """
+
+    def __init__(self, history=128):
+        self._lock = Lock()
+        self._lanes = [deque() for _ in LANE_NAMES]
+        self._waits = [deque(maxlen=history) for _ in LANE_NAMES]
+        self.enqueued = [0] * len(LANE_NAMES)
+        self.dequeued = [0] * len(LANE_NAMES)
+        self.dropped = [0] * len(LANE_NAMES)
+
+    def put(self, item, lane=LANE_MOTION):
+        with self._lock:
+            self._lanes[lane].append((time.perf_counter(), item))
+            self.enqueued[lane] += 1
+
+    def get_nowait(self, max_lane=LANE_BOOKKEEPING):
+        """우선순위가 가장 높은 레인의 가장 오래된 명령 반환 (max_lane보다 낮은 레인은 제외)"""
+        with self._lock:
+            for lane in range(max_lane + 1):
+                if self._lanes[lane]:
+                    enqueued_at, item = self._lanes[lane].popleft()
+                    self._waits[lane].append(time.perf_counter() - enqueued_at)
+                    self.dequeued[lane] += 1
+                    return item
+        raise Empty
+
+    def qsize(self):
+        with self._lock:
+            return sum(len(lane) for lane in self._lanes)
+
+    def empty(self):
+        return self.qsize() == 0
+
+    def depth(self, lane):
+        with self._lock:
+            return len(self._lanes[lane])
+
+    def remove_if(self, predicate, lanes=None):
+        """조건에 맞는 명령을 지정 레인(기본: 전체)에서 제거하고 제거된 명령 목록 반환"""
+        removed = []
+        with self._lock:
+            for lane in (range(len(LANE_NAMES)) if lanes is None else lanes):
+                kept = deque()
+                for entry in self._lanes[lane]:
+                    if predicate(entry[1]):
+                        removed.append(entry[1])
+                        self.dropped[lane] += 1
+                    else:
+                        kept.append(entry)
+                self._lanes[lane] = kept
+        return removed
+
+    def clear(self):
+        """모든 레인을 비우고 제거된 명령 목록 반환"""
+        return self.remove_if(lambda item: True)
+
+    def get_stats(self):
+        """레인별 깊이 및 대기 시간 통계 (ms)"""
+        stats = {}
+        with self._lock:
+            for lane, name in enumerate(LANE_NAMES):
+                waits = self._waits[lane]
+                stats[name] = {
+                    "depth": len(self._lanes[lane]),
+                    "enqueued": self.enqueued[lane],
+                    "dequeued": self.dequeued[lane],
+                    "dropped": self.dropped[lane],
+                    "wait_last_ms": round(waits[-1] * 1000, 2) if waits else None,
+                    "wait_mean_ms": round(sum(waits) / len(waits) * 1000, 2) if waits else None,
+                    "wait_max_ms": round(max(waits) * 1000, 2) if waits else None,
+                }
+        return stats
@@ -0,0 +1,123 @@
+"""
+모터 드라이버 응답 스트림(0xAA55) 프레임 파서
+- 프레임 길이 바이트 기반의 점진적(incremental) 파서
+- 헤더 탐색은 bytearray.find (C 레벨)로 수행하고, 프레임은 복사 없이 memoryview로 전달
+- 필드 디코딩은 struct.unpack_from 사용 (hex 문자열 변환 없음)
+
+프레임 구조:
+    AA 55 | len | id | cmd | payload ... | checksum
+    전체 길이 = len + 5 (헤더 2 + len 1 + id 1 + checksum 1)
+"""
+
+import struct
+
+RESPONSE_HEADER = b'\xAA\x55'
+FRAME_OVERHEAD = 5  # 헤더(2) + 길이(1) + ID(1) + 체크섬(1)
+MAX_FRAME_SIZE = 64  # 이보다 긴 길이 바이트는 잘못된 헤더로 간주
+
+# 상태 응답 필드: setPos(7-8), actPos(9-10), [11-12 미사용], force(13-14), sensor(15-16), little-endian signed
+STATUS_FIELDS = struct.Struct('<hh2xhh')
+STATUS_FIELDS_OFFSET = 7
+MIN_STATUS_FRAME_SIZE = STATUS_FIELDS_OFFSET + STATUS_FIELDS.size  # 17
+
+
+def decode_status(frame):
+    """
+    상태 응답 프레임 디코딩
+
+    Returns:
+        (motor_id, setPos, position, force, sensor) 또는 프레임이 짧으면 None
+    """
+    if len(frame) < MIN_STATUS_FRAME_SIZE:
+        return None
+    return (frame[3],) + STATUS_FIELDS.unpack_from(frame, STATUS_FIELDS_OFFSET)
+
+
+class MotorFrameParser:
+    """
+    길이 기반 점진적 프레임 파서
+
+    feed()로 수신 바이트를 넣으면 완성된 프레임을 memoryview로 하나씩 돌려줌.
+    돌려준 memoryview는 다음 프레임으로 넘어가면 해제되므로, 보관하려면 bytes(frame)로 복사해야 함.
+
+    Args:
+        verify_checksum: True이면 체크섬(len~payload 합의 하위 바이트)이 맞지 않는 프레임을 버리고 재동기화
+        max_frame_size: 허용하는 최대 프레임 길이
+    """
+
+    def __init__(self, verify_checksum=False, max_frame_size=MAX_FRAME_SIZE):
+        self.verify_checksum = verify_checksum
+        self.max_frame_size = max_frame_size
+        self._buffer = bytearray()
+        self._start = 0  # 아직 처리하지 않은 데이터의 시작 위치
+
+        # 통계
+        self.frames = 0
+        self.dropped_bytes = 0
+        self.checksum_errors = 0
+
+    def reset(self):
+        self._buffer.clear()
+        self._start = 0
+
+    @property
+    def pending(self):
+        """아직 프레임으로 완성되지 않은 바이트 수"""
+        return len(self._buffer) - self._start
+
+    def feed(self, data):
+        """수신 바이트를 추가하고 완성된 프레임(memoryview)을 순서대로 yield"""
+        buffer = self._buffer
+        buffer += data
+        view = memoryview(buffer)
+        try:
+            start = self._start
+            end = len(buffer)
+            while True:
+                index = buffer.find(RESPONSE_HEADER, start)
+                if index < 0:
+                    # 헤더 없음: 헤더 첫 바이트일 수 있는 마지막 1바이트만 남김
+                    keep_from = end - 1 if end > start and buffer[end - 1] == 0xAA else end
+                    self.dropped_bytes += keep_from - start
+                    start = keep_from
+                    break
+
+                self.dropped_bytes += index - start
+                start = index
+                if end - start < 3:
+                    break
+
+                frame_size = buffer[start + 2] + FRAME_OVERHEAD
+                if frame_size > self.max_frame_size:
+                    # 잘못된 헤더 (데이터 중의 AA 55) - 한 바이트 건너뛰고 재탐색
+                    self.dropped_bytes += 1
+                    start += 1
+                    continue
+                if end - start < frame_size:
+                    break
+
+                frame_end = start + frame_size
+                if self.verify_checksum:
+                    checksum = sum(view[start + 2:frame_end - 1]) & 0xFF
+                    if checksum != buffer[frame_end - 1]:
+                        self.checksum_errors += 1
+                        self.dropped_bytes += 1
+                        start += 1
+                        continue
+
+                frame = view[start:frame_end]
+                start = frame_end
+                self._start = start
+                self.frames += 1
+                try:
+                    yield frame
+                finally:
+                    frame.release()
+            self._start = start
+        finally:
+            view.release()
+
+        # 처리된 앞부분은 절반 이상 쌓였을 때만 한 번에 제거 (매 프레임 복사 방지)
+        if self._start and self._start * 2 >= len(buffer):
+            del buffer[:self._start]
+            self._start = 0
@@ -1,3 +1,25 @@
+import struct
+from functools import lru_cache
+
+# 명령 프레임: 55 AA | len | id | 0x32 | 25 00 | mode 00 | 00 00 | force | speed | position | checksum
+# 모든 값은 little-endian 16비트, 체크섬은 len~payload 합의 하위 바이트
+COMMAND_HEADER = b'\x55\xAA'
+COMMAND_WRITE = 0x32
+COMMAND_STATUS_READ = 0x30
+CONTROL_MODE_REGISTER = 0x0025
+
+MODE_FRAME = struct.Struct('<2sBBBHHHHHHB')   # 18바이트 (체크섬 포함)
+FORCE_FRAME = struct.Struct('<2sBBBHHHHB')    # 14바이트
+STATUS_READ_FRAME = struct.Struct('<2sBBBB')  # 6바이트
+
+FRAME_CACHE_SIZE = 1024  # (mode, motor, speed, position, force) 조합별로 보관할 인코딩 프레임 수
+
+
+def _word_sum(value):
+    """16비트 값의 두 바이트 합 (체크섬 계산용 - 프레임을 다시 훑지 않고 필드 값으로 계산)"""
+    return (value & 0xFF) + (value >> 8)
+
+
 def generate_servo_mode_command(target_position, motor_id=0x01):
     return _generate_mode_command(mode_code=0x01, speed=0, position=target_position, force=0, motor_id=motor_id)
 
@@ -9,75 +31,47 @@ def generate_speed_mode_command(target_speed, target_position, motor_id=0x01):
     # Register 0x25 (Control Mode) = 0x02 (스피드 모드)
     # Register 0x28 (Target Speed) = target_speed
     # Register 0x29 (Target Position) = target_position
-    header = [0x55, 0xAA]
-    frame_length = 0x0D  # 13바이트 데이터
-    command_type = 0x32
-    
-    # Register 0x25: Control Mode = 0x02 (스피드 모드)
-    control_mode_register = [0x25, 0x00]
-    control_mode_data = [0x02, 0x00]
-    
-    # Motor Output Voltage Register (사용하지 않음)
-    voltage_register = [0x00, 0x00]
-    voltage_data = [0x00, 0x00]
-    
-    # Register 0x28: Target Speed
-    speed_data = [target_speed & 0xFF, (target_speed >> 8) & 0xFF]
-    
-    # Register 0x29: Target Position  
-    position_data = [target_position & 0xFF, (target_position >> 8) & 0xFF]
-    
-    payload = control_mode_register + control_mode_data + voltage_register + voltage_data + speed_data + position_data
-    checksum = (frame_length + motor_id + command_type + sum(payload)) & 0xFF
-    
-    return bytes(header + [frame_length, motor_id, command_type] + payload + [checksum])
+    # (Motor Output Voltage 레지스터 자리는 0으로 채움 - 공통 모드 프레임과 동일한 배치)
+    return _generate_mode_command(mode_code=0x02, speed=target_speed, position=target_position, force=0, motor_id=motor_id)
 
 def generate_speed_force_mode_command(target_force, target_speed, target_position, motor_id=0x01):
     return _generate_mode_command(mode_code=0x05, speed=target_speed, position=target_position, force=target_force, motor_id=motor_id)
 
+@lru_cache(maxsize=None)
 def generate_status_read_command(motor_id=0x01):
-    # 상태 읽기 명령어: 55 AA 01 [ID] 30 [Checksum]
-    header = [0x55, 0xAA]
-    frame_length = 0x01
-    command_type = 0x30
-    
-    checksum = (frame_length + motor_id + command_type) & 0xFF
-    
-    return bytes(header + [frame_length, motor_id, command_type, checksum])
+    # 상태 읽기 명령어: 55 AA 01 [ID] 30 [Checksum] - 모터별로 한 번만 만들어 재사용
+    checksum = (0x01 + motor_id + COMMAND_STATUS_READ) & 0xFF
+    return STATUS_READ_FRAME.pack(COMMAND_HEADER, 0x01, motor_id, COMMAND_STATUS_READ, checksum)
 
+@lru_cache(maxsize=FRAME_CACHE_SIZE)
 def generate_force_mode_command(target_force, motor_id=0x01):
     # target_force는 g 단위 (예: 1000g = 0x03E8)
-    header = [0x55, 0xAA]
-    frame_length = 0x09
-    command_type = 0x32
-
-    control_mode_register = [0x25, 0x00]
-    control_mode_setting = [0x03, 0x00]  # 0x03: force mode
-    not_used = [0x00, 0x00]
-    force_data = [target_force & 0xFF, (target_force >> 8) & 0xFF]
-
-    payload = control_mode_register + control_mode_setting + not_used + force_data
-    checksum = (frame_length + motor_id + command_type + sum(payload)) & 0xFF
-
-    return bytes(header + [frame_length, motor_id, command_type] + payload + [checksum])
+    force = target_force & 0xFFFF
+    checksum = (0x09 + motor_id + COMMAND_WRITE + CONTROL_MODE_REGISTER + 0x03 + _word_sum(force)) & 0xFF
+    return FORCE_FRAME.pack(
+        COMMAND_HEADER, 0x09, motor_id, COMMAND_WRITE,
+        CONTROL_MODE_REGISTER, 0x03, 0x0000, force, checksum  # 0x03: force mode
+    )
 
 def _generate_mode_command(mode_code, speed, position, force, frame_length=0x0D, motor_id=0x01):
-    header = [0x55, 0xAA]
-    command_type = 0x32
+    return _encode_mode_frame(mode_code, motor_id, speed, position, force, frame_length)
 
-    control_mode_register = [0x25, 0x00]
-    control_mode_setting = [mode_code, 0x00]
-    not_used = [0x00, 0x00]
-
-    force_data = [force & 0xFF, (force >> 8) & 0xFF]
-    speed_data = [speed & 0xFF, (speed >> 8) & 0xFF]
-    position_data = [position & 0xFF, (position >> 8) & 0xFF]
-
-    payload = (
-        control_mode_register + control_mode_setting + not_used +
-        force_data + speed_data + position_data
+@lru_cache(maxsize=FRAME_CACHE_SIZE)
+def _encode_mode_frame(mode_code, motor_id, speed, position, force, frame_length=0x0D):
+    # 음수/16비트 초과 값은 기존과 동일하게 하위 16비트(2의 보수)만 사용
+    force &= 0xFFFF
+    speed &= 0xFFFF
+    position &= 0xFFFF
+    checksum = (
+        frame_length + motor_id + COMMAND_WRITE + CONTROL_MODE_REGISTER + mode_code +
+        _word_sum(force) + _word_sum(speed) + _word_sum(position)
+    ) & 0xFF
+    return MODE_FRAME.pack(
+        COMMAND_HEADER, frame_length, motor_id, COMMAND_WRITE,
+        CONTROL_MODE_REGISTER, mode_code, 0x0000, force, speed, position, checksum
     )
 
-    checksum = (frame_length + motor_id + command_type + sum(payload)) & 0xFF
-
-    return bytes(header + [frame_length, motor_id, command_type] + payload + [checksum])
+def get_frame_cache_info():
+    """모드 프레임 LRU 캐시 적중/미스 통계"""
+    info = _encode_mode_frame.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize, "maxsize": info.maxsize}
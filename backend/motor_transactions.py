@@ -0,0 +1,130 @@
+"""
+모터 버스 요청/응답 상관관계(transaction) 계층
+- 전송한 요청마다 (모터 ID, 명령 타입) 태그를 붙여 미완료 목록에 보관
+- 응답 프레임이 오면 같은 모터 ID/명령 타입의 가장 오래된 요청과 매칭하고 왕복 시간(RTT) 기록
+- 모터별 동시 진행(in-flight) 요청 수를 제한하여, 응답을 기다리는 모터에는 새 요청을 보내지 않음
+  → 서로 다른 모터는 고정 간격 없이 연달아 요청 가능
+"""
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from threading import Lock
+from typing import Optional
+
+
+@dataclass
+class MotorTransaction:
+    """진행 중인 요청 1건"""
+    seq: int
+    motor_id: int
+    command_type: int
+    sent_at: float  # time.perf_counter() 기준
+    completed_at: Optional[float] = None
+
+    @property
+    def rtt(self):
+        if self.completed_at is None:
+            return None
+        return self.completed_at - self.sent_at
+
+
+class MotorTransactionManager:
+    """
+    모터별 요청/응답 매칭 및 RTT 측정
+
+    Args:
+        max_in_flight: 모터당 동시에 응답을 기다릴 수 있는 최대 요청 수
+        timeout: 이 시간(초) 안에 응답이 없으면 요청을 만료 처리
+        history: 모터별로 보관할 최근 RTT 개수
+    """
+
+    def __init__(self, motor_ids=(1, 2), max_in_flight=1, timeout=0.05, history=256):
+        self.max_in_flight = max_in_flight
+        self.timeout = timeout
+        self._lock = Lock()
+        self._seq = 0
+        self._pending = {motor_id: deque() for motor_id in motor_ids}
+        self._rtts = {motor_id: deque(maxlen=history) for motor_id in motor_ids}
+        self.completed = {motor_id: 0 for motor_id in motor_ids}
+        self.timeouts = {motor_id: 0 for motor_id in motor_ids}
+        self.unmatched = 0  # 대응하는 요청이 없는 응답 수
+
+    def reset(self):
+        """미완료 요청 모두 폐기 (재연결 시)"""
+        with self._lock:
+            for pending in self._pending.values():
+                pending.clear()
+
+    def _expire(self, motor_id, now):
+        pending = self._pending[motor_id]
+        while pending and now - pending[0].sent_at > self.timeout:
+            pending.popleft()
+            self.timeouts[motor_id] += 1
+
+    def can_send(self, motor_id):
+        """해당 모터에 새 요청을 보낼 수 있는지 (만료된 요청은 정리)"""
+        with self._lock:
+            self._expire(motor_id, time.perf_counter())
+            return len(self._pending[motor_id]) < self.max_in_flight
+
+    def next_expiry(self, motor_id):
+        """가장 오래된 미완료 요청이 만료되는 시각 (perf_counter 기준), 없으면 None"""
+        with self._lock:
+            pending = self._pending[motor_id]
+            if not pending:
+                return None
+            return pending[0].sent_at + self.timeout
+
+    def begin(self, motor_id, command_type):
+        """요청 전송 직후 호출 - 새 트랜잭션 등록"""
+        with self._lock:
+            self._seq += 1
+            transaction = MotorTransaction(self._seq, motor_id, command_type, time.perf_counter())
+            self._pending[motor_id].append(transaction)
+            return transaction
+
+    def complete(self, motor_id, command_type):
+        """응답 수신 시 호출 - 같은 모터/명령 타입의 가장 오래된 요청과 매칭"""
+        now = time.perf_counter()
+        with self._lock:
+            pending = self._pending.get(motor_id)
+            if pending is None:
+                self.unmatched += 1
+                return None
+            self._expire(motor_id, now)
+            for transaction in pending:
+                if transaction.command_type == command_type:
+                    pending.remove(transaction)
+                    transaction.completed_at = now
+                    self._rtts[motor_id].append(transaction.rtt)
+                    self.completed[motor_id] += 1
+                    return transaction
+            self.unmatched += 1
+            return None
+
+    def in_flight(self, motor_id):
+        with self._lock:
+            return len(self._pending[motor_id])
+
+    def get_stats(self):
+        """모터별 RTT 통계 (ms)"""
+        stats = {}
+        with self._lock:
+            for motor_id, rtts in self._rtts.items():
+                values = sorted(rtts)
+                entry = {
+                    "in_flight": len(self._pending[motor_id]),
+                    "completed": self.completed[motor_id],
+                    "timeouts": self.timeouts[motor_id],
+                    "rtt_last_ms": None,
+                    "rtt_mean_ms": None,
+                    "rtt_p95_ms": None,
+                }
+                if values:
+                    entry["rtt_last_ms"] = round(rtts[-1] * 1000, 2)
+                    entry["rtt_mean_ms"] = round(sum(values) / len(values) * 1000, 2)
+                    entry["rtt_p95_ms"] = round(values[max(int(len(values) * 0.95) - 1, 0)] * 1000, 2)
+                stats[motor_id] = entry
+            stats["unmatched"] = self.unmatched
+        return stats
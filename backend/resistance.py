@@ -1,90 +1,199 @@
 # resistance.py - 저항 측정 유틸리티 모듈
+#
+# - ResistanceMeasurer: 저항 측정기(Modbus RTU, slave 1/2) 상시 연결 서비스
+#   연결을 유지하고, 시리얼 오류가 나면 다시 연결해서 한 번 재시도
+#   두 slave는 미리 만들어 둔 RTU 요청 프레임을 연달아 보내고 응답 길이만큼만 읽어서 처리 (read_both)
+# - ResistanceSampler: 백그라운드 연속 측정 (채널별 numpy 링 버퍼, 이동 평균/중앙값/표준편차, 디바운스 판정)
+# - measure_resistance_once: 연결 -> 측정 -> 해제 일회성 함수 (기존 방식, 단독 스크립트용)
 
+import inspect
+import struct
+import threading
 import time
+from collections import deque
+from functools import lru_cache
+
+import numpy as np
+import serial
 from pymodbus.client import ModbusSerialClient
+from pymodbus.exceptions import ModbusException
+
+# pymodbus 3.10부터 slave= 인자 이름이 device_id=로 바뀜 → 설치된 버전에 맞는 이름 사용
+_UNIT_KWARG = "device_id" if "device_id" in inspect.signature(ModbusSerialClient.read_holding_registers).parameters else "slave"
+
+READ_HOLDING_REGISTERS = 0x03
+READ_REQUEST = struct.Struct('>BBHH')  # slave, function, 시작 주소, 레지스터 수 (+ CRC 2바이트 little-endian)
+
+
+def _build_crc_table():
+    table = []
+    for value in range(256):
+        crc = value
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+        table.append(crc)
+    return table
+
+
+_CRC_TABLE = _build_crc_table()
+
+
+def modbus_crc(data):
+    """Modbus RTU CRC-16 (little-endian 2바이트)"""
+    crc = 0xFFFF
+    for byte in data:
+        crc = (crc >> 8) ^ _CRC_TABLE[(crc ^ byte) & 0xFF]
+    return crc.to_bytes(2, 'little')
+
+
+@lru_cache(maxsize=None)
+def read_request_frame(slave_id, address=0, count=1):
+    """holding register 읽기 요청 프레임 - slave별로 한 번만 만들어 재사용"""
+    body = READ_REQUEST.pack(slave_id, READ_HOLDING_REGISTERS, address, count)
+    return body + modbus_crc(body)
+
 
 class ResistanceMeasurer:
-    def __init__(self, port='/dev/usb-resistance'):
+    """
+    저항 측정기 상시 연결 서비스
+
+    Args:
+        port: 시리얼 포트
+        baudrate: 통신 속도
+        timeout: 응답 대기 시간 (초)
+        fast_read: True이면 read_both에서 RTU 프레임을 직접 송수신 (pymodbus 트랜잭션 처리 생략)
+    """
+
+    def __init__(self, port='/dev/usb-resistance', baudrate=9600, timeout=1.0, fast_read=True):
         self.port = port
-        self.baudrate = 9600
-        self.timeout = 1.0
+        self.baudrate = baudrate
+        self.timeout = timeout
         self.slave_id_1 = 1
         self.slave_id_2 = 2
+        self.fast_read = fast_read
         self.client = None
-    
+        self._lock = threading.RLock()  # 명령 처리/연속 샘플링 등 여러 스레드에서 같은 포트 사용
+        # RTU 프레임 사이 최소 무통신 시간 (3.5문자, 19200bps 초과는 1.75ms 고정)
+        self.frame_gap = 3.5 * 11 / baudrate if baudrate <= 19200 else 0.00175
+        self._last_rx_time = 0.0
+
+        # 통계
+        self.measurements = 0
+        self.errors = 0
+        self.connect_count = 0
+        self.reconnects = 0
+        self._read_times = deque(maxlen=64)
+
     def __enter__(self):
         """컨텍스트 매니저 진입 - with문 사용 시 자동 연결"""
         self.connect()
         return self
-    
+
     def __exit__(self, exc_type, exc_val, exc_tb):
         """컨텍스트 매니저 종료 - 예외 발생 여부와 관계없이 자동 해제"""
         self.disconnect()
         return False  # 예외를 다시 발생시킴
-    
+
     def connect(self):
         """저항 측정기에 연결"""
-        try:
-            if self.client and self.client.is_socket_open():
-                self.client.close()
-            
-            self.client = ModbusSerialClient(
-                port=self.port, 
-                baudrate=self.baudrate, 
-                timeout=self.timeout
-            )
-            
-            if self.client.connect():
-                print("[Resistance] 저항 측정기 연결 성공")
-                return True
-            else:
-                print("[Resistance] 저항 측정기 연결 실패")
+        with self._lock:
+            try:
+                if self.client and self.client.is_socket_open():
+                    self.client.close()
+
+                self.client = ModbusSerialClient(
+                    port=self.port,
+                    baudrate=self.baudrate,
+                    timeout=self.timeout
+                )
+
+                if self.client.connect():
+                    self.connect_count += 1
+                    print("[Resistance] 저항 측정기 연결 성공")
+                    return True
+                else:
+                    print("[Resistance] 저항 측정기 연결 실패")
+                    return False
+            except Exception as e:
+                print(f"[Resistance] 연결 오류: {e}")
                 return False
-        except Exception as e:
-            print(f"[Resistance] 연결 오류: {e}")
-            return False
-    
+
     def disconnect(self):
         """저항 측정기 연결 해제"""
-        if self.client and self.client.is_socket_open():
-            self.client.close()
-            print("[Resistance] 저항 측정기 연결 해제")
-    
-    def measure_resistance(self):
+        with self._lock:
+            if self.client and self.client.is_socket_open():
+                self.client.close()
+                print("[Resistance] 저항 측정기 연결 해제")
+
+    def is_connected(self):
+        return bool(self.client and self.client.is_socket_open())
+
+    def _read_fast(self, slave_id):
+        """RTU 요청 프레임을 직접 보내고 응답 길이만큼만 읽음 (응답 없음/예외 응답/CRC 오류 → None)"""
+        port = self.client.socket
+        wait = self._last_rx_time + self.frame_gap - time.perf_counter()
+        if wait > 0:
+            time.sleep(wait)
+        port.reset_input_buffer()
+        port.write(read_request_frame(slave_id))
+
+        header = port.read(3)  # slave, function, byte count (예외 응답이면 예외 코드)
+        if len(header) < 3:
+            self._last_rx_time = time.perf_counter()
+            return None
+        rest = port.read(2 if header[1] & 0x80 else header[2] + 2)
+        self._last_rx_time = time.perf_counter()
+        frame = header + rest
+        if (header[0] != slave_id or header[1] != READ_HOLDING_REGISTERS or header[2] != 2
+                or len(rest) != 4 or modbus_crc(frame[:-2]) != frame[-2:]):
+            return None
+        return (frame[3] << 8) | frame[4]
+
+    def _read_client(self, slave_id):
+        """pymodbus 트랜잭션으로 읽기 (응답 없음/예외 응답 → None)"""
+        try:
+            response = self.client.read_holding_registers(address=0, count=1, **{_UNIT_KWARG: slave_id})
+        except ModbusException:
+            return None
+        return None if response.isError() else response.registers[0]
+
+    def read_both(self):
+        """
+        slave 1/2 저항값을 연달아 읽음 (값 또는 None, 연결 실패 시 예외)
+        시리얼 오류가 나면 다시 연결해서 한 번 재시도
+        """
+        with self._lock:
+            for attempt in range(2):
+                if not self.is_connected() and not self.connect():
+                    raise ConnectionError("저항 측정기 연결 실패")
+                use_fast = self.fast_read and isinstance(getattr(self.client, 'socket', None), serial.Serial)
+                read = self._read_fast if use_fast else self._read_client
+                try:
+                    return read(self.slave_id_1), read(self.slave_id_2)
+                except Exception as e:  # SerialException/OSError/termios.error 등 포트 자체 오류
+                    self.errors += 1
+                    print(f"[Resistance] 통신 오류 - 재연결 ({attempt + 1}/2): {e}")
+                    try:
+                        self.client.close()
+                    except Exception:
+                        pass
+                    self.client = None  # 닫기에 실패해도 열린 상태로 남지 않도록 다음 시도에서 새로 연결
+                    if attempt == 0:
+                        self.reconnects += 1
+                    else:
+                        raise
+
+    def measure_resistance(self, log=True):
         """저항값 측정 (요청 시에만)"""
-        if not self.client or not self.client.is_socket_open():
-            if not self.connect():
-                return {
-                    'resistance1': 'N/A', 'resistance2': 'N/A',
-                    'status1': 'DISCONNECTED', 'status2': 'DISCONNECTED',
-                    'connected': False
-                }
-        
+        start = time.perf_counter()
         try:
-            # 저항1 읽기 (Slave ID 1)
-            res1 = self.client.read_holding_registers(address=0, count=1, slave=self.slave_id_1)
-            # 저항2 읽기 (Slave ID 2)
-            res2 = self.client.read_holding_registers(address=0, count=1, slave=self.slave_id_2)
-            
-            result = {'connected': True}
-            
-            if not res1.isError():
-                result['resistance1'] = res1.registers[0]
-                result['status1'] = 'OK'
-            else:
-                result['resistance1'] = 'N/A'
-                result['status1'] = 'READ_FAIL'
-            
-            if not res2.isError():
-                result['resistance2'] = res2.registers[0]
-                result['status2'] = 'OK'
-            else:
-                result['resistance2'] = 'N/A'
-                result['status2'] = 'READ_FAIL'
-            
-            print(f"[Resistance] 측정 완료: {result}")
-            return result
-            
+            value1, value2 = self.read_both()
+        except ConnectionError:
+            return {
+                'resistance1': 'N/A', 'resistance2': 'N/A',
+                'status1': 'DISCONNECTED', 'status2': 'DISCONNECTED',
+                'connected': False
+            }
         except Exception as e:
             print(f"[Resistance] 측정 오류: {e}")
             return {
@@ -92,14 +201,340 @@ class ResistanceMeasurer:
                 'status1': 'ERROR', 'status2': 'ERROR',
                 'connected': False
             }
+        self._read_times.append(time.perf_counter() - start)
+        self.measurements += 1
+
+        result = {'connected': True}
+        for index, value in ((1, value1), (2, value2)):
+            if value is not None:
+                result[f'resistance{index}'] = value
+                result[f'status{index}'] = 'OK'
+            else:
+                result[f'resistance{index}'] = 'N/A'
+                result[f'status{index}'] = 'READ_FAIL'
+
+        if log:
+            print(f"[Resistance] 측정 완료: {result}")
+        return result
+
+    def get_stats(self):
+        read_times = list(self._read_times)
+        return {
+            "connected": self.is_connected(),
+            "fast_read": self.fast_read,
+            "measurements": self.measurements,
+            "errors": self.errors,
+            "connect_count": self.connect_count,
+            "reconnects": self.reconnects,
+            "read_mean_ms": round(sum(read_times) / len(read_times) * 1000, 2) if read_times else None,
+        }
+
+
+class SampleRing:
+    """채널 1개의 고정 크기 링 버퍼 (측정값 mΩ + 측정 시각, numpy 배열 미리 할당)"""
+
+    def __init__(self, size):
+        self.size = size
+        self.values = np.zeros(size, dtype=np.float64)
+        self.times = np.zeros(size, dtype=np.float64)
+        self.total = 0  # 지금까지 넣은 샘플 수 (다음 쓰기 위치 = total % size)
+
+    def __len__(self):
+        return min(self.total, self.size)
+
+    def clear(self):
+        self.total = 0
+
+    def push(self, value, timestamp):
+        index = self.total % self.size
+        self.values[index] = value
+        self.times[index] = timestamp
+        self.total += 1
+
+    def latest(self, count=None):
+        """최근 count개 (오래된 것 → 최신 순서, 복사본)"""
+        count = len(self) if count is None else min(count, len(self))
+        end = self.total % self.size
+        indices = np.arange(end - count, end) % self.size
+        return self.values[indices], self.times[indices]
+
+    def window_stats(self, count):
+        """최근 count개 샘플 통계 (샘플이 없으면 None)"""
+        values, times = self.latest(count)
+        if not len(values):
+            return None
+        return {
+            "last": int(values[-1]),
+            "mean": round(float(values.mean()), 1),
+            "median": round(float(np.median(values)), 1),
+            "std": round(float(values.std()), 1),
+            "min": int(values.min()),
+            "max": int(values.max()),
+            "count": len(values),
+            "span_s": round(float(times[-1] - times[0]), 3),
+        }
+
+
+class ResistanceSampler:
+    """
+    저항 연속 측정 서비스 (백그라운드 스레드)
+
+    - rate_hz 주기로 read_both → 채널별 SampleRing에 저장 (읽기 실패 채널은 저장하지 않고 실패 횟수만 증가)
+    - 판정: 샘플마다 최근 window개의 이동 중앙값을 계산하고,
+      최근 debounce개의 이동 중앙값이 모두 임계값을 넘으면 비정상, 모두 이하이면 정상 (그 사이는 이전 판정 유지)
+      → 순간 이상치 1개로는 판정이 바뀌지 않음
+    - 연결 실패가 debounce회 연속이면 비정상 (기존 단발 측정의 "측정기 연결 실패" 판정과 같은 의미)
+    - 판정이 바뀌면 on_judgment(abnormal, stats) 호출 (샘플링 스레드에서 호출됨)
+
+    Args:
+        measurer: ResistanceMeasurer (포트 잠금은 measurer가 관리 → 단발 측정과 함께 사용 가능)
+        rate_hz: 목표 측정 주기 (0이면 가능한 최대 속도, 9600bps 2채널은 약 20Hz가 한계)
+        buffer_size: 채널별 링 버퍼 크기
+        window: 통계/판정에 사용할 최근 샘플 수
+        debounce: 판정 변경에 필요한 연속 이동 중앙값 수
+        threshold_mohm: 비정상 판정 임계값 (mΩ)
+    """
+
+    CHANNELS = (1, 2)
+
+    def __init__(self, measurer, rate_hz=10.0, buffer_size=512, window=16, debounce=3,
+                 threshold_mohm=100000, on_judgment=None):
+        self.measurer = measurer
+        self.rate_hz = rate_hz
+        self.window = window
+        self.debounce = debounce
+        self.threshold_mohm = threshold_mohm
+        self.on_judgment = on_judgment
+        self.rings = {channel: SampleRing(buffer_size) for channel in self.CHANNELS}
+        self._medians = {channel: deque(maxlen=debounce) for channel in self.CHANNELS}
+        self._channel_abnormal = dict.fromkeys(self.CHANNELS, False)
+        self._channel_failures = dict.fromkeys(self.CHANNELS, 0)  # 채널별 연속 읽기 실패 횟수
+        self._lock = threading.Lock()  # 링 버퍼/판정 상태 (샘플링 스레드 ↔ 통계 조회)
+        self._stop_event = threading.Event()
+        self._thread = None
+
+        self.connected = True
+        self.abnormal = False
+        self.samples = 0
+        self.read_failures = 0
+        self.connection_failures = 0  # 연속 연결 실패 횟수
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def configure(self, rate_hz=None, window=None, debounce=None, threshold_mohm=None, buffer_size=None):
+        """설정 변경 (None인 항목은 유지). 임계값/디바운스가 바뀌면 지금까지의 이동 중앙값으로 바로 다시 판정"""
+        with self._lock:
+            if rate_hz is not None:
+                if rate_hz < 0:
+                    raise ValueError(f"rate는 0 이상이어야 합니다: {rate_hz}")
+                self.rate_hz = float(rate_hz)
+            if window is not None:
+                if window < 1:
+                    raise ValueError(f"window는 1 이상이어야 합니다: {window}")
+                self.window = int(window)
+            if buffer_size is not None and buffer_size != self.rings[1].size:
+                if buffer_size < 1:
+                    raise ValueError(f"buffer는 1 이상이어야 합니다: {buffer_size}")
+                self.rings = {channel: SampleRing(int(buffer_size)) for channel in self.CHANNELS}
+            if debounce is not None:
+                if debounce < 1:
+                    raise ValueError(f"debounce는 1 이상이어야 합니다: {debounce}")
+                self.debounce = int(debounce)
+                self._medians = {channel: deque(self._medians[channel], maxlen=self.debounce)
+                                 for channel in self.CHANNELS}
+            if threshold_mohm is not None:
+                self.threshold_mohm = threshold_mohm
+            changed = self._judge()
+        if changed:
+            self._notify()
+
+    def start(self):
+        """연속 측정 시작 (이전 샘플/판정은 초기화)"""
+        if self.is_running():
+            return
+        with self._lock:
+            for channel in self.CHANNELS:
+                self.rings[channel].clear()
+                self._medians[channel].clear()
+                self._channel_abnormal[channel] = False
+                self._channel_failures[channel] = 0
+            self.connected = True
+            self.abnormal = False
+            self.samples = 0
+            self.read_failures = 0
+            self.connection_failures = 0
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="resistance-sampler", daemon=True)
+        self._thread.start()
+        print(f"[Resistance] 연속 측정 시작 ({self.rate_hz}Hz, window={self.window}, debounce={self.debounce})")
+
+    def stop(self, timeout=2.0):
+        """연속 측정 중지 (진행 중인 측정 1회가 끝날 때까지 대기)"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+            print("[Resistance] 연속 측정 중지")
+
+    def _run(self):
+        next_time = time.perf_counter()
+        while not self._stop_event.is_set():
+            try:
+                values = self.measurer.read_both()
+            except ConnectionError:
+                values = None
+            except Exception as e:
+                print(f"[Resistance] 연속 측정 오류: {e}")
+                values = None
+
+            changed = self._add_sample(values, time.perf_counter())
+            if changed:
+                self._notify()
+
+            if values is None:
+                self._stop_event.wait(0.5)  # 연결 실패 → 재연결 시도 간격
+                next_time = time.perf_counter()
+                continue
+            if self.rate_hz > 0:
+                next_time += 1.0 / self.rate_hz
+                wait = next_time - time.perf_counter()
+                if wait > 0:
+                    self._stop_event.wait(wait)
+                else:
+                    next_time = time.perf_counter()  # 통신 속도보다 높은 주기 → 밀린 주기는 버림
+
+    def _add_sample(self, values, timestamp):
+        """샘플 1개 반영 후 판정 변경 여부 반환"""
+        with self._lock:
+            if values is None:
+                self.connection_failures += 1
+                if self.connection_failures >= self.debounce:
+                    self.connected = False
+                return self._judge()
+
+            self.connection_failures = 0
+            self.connected = True
+            self.samples += 1
+            for channel, value in zip(self.CHANNELS, values):
+                if value is None:
+                    self.read_failures += 1
+                    self._channel_failures[channel] += 1
+                    if self._channel_read_fail(channel):
+                        self._medians[channel].clear()  # 복구 후에는 새 이동 중앙값 debounce개로 다시 판정
+                    continue
+                self._channel_failures[channel] = 0
+                ring = self.rings[channel]
+                ring.push(value, timestamp)
+                window_values, _ = ring.latest(self.window)
+                self._medians[channel].append(float(np.median(window_values)))
+            return self._judge()
+
+    def _channel_read_fail(self, channel):
+        """debounce번 연속 읽기 실패한 채널 (잠금 상태에서 호출) → 이동 중앙값이 멈춰 있으므로 비정상"""
+        return self._channel_failures[channel] >= self.debounce
+
+    def _judge(self):
+        """채널별 디바운스 판정 갱신 (잠금 상태에서 호출), 전체 판정이 바뀌면 True"""
+        for channel in self.CHANNELS:
+            if self._channel_read_fail(channel):
+                self._channel_abnormal[channel] = True
+                continue
+            medians = self._medians[channel]
+            if len(medians) < self.debounce:
+                continue
+            if all(median > self.threshold_mohm for median in medians):
+                self._channel_abnormal[channel] = True
+            elif all(median <= self.threshold_mohm for median in medians):
+                self._channel_abnormal[channel] = False
+        abnormal = not self.connected or any(self._channel_abnormal.values())
+        changed = abnormal != self.abnormal
+        self.abnormal = abnormal
+        return changed
+
+    def _notify(self):
+        if self.on_judgment:
+            try:
+                self.on_judgment(self.abnormal, self.get_stats())
+            except Exception as e:
+                print(f"[Resistance] 판정 알림 오류: {e}")
+
+    def get_result(self, threshold_mohm=None):
+        """
+        measure_resistance와 같은 형식의 결과 (값은 이동 중앙값, 판정은 디바운스 판정)
+        연속 읽기 실패 채널은 'N/A'/READ_FAIL, 아직 샘플이 없는 채널이 있으면 None
+        threshold_mohm: 연속 측정 임계값 대신 이 값으로 최근 이동 중앙값을 판정 (연속 측정 설정/판정은 그대로)
+        """
+        with self._lock:
+            local = threshold_mohm is not None and threshold_mohm != self.threshold_mohm
+            result = {'connected': self.connected}
+            for channel in self.CHANNELS:
+                medians = self._medians[channel]
+                if self._channel_read_fail(channel):
+                    result[f'resistance{channel}'] = 'N/A'
+                    result[f'status{channel}'] = 'READ_FAIL'
+                elif not medians:
+                    return None
+                else:
+                    result[f'resistance{channel}'] = int(round(medians[-1]))
+                    result[f'status{channel}'] = 'OK'
+                if local and not self._channel_read_fail(channel):
+                    result[f'abnormal{channel}'] = (len(medians) >= self.debounce
+                                                    and all(median > threshold_mohm for median in medians))
+                else:
+                    result[f'abnormal{channel}'] = self._channel_abnormal[channel]
+            if local:
+                result['abnormal'] = not self.connected or any(result[f'abnormal{channel}'] for channel in self.CHANNELS)
+            else:
+                result['abnormal'] = self.abnormal
+            return result
+
+    def get_stats(self, buffer=0):
+        """
+        연속 측정 상태/통계
+        buffer > 0이면 채널별 최근 buffer개 샘플(시각은 최신 샘플 기준 상대 초)도 포함
+        """
+        with self._lock:
+            channels = {}
+            rates = []
+            for channel in self.CHANNELS:
+                ring = self.rings[channel]
+                stats = ring.window_stats(self.window) or {"count": 0}
+                stats["abnormal"] = self._channel_abnormal[channel]
+                stats["status"] = 'READ_FAIL' if self._channel_read_fail(channel) else 'OK'
+                stats["total"] = ring.total
+                if buffer > 0:
+                    values, times = ring.latest(buffer)
+                    stats["buffer"] = {
+                        "values": values.astype(int).tolist(),
+                        "t": np.round(times - times[-1], 3).tolist() if len(times) else [],
+                    }
+                channels[str(channel)] = stats
+                if len(ring) > 1:
+                    _, times = ring.latest(self.window)
+                    if times[-1] > times[0]:
+                        rates.append((len(times) - 1) / (times[-1] - times[0]))
+
+            return {
+                "running": self.is_running(),
+                "rate_hz": self.rate_hz,
+                "measured_rate_hz": round(min(rates), 1) if rates else None,
+                "window": self.window,
+                "debounce": self.debounce,
+                "buffer_size": self.rings[1].size,
+                "threshold_mohm": self.threshold_mohm,
+                "connected": self.connected,
+                "abnormal": self.abnormal,
+                "samples": self.samples,
+                "read_failures": self.read_failures,
+                "channels": channels,
+            }
 
-# 전역 인스턴스 제거 - 측정 시에만 임시 생성하여 자원 충돌 방지
-# resistance_measurer = ResistanceMeasurer(port="/dev/usb-resistance")
 
 def measure_resistance_once(port="/dev/usb-resistance"):
     """
     저항 측정을 위한 일회성 함수 - 컨텍스트 매니저로 확실한 자원 해제
-    연결 -> 측정 -> 즉시 해제하여 자원 충돌 방지
+    연결 -> 측정 -> 즉시 해제 (ws_server는 상시 연결 ResistanceMeasurer 사용)
     """
     try:
         print("[Resistance] 임시 연결 시작...")
@@ -109,7 +544,7 @@ def measure_resistance_once(port="/dev/usb-resistance"):
             result = measurer.measure_resistance()
             print("[Resistance] 측정 완료, 자동 연결 해제 중...")
             return result
-        
+
     except Exception as e:
         print(f"[Resistance] 측정 중 오류: {e}")
         return {
@@ -117,4 +552,4 @@ def measure_resistance_once(port="/dev/usb-resistance"):
             'status1': 'ERROR', 'status2': 'ERROR',
             'connected': False,
             'error': str(e)
-        }
\ No newline at end of file
+        }
@@ -4,15 +4,18 @@ import json
 import time
 import sys
 import os
-from dual_motor_controller import DualMotorController
-from resistance import measure_resistance_once  # 저항 측정 일회성 함수 import
+from dual_motor_controller import MotionFuture
+from async_dual_motor_controller import AsyncDualMotorController
+from motor_command_queue import lane_from_name
+from device_executors import DeviceExecutor, EventLoopLagMonitor
+from resistance import ResistanceMeasurer, ResistanceSampler  # 저항 측정기 상시 연결 / 연속 측정 서비스
 # EEPROM 함수 import (FT232H 방식)
 from eeprom_ft232h import (
-    write_eeprom_mtr20,
-    read_eeprom_mtr20,
-    write_eeprom_mtr40,
-    read_eeprom_mtr40
+    write_eeprom,
+    read_eeprom,
+    i2c_session
 )
+from eeprom_layout import get_eeprom_layout
 
 
 # DNX64 SDK import (LED 제어용)
@@ -110,10 +113,24 @@ except ImportError as ie:
 except Exception as e:
     print(f"[ERROR] GPIO 초기화 오류: {e}")
 
-motor = DualMotorController()
+motor = AsyncDualMotorController()  # 이벤트 루프에서 직접 시리얼 송수신 (송수신 스레드 없음)
 connected_clients = {}  # 클라이언트별 Lock을 저장하기 위해 dict로 변경
+status_delta_clients = set()  # 변경된 필드만 받는 클라이언트 (status_delta 메시지)
+status_heartbeat_clients = {}  # 클라이언트별 heartbeat 주기 (초, 없으면 STATUS_HEARTBEAT_INTERVAL)
+
+# 상태 푸시 설정: 모터/스타트 상태가 바뀔 때만 전송하고, 변경이 없으면 heartbeat 주기로 전체 상태 전송
+STATUS_CHECK_INTERVAL = 0.005  # 상태 변경 확인 주기 (초)
+STATUS_HEARTBEAT_INTERVAL = 1.0  # 변경이 없어도 전체 상태를 보내는 기본 주기 (초)
 main_event_loop = None  # 메인 이벤트 루프 저장용
 
+# 블로킹 장치 I/O 전용 실행기 (이벤트 루프를 막지 않도록 장치별 스레드 1개에서 순서대로 실행)
+eeprom_executor = DeviceExecutor("eeprom", max_workers=1)  # FT232H I2C 버스 공유 → 동시 1건
+resistance_executor = DeviceExecutor("resistance", max_workers=1)  # Modbus RTU 포트 공유 → 동시 1건
+resistance_measurer = ResistanceMeasurer(port="/dev/usb-resistance")  # 첫 측정 때 연결, 이후 연결 유지 (오류 시 재연결)
+resistance_sampler = ResistanceSampler(resistance_measurer)  # resistance_sampling 명령으로 시작/중지 (판정 변경 알림은 main에서 연결)
+device_tasks = set()  # 실행 중인 장치 명령 태스크 (GC 방지)
+loop_lag_monitor = EventLoopLagMonitor()  # 이벤트 루프 응답성 측정
+
 
 # 프로그램 시작 시 니들팁 상태 확인 함수
 def check_initial_needle_tip_state():
@@ -911,8 +928,278 @@ def handle_judgment_reset():
     # 현재 니들 상태에 따라 LED 재설정
     determine_needle_state(send_status_update=True)
 
+async def _notify_move_complete(websocket, lock, future):
+    """이동 완료 Future를 기다린 뒤 요청한 클라이언트에게 move_complete 메시지 전송"""
+    try:
+        result = await asyncio.wrap_future(future)
+        response = {"type": "move_complete", "result": {"success": True, **result}}
+    except asyncio.CancelledError:
+        if not future.cancelled():
+            raise
+        response = {"type": "move_complete", "result": {
+            "success": False, "motor_id": future.motor_id, "error": "이동 명령이 취소되었습니다."}}
+    except Exception as e:
+        response = {"type": "move_complete", "result": {
+            "success": False, "motor_id": future.motor_id, "error": str(e)}}
+
+    print(f"[INFO] 모터{future.motor_id} 이동 완료 알림: {response['result']}")
+    try:
+        async with lock:
+            await websocket.send(json.dumps(response) + '\n')
+    except Exception as e:
+        print(f"[WARN] 이동 완료 알림 전송 실패: {e}")
+
+def _track_move_completion(websocket, lock, result):
+    """이동 결과가 MotionFuture이면 완료 알림 작업을 등록하고 큐잉 메시지 문자열 반환"""
+    if isinstance(result, MotionFuture):
+        asyncio.create_task(_notify_move_complete(websocket, lock, result))
+        return result.message
+    return result
+
+async def _run_device_command(websocket, lock, command, coro):
+    """장치 명령을 별도 태스크로 처리 - 같은 클라이언트의 다른 명령(모터 이동/정지 등)이 기다리지 않도록 함"""
+    try:
+        await coro
+    except Exception as e:
+        print(f"[ERROR] 장치 명령 처리 중 에러 ({command}): {str(e)}")
+        import traceback
+        print(f"[ERROR] 상세 오류: {traceback.format_exc()}")
+        try:
+            async with lock:
+                await websocket.send(json.dumps({
+                    "type": "error",
+                    "result": str(e)
+                }) + '\n')
+        except websockets.exceptions.ConnectionClosed:
+            pass
+
+def _spawn_device_command(websocket, lock, command, coro):
+    task = asyncio.create_task(_run_device_command(websocket, lock, command, coro))
+    device_tasks.add(task)
+    task.add_done_callback(device_tasks.discard)
+
+async def _handle_eeprom_write(websocket, lock, data):
+    global is_eeprom_failed
+    tip_type = data.get("tipType")
+    shot_count = data.get("shotCount", 0)
+    year = data.get("year")
+    month = data.get("month")
+    day = data.get("day")
+    maker_code = data.get("makerCode")
+    mtr_version = data.get("mtrVersion", "2.0")  # 기본값: MTR 2.0
+    country = data.get("country", "CLASSYS")    # 기본값: CLASSYS
+    inspector_code = data.get("inspectorCode")    # 검사기 코드
+    judge_result = data.get("judgeResult")        # 판정 결과
+    daily_serial = data.get("dailySerial")        # 일일 시리얼
+    write_mode = data.get("writeMode", "full")    # "full": 전체 쓰기 후 전체 읽기, "diff": 바뀐 바이트만 쓰고 검증
+    
+    print(f"[INFO] EEPROM 쓰기 요청: MTR={mtr_version}, 국가={country}, TIP_TYPE={tip_type}, SHOT_COUNT={shot_count}, DATE={year}-{month}-{day}, MAKER={maker_code}, INSPECTOR={inspector_code}, JUDGE={judge_result}, SERIAL={daily_serial}, MODE={write_mode}")
+    
+    # MTR 버전과 국가에 맞는 EEPROM 레이아웃 선택 (eeprom_layout.EEPROM_VARIANTS)
+    layout = get_eeprom_layout(mtr_version, country)
+    
+    if tip_type is None or year is None or month is None or day is None or maker_code is None or layout is None:
+        async with lock:
+            await websocket.send(json.dumps({
+                "type": "error",
+                "result": "필수 데이터가 누락되었습니다." if layout is not None else f"지원하지 않는 MTR 버전입니다: {mtr_version}"
+            }) + '\n')
+    else:
+        values = {
+            "tipType": tip_type,
+            "shotCount": shot_count,
+            "year": year,
+            "month": month,
+            "day": day,
+            "makerCode": maker_code,
+            "inspectorCode": inspector_code,
+            "judgeResult": judge_result,
+            "dailySerial": daily_serial,
+        }
+        result = await eeprom_executor.run(write_eeprom, layout, values, write_mode)
+        
+        if result.get("success") and "data" in result:
+            # diff 모드: 쓴 바이트는 이미 다시 읽어 검증됨 → 전체 읽기 생략
+            print(f"[INFO] EEPROM diff 쓰기 검증 완료 ({result.get('changedBytes')}바이트 변경): {result['data']}")
+            is_eeprom_failed = False
+        # 쓰기 성공 후 바로 읽어서 데이터 포함
+        elif result.get("success"):
+            # 읽기도 동일한 레이아웃으로 수행
+            read_result = await eeprom_executor.run(read_eeprom, layout)
+                
+            if read_result.get("success"):
+                result["data"] = read_result  # 읽은 데이터를 응답에 포함
+                print(f"[INFO] EEPROM 쓰기 후 읽기 성공: {read_result}")
+                is_eeprom_failed = False
+                # LED 제어: EEPROM 저장 완료 시 초록불은 켜지 않음 (PASS 판정 시에만 초록불)
+            else:
+                print(f"[WARN] EEPROM 쓰기 후 읽기 실패: {read_result}")
+                is_eeprom_failed = True
+                # LED 제어: 스타트 상태일 때만 EEPROM 읽기 실패 시 apply_led_state 호출
+                if is_started:
+                    apply_led_state("EEPROM read after write failed")
+                    print("[EEPROM] 읽기 실패 - apply_led_state 호출")
+        else:
+            # LED 제어: 스타트 상태일 때만 EEPROM 저장 실패 시 apply_led_state 호출
+            is_eeprom_failed = True
+            if is_started:
+                apply_led_state("EEPROM write failed")
+                print("[EEPROM] 저장 실패 - apply_led_state 호출")
+        
+        async with lock:
+            await websocket.send(json.dumps({
+                "type": "eeprom_write",
+                "result": result
+            }) + '\n')
+
+async def _handle_eeprom_read(websocket, lock, data):
+    global is_eeprom_failed
+    mtr_version = data.get("mtrVersion", "2.0")  # 기본값: MTR 2.0
+    country = data.get("country", "CLASSYS")    # 기본값: CLASSYS
+    
+    print(f"[INFO] EEPROM 읽기 요청: MTR={mtr_version}, 국가={country}")
+    
+    # MTR 버전과 국가에 맞는 EEPROM 레이아웃 선택
+    layout = get_eeprom_layout(mtr_version, country)
+    if layout is None:
+        result = {"success": False, "error": f"지원하지 않는 MTR 버전입니다: {mtr_version}"}
+    else:
+        result = await eeprom_executor.run(read_eeprom, layout)
+    
+    # LED 제어: EEPROM 읽기 실패 시 apply_led_state 호출
+    if not result.get("success"):
+        is_eeprom_failed = True
+        apply_led_state("EEPROM read failed")
+        print("[EEPROM] 읽기 실패 - apply_led_state 호출")
+    else:
+        is_eeprom_failed = False
+    
+    async with lock:
+        await websocket.send(json.dumps({
+            "type": "eeprom_read",
+            "result": result
+        }) + '\n')
+
+async def _handle_measure_resistance(websocket, lock, data):
+    """
+    저항 측정 (상시 연결 측정기, 연결이 끊겼으면 측정 시 재연결)
+    연속 측정 중이면 새로 읽지 않고 이동 중앙값과 디바운스 판정을 사용
+    """
+    global is_resistance_abnormal
+    print("[MainServer] 저항 측정 요청 수신")
+    
+    # [수정] 프론트엔드에서 받은 임계값(Ohm) 사용, 기본 100 Ohm
+    resistance_threshold_ohm = data.get("threshold", 100)
+    resistance_threshold_mohm = resistance_threshold_ohm * 1000  # mOhm으로 변환
+
+    result = None
+    if resistance_sampler.is_running():
+        # 요청 임계값으로는 결과만 판정 (연속 측정 임계값은 resistance_sampling 명령으로만 변경)
+        result = resistance_sampler.get_result(resistance_threshold_mohm)
+    if result is None:
+        result = await resistance_executor.run(resistance_measurer.measure_resistance)
+    
+    is_abnormal = False
+    
+    if result.get("connected") and "abnormal" in result:
+        # 연속 측정 결과: 디바운스 판정 그대로 사용
+        is_abnormal = result["abnormal"]
+        is_resistance_abnormal = is_abnormal
+        print(f"[DEBUG] 저항 이동 중앙값: R1={result['resistance1']} mΩ, R2={result['resistance2']} mΩ (임계값: {resistance_threshold_mohm} mΩ, 비정상: {is_abnormal})")
+        if is_abnormal and is_started:
+            apply_led_state("resistance abnormal")
+
+    elif result.get("connected"):
+        res1_mohm = result.get("resistance1")
+        res2_mohm = result.get("resistance2")
+
+        print(f"[DEBUG] 저항 측정값: R1={res1_mohm} mΩ, R2={res2_mohm} mΩ (임계값: {resistance_threshold_mohm} mΩ)")
+
+        # 읽기 실패 채널(status != 'OK')은 값을 믿을 수 없으므로 비정상 처리
+        read_failed = False
+        for channel, res_mohm in ((1, res1_mohm), (2, res2_mohm)):
+            if result.get(f"status{channel}") != 'OK':
+                read_failed = True
+                print(f"[LED] 저항 {channel} 읽기 실패 ({result.get(f'status{channel}')})")
+            elif res_mohm > resistance_threshold_mohm:
+                is_abnormal = True
+                print(f"[LED] 저항 {channel} 비정상 감지 ({res_mohm}mΩ > {resistance_threshold_mohm}mΩ)")
+
+        if read_failed:
+            is_abnormal = True
+            is_resistance_abnormal = True
+            if is_started:
+                apply_led_state("resistance meter connection failed")
+                print("[LED] 저항 채널 읽기 실패 - apply_led_state 호출")
+        elif is_abnormal:
+            is_resistance_abnormal = True
+            if is_started:
+                apply_led_state("resistance abnormal")
+                print("[LED] 저항 비정상 - apply_led_state 호출")
+        else:
+            is_resistance_abnormal = False
+            print(f"[LED] 저항 정상 (Threshold: {resistance_threshold_mohm}mΩ)")
+    
+    else:
+        # 저항 측정기 연결 실패
+        is_abnormal = True
+        is_resistance_abnormal = True
+        if is_started:
+            apply_led_state("resistance meter connection failed")
+            print("[LED] 저항 측정기 연결 실패 - apply_led_state 호출")
+    
+    # 결과를 요청한 클라이언트에게 전송
+    response = {
+        "type": "resistance",
+        "data": result
+    }
+    async with lock:
+        await websocket.send(json.dumps(response) + '\n')
+    print(f"[MainServer] 저항 측정 결과 전송 완료 (비정상: {is_abnormal})")
+
+async def _handle_resistance_sampling(websocket, lock, data):
+    """저항 연속 측정 설정 변경 후 시작/중지 (중지는 진행 중인 측정 1회를 기다리므로 저항계 실행기에서 처리)"""
+    threshold = data.get("threshold")
+    resistance_sampler.configure(
+        rate_hz=data.get("rate"),
+        window=data.get("window"),
+        debounce=data.get("debounce"),
+        threshold_mohm=threshold * 1000 if threshold is not None else None,
+        buffer_size=data.get("buffer_size"),
+    )
+    if "enabled" in data:
+        if data["enabled"]:
+            resistance_sampler.start()
+        else:
+            await resistance_executor.run(resistance_sampler.stop)
+    async with lock:
+        await websocket.send(json.dumps({
+            "type": "resistance_sampling",
+            "result": resistance_sampler.get_stats()
+        }) + '\n')
+
+async def _on_resistance_judgment(abnormal, stats):
+    """연속 측정 디바운스 판정 변경 → LED 상태 반영 + 모든 클라이언트에 알림"""
+    global is_resistance_abnormal
+    is_resistance_abnormal = abnormal
+    print(f"[LED] 연속 측정 저항 판정 변경: {'비정상' if abnormal else '정상'}")
+    if is_started:
+        apply_led_state("resistance sampling judgment")
+    message = {"type": "resistance_judgment", "data": {"abnormal": abnormal, "stats": stats}}
+    for ws, lock in connected_clients.copy().items():
+        await _send_state_message(ws, lock, message)
+
+def _on_resistance_judgment_sync(abnormal, stats):
+    """샘플링 스레드에서 호출되는 판정 변경 동기 래퍼 함수"""
+    if main_event_loop:
+        asyncio.run_coroutine_threadsafe(
+            _on_resistance_judgment(abnormal, stats),
+            main_event_loop
+        )
+
 async def handler(websocket):
     global is_started, is_judgment_completed, current_judgment_color, is_needle_short_fixed
+    global is_resistance_abnormal, is_eeprom_failed
 
     print("[INFO] 클라이언트 연결됨")
     connected_clients[websocket] = asyncio.Lock()  # Lock 객체 할당
@@ -941,7 +1228,7 @@ async def handler(websocket):
                     databits = data.get("databits")
                     stopbits = data.get("stopbits")
 
-                    result = motor.connect(port, baudrate, parity, databits, stopbits)
+                    result = await motor.connect(port, baudrate, parity, databits, stopbits)
                     async with lock:
                         await websocket.send(json.dumps({
                             "type": "serial",
@@ -949,7 +1236,7 @@ async def handler(websocket):
                         }) + '\n')
 
                 elif data["cmd"] == "disconnect":
-                    result = motor.disconnect()
+                    result = await motor.disconnect()
                     async with lock:
                         await websocket.send(json.dumps({
                             "type": "serial",
@@ -963,6 +1250,8 @@ async def handler(websocket):
                     needle_speed = data.get("needle_speed")  # 프론트엔드에서 보내는 속도값
                     force = data.get("force")
                     motor_id = data.get("motor_id", 1)  # 기본값은 모터 1
+                    wait_completion = data.get("wait_completion", False)  # True: 목표 도달 시 move_complete 메시지 전송
+                    priority = lane_from_name(data.get("priority"))  # "emergency": 대기 명령을 건너뛰고 즉시 전송
                     
                     # needle_speed가 있으면 speed로 사용하고 mode를 speed로 변경 (모터1, 모터2 통일)
                     if needle_speed is not None:
@@ -989,15 +1278,18 @@ async def handler(websocket):
                                 else:
                                     print(f"[INFO] 모터2 일반 이동 - 목표위치: {position}, 속도: {needle_speed}")
                                 
-                                result = motor.move_with_speed_motor2(
+                                result = await motor.move_with_speed_motor2(
                                     speed=needle_speed, 
                                     position=position,
                                     deceleration_enabled=deceleration_enabled,
                                     deceleration_position=deceleration_position,
-                                    deceleration_speed=deceleration_speed
+                                    deceleration_speed=deceleration_speed,
+                                    return_future=wait_completion,
+                                    priority=priority
                                 )
                             else:
-                                result = motor.move_to_position(position, mode)
+                                result = await motor.move_to_position(position, mode, return_future=wait_completion, priority=priority)
+                            result = _track_move_completion(websocket, lock, result)
                             print(f"[INFO] 모터{motor_id} 이동 결과: {result}")
                             async with lock:
                                 await websocket.send(json.dumps({
@@ -1025,15 +1317,18 @@ async def handler(websocket):
                                 else:
                                     print(f"[INFO] 모터2 일반 이동 (speed 모드) - 목표위치: {position}, 속도: {speed}")
                                 
-                                result = motor.move_with_speed_motor2(
+                                result = await motor.move_with_speed_motor2(
                                     speed=speed, 
                                     position=position,
                                     deceleration_enabled=deceleration_enabled,
                                     deceleration_position=deceleration_position,
-                                    deceleration_speed=deceleration_speed
+                                    deceleration_speed=deceleration_speed,
+                                    return_future=wait_completion,
+                                    priority=priority
                                 )
                             else:
-                                result = motor.move_with_speed(speed, position)
+                                result = await motor.move_with_speed(speed, position, return_future=wait_completion, priority=priority)
+                            result = _track_move_completion(websocket, lock, result)
                             async with lock:
                                 await websocket.send(json.dumps({
                                     "type": "serial",
@@ -1049,9 +1344,10 @@ async def handler(websocket):
                     elif mode == "speed_force":
                         if all(v is not None for v in [force, speed, position]):
                             if motor_id == 2:
-                                result = motor.move_with_speed_force_motor2(force, speed, position)
+                                result = await motor.move_with_speed_force_motor2(force, speed, position, return_future=wait_completion, priority=priority)
                             else:
-                                result = motor.move_with_speed_force(force, speed, position)
+                                result = await motor.move_with_speed_force(force, speed, position, return_future=wait_completion, priority=priority)
+                            result = _track_move_completion(websocket, lock, result)
                             async with lock:
                                 await websocket.send(json.dumps({
                                     "type": "serial",
@@ -1067,9 +1363,9 @@ async def handler(websocket):
                     elif mode == "force":
                         if force is not None:
                             if motor_id == 2:
-                                result = motor.set_force_motor2(force)
+                                result = await motor.set_force_motor2(force)
                             else:
-                                result = motor.set_force(force)
+                                result = await motor.set_force(force)
                             async with lock:
                                 await websocket.send(json.dumps({
                                     "type": "serial",
@@ -1097,6 +1393,65 @@ async def handler(websocket):
                             "result": "연결됨" if connected else "연결 안됨"
                         }) + '\n')
 
+                elif data["cmd"] == "stop":
+                    # 비상 정지: 대기 중인 이동 명령을 버리고 현재 위치 유지 명령을 최우선 전송
+                    motor_id = data.get("motor_id")  # 없으면 모터1, 모터2 모두 정지
+                    if motor_id is None:
+                        result = await motor.stop_all()
+                    else:
+                        result = await motor.stop_motor(motor_id)
+                    print(f"[INFO] 정지 명령 결과: {result}")
+                    async with lock:
+                        await websocket.send(json.dumps({
+                            "type": "serial",
+                            "result": result
+                        }) + '\n')
+
+                elif data["cmd"] == "set_status_push":
+                    # 상태 푸시 설정 (이 클라이언트만): delta=True이면 변경된 필드만 status_delta로 수신
+                    # heartbeat: 변경이 없어도 전체 status를 받는 주기 (초)
+                    heartbeat = data.get("heartbeat")
+                    if heartbeat is not None:
+                        if not isinstance(heartbeat, (int, float)) or isinstance(heartbeat, bool) or heartbeat <= 0:
+                            raise ValueError(f"heartbeat는 0보다 큰 숫자여야 합니다: {heartbeat}")
+                        status_heartbeat_clients[websocket] = float(heartbeat)
+                    if "delta" in data:
+                        if data["delta"]:
+                            status_delta_clients.add(websocket)
+                        else:
+                            status_delta_clients.discard(websocket)
+                    async with lock:
+                        await websocket.send(json.dumps({
+                            "type": "status_push",
+                            "result": {
+                                "heartbeat": status_heartbeat_clients.get(websocket, STATUS_HEARTBEAT_INTERVAL),
+                                "delta": websocket in status_delta_clients
+                            }
+                        }) + '\n')
+
+                elif data["cmd"] == "set_sweep_mode":
+                    # 버스 스윕 모드: 두 모터 상태 읽기를 보정된 최소 간격으로 연달아 전송
+                    motor.set_sweep_mode(data.get("enabled", True))
+                    async with lock:
+                        await websocket.send(json.dumps({
+                            "type": "sweep_mode",
+                            "result": motor.get_sweep_stats()
+                        }) + '\n')
+
+                elif data["cmd"] == "set_poll_rates":
+                    active_hz = data.get("active_hz")
+                    idle_hz = data.get("idle_hz")
+                    motor.set_poll_rates(active_hz=active_hz, idle_hz=idle_hz)
+                    async with lock:
+                        await websocket.send(json.dumps({
+                            "type": "poll_rates",
+                            "result": {
+                                "success": True,
+                                "active_hz": motor.poll_rate_active,
+                                "idle_hz": motor.poll_rate_idle
+                            }
+                        }) + '\n')
+
                 elif data["cmd"] == "gpio_read":
                     if gpio_available and pin5:
                         state_text = "HIGH" if pin5.is_active else "LOW"
@@ -1115,145 +1470,26 @@ async def handler(websocket):
                             }) + '\n')
 
                 elif data["cmd"] == "eeprom_write":
-                    tip_type = data.get("tipType")
-                    shot_count = data.get("shotCount", 0)
-                    year = data.get("year")
-                    month = data.get("month")
-                    day = data.get("day")
-                    maker_code = data.get("makerCode")
-                    mtr_version = data.get("mtrVersion", "2.0")  # 기본값: MTR 2.0
-                    country = data.get("country", "CLASSYS")    # 기본값: CLASSYS
-                    inspector_code = data.get("inspectorCode")    # 검사기 코드
-                    judge_result = data.get("judgeResult")        # 판정 결과
-                    daily_serial = data.get("dailySerial")        # 일일 시리얼
-                    
-                    print(f"[INFO] EEPROM 쓰기 요청: MTR={mtr_version}, 국가={country}, TIP_TYPE={tip_type}, SHOT_COUNT={shot_count}, DATE={year}-{month}-{day}, MAKER={maker_code}, INSPECTOR={inspector_code}, JUDGE={judge_result}, SERIAL={daily_serial}")
-                    
-                    if tip_type is None or year is None or month is None or day is None or maker_code is None:
-                        async with lock:
-                            await websocket.send(json.dumps({
-                                "type": "error",
-                                "result": "필수 데이터가 누락되었습니다."
-                            }) + '\n')
-                    else:
-                        # MTR 버전과 국가에 따라 적절한 함수 선택
-                        if mtr_version == "4.0":
-                            result = write_eeprom_mtr40(tip_type, shot_count, year, month, day, maker_code, inspector_code, judge_result, daily_serial)
-                        else:  # MTR 2.0
-                            result = write_eeprom_mtr20(tip_type, shot_count, year, month, day, maker_code, country, inspector_code, judge_result, daily_serial)
-                        
-                        # 쓰기 성공 후 바로 읽어서 데이터 포함
-                        if result.get("success"):
-                            # 읽기도 동일한 버전/국가 설정으로 수행
-                            if mtr_version == "4.0":
-                                read_result = read_eeprom_mtr40()
-                            else:  # MTR 2.0
-                                read_result = read_eeprom_mtr20(country)
-                                
-                            if read_result.get("success"):
-                                result["data"] = read_result  # 읽은 데이터를 응답에 포함
-                                print(f"[INFO] EEPROM 쓰기 후 읽기 성공: {read_result}")
-                                is_eeprom_failed = False
-                                # LED 제어: EEPROM 저장 완료 시 초록불은 켜지 않음 (PASS 판정 시에만 초록불)
-                            else:
-                                print(f"[WARN] EEPROM 쓰기 후 읽기 실패: {read_result}")
-                                is_eeprom_failed = True
-                                # LED 제어: 스타트 상태일 때만 EEPROM 읽기 실패 시 apply_led_state 호출
-                                if is_started:
-                                    apply_led_state("EEPROM read after write failed")
-                                    print("[EEPROM] 읽기 실패 - apply_led_state 호출")
-                        else:
-                            # LED 제어: 스타트 상태일 때만 EEPROM 저장 실패 시 apply_led_state 호출
-                            is_eeprom_failed = True
-                            if is_started:
-                                apply_led_state("EEPROM write failed")
-                                print("[EEPROM] 저장 실패 - apply_led_state 호출")
-                        
-                        async with lock:
-                            await websocket.send(json.dumps({
-                                "type": "eeprom_write",
-                                "result": result
-                            }) + '\n')
+                    _spawn_device_command(websocket, lock, "eeprom_write", _handle_eeprom_write(websocket, lock, data))
 
                 elif data["cmd"] == "eeprom_read":
-                    mtr_version = data.get("mtrVersion", "2.0")  # 기본값: MTR 2.0
-                    country = data.get("country", "CLASSYS")    # 기본값: CLASSYS
-                    
-                    print(f"[INFO] EEPROM 읽기 요청: MTR={mtr_version}, 국가={country}")
-                    
-                    # MTR 버전과 국가에 따라 적절한 함수 선택
-                    if mtr_version == "4.0":
-                        result = read_eeprom_mtr40()
-                    else:  # MTR 2.0
-                        result = read_eeprom_mtr20(country)
-                    
-                    # LED 제어: EEPROM 읽기 실패 시 apply_led_state 호출
-                    if not result.get("success"):
-                        is_eeprom_failed = True
-                        apply_led_state("EEPROM read failed")
-                        print("[EEPROM] 읽기 실패 - apply_led_state 호출")
-                    else:
-                        is_eeprom_failed = False
-                    
-                    async with lock:
-                        await websocket.send(json.dumps({
-                            "type": "eeprom_read",
-                            "result": result
-                        }) + '\n')
+                    _spawn_device_command(websocket, lock, "eeprom_read", _handle_eeprom_read(websocket, lock, data))
 
-                # 저항 측정 명령 (임시 연결/해제 방식)
+                # 저항 측정 명령 (상시 연결 측정기, 저항계 전용 실행기에서 측정)
                 elif data["cmd"] == "measure_resistance":
-                    print("[MainServer] 저항 측정 요청 수신")
-                    
-                    # 일회성 저항 측정 (연결 -> 측정 -> 즉시 해제)
-                    result = measure_resistance_once(port="/dev/usb-resistance")
-                    
-                    # [수정] 프론트엔드에서 받은 임계값(Ohm) 사용, 기본 100 Ohm
-                    resistance_threshold_ohm = data.get("threshold", 100)
-                    resistance_threshold_mohm = resistance_threshold_ohm * 1000  # mOhm으로 변환
-                    
-                    global is_resistance_abnormal
-                    is_abnormal = False
-                    
-                    if result.get("connected"):
-                        res1_mohm = result.get("resistance1")
-                        res2_mohm = result.get("resistance2")
+                    _spawn_device_command(websocket, lock, "measure_resistance", _handle_measure_resistance(websocket, lock, data))
 
-                        print(f"[DEBUG] 저항 측정값: R1={res1_mohm} mΩ, R2={res2_mohm} mΩ (임계값: {resistance_threshold_mohm} mΩ)")
+                # 저항 연속 측정 시작/중지/설정 (enabled, rate(Hz), threshold(Ohm), window, debounce, buffer_size)
+                elif data["cmd"] == "resistance_sampling":
+                    _spawn_device_command(websocket, lock, "resistance_sampling", _handle_resistance_sampling(websocket, lock, data))
 
-                        if res1_mohm is not None and res1_mohm > resistance_threshold_mohm:
-                            is_abnormal = True
-                            print(f"[LED] 저항 1 비정상 감지 ({res1_mohm}mΩ > {resistance_threshold_mohm}mΩ)")
-                        
-                        if res2_mohm is not None and res2_mohm > resistance_threshold_mohm:
-                            is_abnormal = True
-                            print(f"[LED] 저항 2 비정상 감지 ({res2_mohm}mΩ > {resistance_threshold_mohm}mΩ)")
-
-                        if is_abnormal:
-                            is_resistance_abnormal = True
-                            if is_started:
-                                apply_led_state("resistance abnormal")
-                                print("[LED] 저항 비정상 - apply_led_state 호출")
-                        else:
-                            is_resistance_abnormal = False
-                            print(f"[LED] 저항 정상 (Threshold: {resistance_threshold_mohm}mΩ)")
-                    
-                    else:
-                        # 저항 측정기 연결 실패
-                        is_abnormal = True
-                        is_resistance_abnormal = True
-                        if is_started:
-                            apply_led_state("resistance meter connection failed")
-                            print("[LED] 저항 측정기 연결 실패 - apply_led_state 호출")
-                    
-                    # 결과를 요청한 클라이언트에게 전송
-                    response = {
-                        "type": "resistance",
-                        "data": result
-                    }
+                # 저항 연속 측정 통계 조회 (buffer: 채널별로 함께 받을 최근 샘플 수)
+                elif data["cmd"] == "resistance_stats":
                     async with lock:
-                        await websocket.send(json.dumps(response) + '\n')
-                    print(f"[MainServer] 저항 측정 결과 전송 완료 (비정상: {is_abnormal})")
+                        await websocket.send(json.dumps({
+                            "type": "resistance_stats",
+                            "result": resistance_sampler.get_stats(buffer=int(data.get("buffer", 0)))
+                        }) + '\n')
 
                 # LED 제어 명령
                 elif data["cmd"] == "led_control":
@@ -1339,6 +1575,8 @@ async def handler(websocket):
                     }) + '\n')
     finally:
         connected_clients.pop(websocket, None)
+        status_delta_clients.discard(websocket)
+        status_heartbeat_clients.pop(websocket, None)
         print("[INFO] 클라이언트 연결 해제됨")
         
         # 모든 클라이언트가 연결 해제되면 LED 끄기
@@ -1346,36 +1584,77 @@ async def handler(websocket):
             print("[INFO] 모든 클라이언트 연결 해제 - 모든 LED OFF")
             set_all_leds_off()
 
+def _collect_status_fields(motor2_status):
+    """변경 감지 대상 상태 필드 (값이 바뀌면 즉시 푸시)"""
+    return {
+        # Motor 1 상태 (기존 호환성)
+        "position": motor.position,
+        "force": motor.force,
+        "sensor": motor.sensor,
+        "setPos": motor.setPos,
+        # Motor 2 상태 추가
+        "motor2_position": motor2_status["position"],
+        "motor2_force": motor2_status["force"],
+        "motor2_sensor": motor2_status["sensor"],
+        "motor2_setPos": motor2_status["setPos"],
+        # 명령어 큐 상태 (디버깅용)
+        "command_queue_size": motor.get_queue_size(),
+        # 니들팁 연결 상태 (GPIO11 기반)
+        "needle_tip_connected": needle_tip_connected,
+        # 스타트 상태 (판정 버튼 활성화 여부)
+        "is_started": is_started,
+    }
+
+def _collect_status_diagnostics():
+    """진단용 통계 필드 (매번 조금씩 바뀌므로 변경 감지에서 제외하고 전체 status에만 포함)"""
+    poll_rates = motor.get_poll_rates()
+    transaction_stats = motor.get_transaction_stats()
+    return {
+        # 우선순위 레인별 대기 깊이/대기 시간 (ms)
+        "command_queue_lanes": motor.get_queue_stats(),
+        # 모터별 실제 상태 읽기 주기 (Hz, 적응형 폴링)
+        "motor1_poll_hz": poll_rates[1],
+        "motor2_poll_hz": poll_rates[2],
+        # 모터별 상태 읽기 요청/응답 왕복 시간 (ms)
+        "motor1_rtt_ms": transaction_stats[1]["rtt_mean_ms"],
+        "motor2_rtt_ms": transaction_stats[2]["rtt_mean_ms"],
+        # 버스 스윕 주기 및 통신 속도 한계 대비 효율
+        "bus_sweep": motor.get_sweep_stats(),
+        # 이벤트 루프 지연 (ms) - 블로킹 호출이 루프에서 실행되면 증가
+        "event_loop_lag": loop_lag_monitor.get_stats(),
+        # 장치별 실행기 대기/실행 시간 (ms)
+        "device_executors": {
+            "eeprom": eeprom_executor.get_stats(),
+            "resistance": resistance_executor.get_stats(),
+        },
+        # FT232H I2C 세션 (configure 횟수/재연결/상태 확인)
+        "eeprom_session": i2c_session.get_stats(),
+        # 저항 측정기 연결 (측정 횟수/재연결/측정 시간)
+        "resistance_meter": resistance_measurer.get_stats(),
+        # 저항 연속 측정 (주기/판정/채널별 이동 통계)
+        "resistance_sampling": resistance_sampler.get_stats(),
+    }
+
 async def push_motor_status():
     """
     모터 상태를 지속적으로 읽고 WebSocket으로 전송하는 메인 루프
+    - 상태 필드가 바뀌었거나 클라이언트별 heartbeat 주기가 되었을 때만 전송 (새 클라이언트는 연결 직후 첫 틱에 전체 status)
+    - 메시지는 틱마다 한 번만 직렬화해서 모든 클라이언트에 같은 문자열 전송
+      (전체 status 1개 + delta 클라이언트용 status_delta 1개)
     예외 발생 시에도 루프가 중단되지 않도록 예외 처리 강화
     """
     consecutive_errors = 0
     max_consecutive_errors = 10  # 연속 10번 오류 시 복구 대기
-    thread_check_counter = 0
-    thread_check_interval = 50  # 5초마다 스레드 상태 확인 (100ms * 50)
+    last_fields = None  # 마지막으로 전송한 상태 필드
+    last_full_push = {}  # 클라이언트별 마지막 전체 status 전송 시각 (perf_counter, 없으면 아직 못 받은 새 클라이언트)
     
     while True:
         try:
-            # 주기적으로 모터 스레드 상태 확인
-            thread_check_counter += 1
-            if thread_check_counter >= thread_check_interval:
-                thread_check_counter = 0
-                if motor and motor.is_connected():
-                    is_stuck, stuck_threads = motor.check_thread_health()
-                    if is_stuck:
-                        print(f"[SERVER_MONITOR] 모터 스레드 stuck 감지: {stuck_threads}")
-                        print("[SERVER_MONITOR] 모터 스레드 강제 복구 시도...")
-                        recovery_success = motor.force_recovery()
-                        if recovery_success:
-                            print("[SERVER_MONITOR] 모터 스레드 복구 성공")
-                        else:
-                            print("[SERVER_MONITOR] 모터 스레드 복구 실패")
-            await asyncio.sleep(0.005)
+            await asyncio.sleep(STATUS_CHECK_INTERVAL)
             
             if not motor.is_connected():
-                # 모터가 연결되지 않은 경우 대기
+                # 모터가 연결되지 않은 경우 대기 (재연결 시 전체 상태부터 전송)
+                last_fields = None
                 await asyncio.sleep(0.1)
                 continue
             
@@ -1384,60 +1663,79 @@ async def push_motor_status():
             
             # 모터 상태 읽기 (예외 처리 추가)
             try:
-                motor2_status = motor.get_motor2_status()
+                motor2_status = await motor.get_motor2_status()
             except Exception as e:
                 print(f"[ERROR] 모터 2 상태 읽기 실패: {e}")
                 motor2_status = {"position": 0, "force": 0, "sensor": 0, "setPos": 0}
             
             try:
-                data = {
-                    "type": "status",
-                    "data": {
-                        # Motor 1 상태 (기존 호환성)
-                        "position": motor.position,
-                        "force": motor.force,
-                        "sensor": motor.sensor,
-                        "setPos": motor.setPos,
-                        # Motor 2 상태 추가
-                        "motor2_position": motor2_status["position"],
-                        "motor2_force": motor2_status["force"],
-                        "motor2_sensor": motor2_status["sensor"],
-                        "motor2_setPos": motor2_status["setPos"],
-                        # 명령어 큐 상태 (디버깅용)
-                        "command_queue_size": motor.get_queue_size(),
-                        # 니들팁 연결 상태 (GPIO11 기반)
-                        "needle_tip_connected": needle_tip_connected,
-                        # 스타트 상태 (판정 버튼 활성화 여부)
-                        "is_started": is_started,
-                    }
-                }
+                fields = _collect_status_fields(motor2_status)
             except Exception as e:
                 print(f"[ERROR] 상태 데이터 생성 실패: {e}")
                 continue
 
+            now = time.perf_counter()
+            reconnected = last_fields is None  # 모터 (재)연결 직후 → 모든 클라이언트에 전체 상태
+            if reconnected:
+                changed = fields
+            else:
+                changed = {key: value for key, value in fields.items() if last_fields.get(key) != value}
+            last_fields = fields
+
+            for ws in [ws for ws in last_full_push if ws not in connected_clients]:
+                del last_full_push[ws]
+
+            # 클라이언트별 메시지 종류: 새 클라이언트(아직 전체 status를 못 받음)/heartbeat 주기 → 전체 status,
+            # 변경 → delta 클라이언트는 status_delta, 나머지는 전체 status
+            targets = []
+            for ws, lock in list(connected_clients.items()):
+                heartbeat = status_heartbeat_clients.get(ws, STATUS_HEARTBEAT_INTERVAL)
+                if reconnected or ws not in last_full_push or now - last_full_push[ws] >= heartbeat:
+                    targets.append((ws, lock, "full"))
+                elif changed:
+                    targets.append((ws, lock, "delta" if ws in status_delta_clients else "full"))
+            if not targets:
+                continue
+
+            # 직렬화는 틱당 한 번 (필요한 메시지 종류만)
+            messages = {}
+            if any(kind == "full" for _, _, kind in targets):
+                try:
+                    messages["full"] = json.dumps({
+                        "type": "status",
+                        "data": {**fields, **_collect_status_diagnostics()}
+                    }) + '\n'
+                except Exception as e:
+                    print(f"[ERROR] 상태 데이터 생성 실패: {e}")
+                    continue
+            if any(kind == "delta" for _, _, kind in targets):
+                messages["delta"] = json.dumps({"type": "status_delta", "data": changed}) + '\n'
+
             # WebSocket 클라이언트에게 상태 전송
-            if connected_clients:
-                disconnected_clients = []
-                for ws, lock in connected_clients.copy().items():
-                    try:
-                        message = json.dumps(data) + '\n'
-                        async with lock:
-                            await ws.send(message)
-                    except websockets.exceptions.ConnectionClosed:
-                        print(f"[INFO] 클라이언트 연결 종료 감지")
-                        disconnected_clients.append(ws)
-                    except Exception as e:
-                        print(f"[WARN] 상태 전송 실패: {e}")
-                        disconnected_clients.append(ws)
-                
-                # 연결이 끈어진 클라이언트 제거
-                for ws in disconnected_clients:
-                    connected_clients.pop(ws, None)
-                
-                # 모든 클라이언트가 연결 해제되면 LED 끄기
-                if disconnected_clients and not connected_clients:
-                    print("[INFO] 모든 클라이언트 연결 해제 - 모든 LED OFF")
-                    set_all_leds_off()
+            disconnected_clients = []
+            for ws, lock, kind in targets:
+                try:
+                    async with lock:
+                        await ws.send(messages[kind])
+                    if kind == "full":
+                        last_full_push[ws] = now
+                except websockets.exceptions.ConnectionClosed:
+                    print(f"[INFO] 클라이언트 연결 종료 감지")
+                    disconnected_clients.append(ws)
+                except Exception as e:
+                    print(f"[WARN] 상태 전송 실패: {e}")
+                    disconnected_clients.append(ws)
+            
+            # 연결이 끈어진 클라이언트 제거
+            for ws in disconnected_clients:
+                connected_clients.pop(ws, None)
+                status_delta_clients.discard(ws)
+                status_heartbeat_clients.pop(ws, None)
+            
+            # 모든 클라이언트가 연결 해제되면 LED 끄기
+            if disconnected_clients and not connected_clients:
+                print("[INFO] 모든 클라이언트 연결 해제 - 모든 LED OFF")
+                set_all_leds_off()
             
             # 연속 오류 카운터 초기화
             consecutive_errors = 0
@@ -1483,6 +1781,12 @@ async def main():
     global main_event_loop  # 전역 변수 선언
     main_event_loop = asyncio.get_running_loop()  # 현재 루프를 캡처
     
+    # 이벤트 루프 지연 측정 시작
+    loop_lag_monitor.start()
+
+    # 저항 연속 측정 판정 변경 알림 (샘플링 스레드 → 메인 루프)
+    resistance_sampler.on_judgment = _on_resistance_judgment_sync
+
     # 모터 상태 푸시 비동기 작업 시작
     asyncio.create_task(push_motor_status())
     
@@ -1500,7 +1804,9 @@ if __name__ == "__main__":
         print(f"\n[INFO] 시그널 {signum} 수신 - 프로그램 종료 중...")
         cleanup_gpio()
         if motor:
-            motor.disconnect()
+            motor.close()
+        resistance_sampler.stop()
+        resistance_measurer.disconnect()
         sys.exit(0)
     
     # 시그널 핸들러 등록
@@ -1514,4 +1820,6 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"\n[ERROR] 예상치 못한 오류: {e}")
     finally:
-        cleanup_gpio()
\ No newline at end of file
+        cleanup_gpio()
+        resistance_sampler.stop()
+        resistance_measurer.disconnect()
\ No newline at end of file
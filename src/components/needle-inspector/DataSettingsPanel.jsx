@@ -1084,13 +1084,14 @@ const DataSettingsPanel = forwardRef(({
     }
     
     // 모터1, 모터2 모두 DOWN 명령 전송 (초기 위치로) (메인 WebSocket 사용)
+    // priority: emergency → 백엔드 큐에 대기 중인 이동 명령을 건너뛰고 즉시 전송
     if (websocket && isWsConnected) {
       const motor1DownPosition = Math.round(needleOffset1 * 125);
       const motor2DownPosition = Math.round(needleOffset2 * 40);
       console.log('모터1 DOWN 명령 전송 (스피드 모드) - 위치:', motor1DownPosition, '(초기 위치:', needleOffset1, '), 속도:', needleSpeed1)
-      websocket.send(JSON.stringify({ cmd: "move", position: motor1DownPosition, needle_speed: needleSpeed1, motor_id: 1 }))
+      websocket.send(JSON.stringify({ cmd: "move", position: motor1DownPosition, needle_speed: needleSpeed1, motor_id: 1, priority: "emergency" }))
       console.log('모터2 DOWN 명령 전송 - 위치:', motor2DownPosition, '(초기 위치:', needleOffset2, '), 속도:', needleSpeed2)
-      websocket.send(JSON.stringify({ cmd: "move", position: motor2DownPosition, needle_speed: needleSpeed2, motor_id: 2 }))
+      websocket.send(JSON.stringify({ cmd: "move", position: motor2DownPosition, needle_speed: needleSpeed2, motor_id: 2, priority: "emergency" }))
     } else {
       console.error('WebSocket 연결되지 않음 - 모터 DOWN 명령 실패')
     }
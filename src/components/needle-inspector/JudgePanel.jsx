@@ -335,7 +335,8 @@ const JudgePanel = forwardRef(function JudgePanel({ onJudge, isStarted, onReset,
         country: dataSettings.selectedCountry,
         inspectorCode: dataSettings.inspector || 'A',
         judgeResult: judgeResult,
-        dailySerial: currentSerial
+        dailySerial: currentSerial,
+        writeMode: "diff" // 이미 기록된 팁에 판정/시리얼만 다시 찍는 경우가 대부분 → 바뀐 바이트만 쓰고 검증
       };
 
       console.log('📝 EEPROM 쓰기 (판정 데이터 포함):', eepromWriteData);